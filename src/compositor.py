@@ -0,0 +1,61 @@
+import pygame
+
+class Compositor:
+    """Compositeur à rectangles sales : ne redessine et ne présente que les zones modifiées"""
+
+    def __init__(self, screen_rect):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.elements = {}  # {clé: (rect, état)} tels que dessinés à la dernière frame
+        self.dirty_rects = []
+        self.full_redraw = True
+        self._seen = set()
+
+    def begin_frame(self):
+        """Commence le suivi des éléments d'une nouvelle frame"""
+        self._seen = set()
+
+    def track(self, key, rect, state=None):
+        """Enregistre un élément ; ses anciennes et nouvelles bornes sont salies s'il a changé"""
+        rect = pygame.Rect(rect)
+        self._seen.add(key)
+        previous = self.elements.get(key)
+        if previous is None:
+            self.mark_dirty(rect)
+        elif previous != (rect, state):
+            self.mark_dirty(previous[0])
+            self.mark_dirty(rect)
+        self.elements[key] = (rect, state)
+
+    def end_tracking(self):
+        """Salit la zone des éléments qui ont disparu depuis la dernière frame"""
+        for key in list(self.elements):
+            if key not in self._seen:
+                rect, _ = self.elements.pop(key)
+                self.mark_dirty(rect)
+
+    def mark_dirty(self, rect):
+        """Marque une zone de l'écran comme devant être redessinée"""
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if rect.width and rect.height:
+            self.dirty_rects.append(rect)
+
+    def mark_all(self):
+        """Force le redessin complet de l'écran à la prochaine frame"""
+        self.full_redraw = True
+
+    def collect(self):
+        """Retourne les zones à redessiner (fusionnées) et réinitialise la liste"""
+        if self.full_redraw:
+            regions = [self.screen_rect.copy()]
+        else:
+            regions = []
+            for rect in self.dirty_rects:
+                rect = rect.copy()
+                index = rect.collidelist(regions)
+                while index != -1:
+                    rect.union_ip(regions.pop(index))
+                    index = rect.collidelist(regions)
+                regions.append(rect)
+        self.dirty_rects = []
+        self.full_redraw = False
+        return regions
@@ -17,11 +17,25 @@ for directory in [ASSETS_DIR, DATA_DIR, SAVE_DIR, FONTS_DIR, SOUNDS_DIR, MUSIC_D
 # Configuration générale
 GAME_VERSION = "0.1.0"
 DEBUG_MODE = False
+LOG_MAX_BYTES = 1024 * 1024  # Taille de logs/game.log avant rotation
+LOG_BACKUP_COUNT = 3  # Anciens fichiers de log conservés (game.log.1, .2, ...)
+TRACE_CATEGORIES = ()  # Catégories de trace actives au démarrage ("mission", "terminal"... ; toutes si DEBUG_MODE)
+TRACE_BUFFER_LINES = 500  # Lignes de trace gardées en mémoire (commande 'trace dump')
 
 # Configuration de l'affichage
 WINDOW_WIDTH = 1024
 WINDOW_HEIGHT = 768
 FPS = 60
+IDLE_FPS = 10  # Cadence au repos (suffisante pour le curseur et l'effet glitch)
+IDLE_DELAY = 1.0  # Secondes sans entrée avant de passer en cadence réduite
+SIMULATION_HZ = 10  # Fréquence de la logique des missions, indépendante du rendu
+MAX_SIMULATION_STEPS = 5  # Pas de rattrapage maximum par frame
+SAVE_FORMAT = "binary"  # "binary" (sections à chargement différé) ou "json" (lisible, pour le débogage)
+SAVE_JOURNAL_COMPACT_RECORDS = 200  # Modifications journalisées avant réécriture complète de la sauvegarde
+LOOT_HISTORY_SIZE = 100  # Dernières données volées conservées en détail (les totaux restent exacts)
+NETWORK_BASE_ADDRESS = "10.0.0.0"  # Premier sous-réseau /24 des missions en mode grand réseau
+NETWORK_MAX_LOADED_SUBNETS = 32  # Sous-réseaux gardés en mémoire (les autres sont régénérés à la demande)
+SCAN_HOSTS_PER_STEP = 16  # Hôtes affichés par pas de simulation lors d'un scan de sous-réseau
 
 # Couleurs
 COLORS = {
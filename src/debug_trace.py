@@ -0,0 +1,85 @@
+import time
+from collections import deque
+from config import DEBUG_MODE, TRACE_BUFFER_LINES, TRACE_CATEGORIES
+
+def _noop(message, *args):
+    pass
+
+class TraceChannel:
+    """Canal de trace d'une catégorie.
+
+    emit est remplacé par une fonction vide lorsque le canal est désactivé : un
+    appel ne coûte alors qu'un appel de fonction, le message n'est pas formaté.
+    Tester le canal (if channel:) évite aussi de calculer des arguments coûteux.
+    """
+
+    __slots__ = ("category", "tracer", "enabled", "emit")
+
+    def __init__(self, tracer, category, enabled=False):
+        self.category = category
+        self.tracer = tracer
+        self.set_enabled(enabled)
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self.emit = self._record if enabled else _noop
+
+    def _record(self, message, *args):
+        self.tracer.record(self.category, message % args if args else message)
+
+    def __bool__(self):
+        return self.enabled
+
+class Tracer:
+    """Trace de débogage par catégorie, conservée dans un tampon circulaire en mémoire"""
+
+    def __init__(self, max_lines=TRACE_BUFFER_LINES, enabled=()):
+        self.lines = deque(maxlen=max_lines)  # [(horodatage, catégorie, message)]
+        self.channels = {}
+        self.enable_all = "*" in enabled
+        self.default_enabled = set(enabled)
+
+    def channel(self, category):
+        """Canal d'une catégorie (créé au premier appel, partagé ensuite)"""
+        channel = self.channels.get(category)
+        if channel is None:
+            enabled = self.enable_all or category in self.default_enabled
+            channel = self.channels[category] = TraceChannel(self, category, enabled)
+        return channel
+
+    def record(self, category, message):
+        self.lines.append((time.time(), category, message))
+
+    def set_enabled(self, category, enabled):
+        """Active ou désactive une catégorie ("*" pour toutes)"""
+        if category == "*":
+            self.enable_all = enabled
+            self.default_enabled.clear()
+            for channel in self.channels.values():
+                channel.set_enabled(enabled)
+            return
+        if enabled:
+            self.default_enabled.add(category)
+        else:
+            self.default_enabled.discard(category)
+        self.channel(category).set_enabled(enabled)
+
+    def dump(self, count=None, category=None):
+        """Dernières lignes de trace formatées, les plus anciennes en premier"""
+        lines = [line for line in self.lines if category is None or line[1] == category]
+        if count is not None:
+            lines = lines[-count:] if count > 0 else []
+        return [
+            f"{time.strftime('%H:%M:%S', time.localtime(timestamp))} [{line_category}] {message}"
+            for timestamp, line_category, message in lines
+        ]
+
+_tracer = Tracer(enabled=("*",) if DEBUG_MODE else TRACE_CATEGORIES)
+
+def get_tracer():
+    """Retourne le traceur partagé"""
+    return _tracer
+
+def get_channel(category):
+    """Raccourci pour get_tracer().channel(category)"""
+    return _tracer.channel(category)
@@ -4,6 +4,11 @@ from config import COLORS
 from icons import ICON_CREATORS
 from sound_manager import SoundManager
 from notification import Notification
+from compositor import Compositor
+from fonts import get_font
+from profiler import get_profiler
+from frame_scheduler import FrameScheduler
+from ui_constants import DEFAULT_FONT_SIZE
 from gameplay import Terminal
 from missions import Mission, MissionType, Faction
 from logger import setup_logger
@@ -23,6 +28,8 @@ class Desktop:
         self.width = screen_width
         self.height = screen_height
         self.screen = pygame.display.set_mode((screen_width, screen_height))
+        self.compositor = Compositor(self.screen.get_rect())
+        self.profiler = get_profiler()
         self.logger = setup_logger()
         
         # Initialisation des attributs de base
@@ -49,7 +56,7 @@ class Desktop:
         try:
             pygame.display.set_caption("CyberHack OS")
             self.sound_manager = SoundManager()
-            self.font = pygame.font.Font(None, 24)
+            self.font = get_font(DEFAULT_FONT_SIZE)
             self.taskbar_height = 40
             self.taskbar_button_width = 150
             self.init_icons()
@@ -65,43 +72,104 @@ class Desktop:
         surface.blit(text, (25, 20))
         return surface
 
-    def draw(self):
-        # Fond d'écran - effacer tout l'écran
-        self.screen.fill(COLORS["BLACK"])
+    def build_background(self):
+        """Pré-rend le fond statique du bureau (fond, icônes, libellés, barre des tâches vide)"""
+        background = pygame.Surface(self.screen.get_size())
+        background.fill(COLORS["BLACK"])
         
-        # Dessiner les icônes
         for name, icon in self.icons.items():
             if icon.active:
-                self.screen.blit(icon.image, (icon.x, icon.y))
+                background.blit(icon.image, (icon.x, icon.y))
                 text = self.font.render(name, True, COLORS["GREEN"])
-                self.screen.blit(text, (icon.x, icon.y + icon.height + 5))
+                background.blit(text, (icon.x, icon.y + icon.height + 5))
+        
+        pygame.draw.rect(background, COLORS["DARK_GRAY"], self.get_taskbar_rect())
+        
+        self.background = background.convert()
+        self.compositor.mark_all()
+
+    def draw(self):
+        """Redessine uniquement les zones modifiées depuis la dernière frame"""
+        # Régénérer le fond si la taille de l'écran a changé
+        if self.background.get_size() != self.screen.get_size():
+            self.width, self.height = self.screen.get_size()
+            self.compositor.screen_rect = self.screen.get_rect()
+            self.build_background()
+        
+        # Les notifications expirées disparaissent (leur zone sera salie par le compositeur)
+        self.notifications = [notif for notif in self.notifications if not notif.is_expired()]
+        visible_windows = [window for window in sorted(self.windows, key=lambda w: w == self.active_window)
+                           if window.active and not window.minimized]
         
-        # Dessiner la barre des tâches
-        pygame.draw.rect(self.screen, COLORS["DARK_GRAY"], 
-                        (0, self.height - self.taskbar_height, 
-                         self.width, self.taskbar_height))
+        # Suivre l'état de chaque élément pour déterminer les zones sales
+        self.compositor.begin_frame()
+        for depth, window in enumerate(visible_windows):
+            rect = (window.x, window.y, window.width, window.height)
+            self.compositor.track(("window", id(window)), rect,
+                                  (depth, window == self.active_window, window.title))
+            if window.is_dirty():
+                self.compositor.mark_dirty(rect)
+        self.compositor.track("taskbar", self.get_taskbar_rect(),
+                              tuple((window.title[:15], window == self.active_window)
+                                    for window in self.windows if window.active))
+        for notif in self.notifications:
+            # Le fondu modifie la notification à chaque frame
+            rect = notif.get_rect(self.width)
+            self.compositor.track(("notification", id(notif)), rect)
+            self.compositor.mark_dirty(rect)
+        if self.profiler.enabled:
+            self.compositor.mark_dirty(self.profiler.overlay_rect(self.width))
+        self.compositor.end_tracking()
         
-        # Dessiner uniquement les fenêtres actives
-        for window in sorted(self.windows, key=lambda w: w == self.active_window):
-            if window.active and not window.minimized:  # Vérifier si la fenêtre est active et non minimisée
+        regions = self.compositor.collect()
+        if not regions:
+            return
+        
+        for region in regions:
+            self.screen.set_clip(region)
+            self.draw_region(region, visible_windows)
+        self.screen.set_clip(None)
+        
+        # Surimpression du profileur, dessinée une seule fois par-dessus la scène (sa zone est marquée sale)
+        self.profiler.draw(self.screen)
+        
+        for window in visible_windows:
+            window.dirty = False
+        
+        with self.profiler.phase("flip"):
+            pygame.display.update(regions)
+
+    def draw_region(self, region, visible_windows):
+        """Dessine la scène complète limitée à une zone de l'écran"""
+        # Fond pré-rendu : fond d'écran, icônes et barre des tâches vide
+        self.screen.blit(self.background, region, region)
+        taskbar_rect = self.get_taskbar_rect()
+        
+        # Dessiner uniquement les fenêtres touchées par la zone
+        for window in visible_windows:
+            if region.colliderect((window.x, window.y, window.width, window.height)):
                 window.draw(self.screen)
         
         # Dessiner les boutons de la barre des tâches pour les fenêtres actives
-        x = 5
-        for window in self.windows:
-            if window.active:  # Afficher un bouton même si la fenêtre est minimisée
-                color = COLORS["GREEN"] if window == self.active_window else COLORS["DARK_GREEN"]
-                pygame.draw.rect(self.screen, color,
-                               (x, self.height - self.taskbar_height + 5,
-                                self.taskbar_button_width, self.taskbar_height - 10))
-                text = self.font.render(window.title[:15], True, COLORS["BLACK"])
-                self.screen.blit(text, (x + 5, self.height - self.taskbar_height + 10))
-                x += self.taskbar_button_width + 5
+        if region.colliderect(taskbar_rect):
+            x = 5
+            for window in self.windows:
+                if window.active:  # Afficher un bouton même si la fenêtre est minimisée
+                    color = COLORS["GREEN"] if window == self.active_window else COLORS["DARK_GREEN"]
+                    pygame.draw.rect(self.screen, color,
+                                   (x, self.height - self.taskbar_height + 5,
+                                    self.taskbar_button_width, self.taskbar_height - 10))
+                    text = self.font.render(window.title[:15], True, COLORS["BLACK"])
+                    self.screen.blit(text, (x + 5, self.height - self.taskbar_height + 10))
+                    x += self.taskbar_button_width + 5
         
         # Dessiner les notifications actives
-        self.notifications = [notif for notif in self.notifications if notif.draw(self.screen)]
-        
-        pygame.display.flip()
+        for notif in self.notifications:
+            notif.draw(self.screen)
+
+    def get_taskbar_rect(self):
+        """Retourne la zone de la barre des tâches"""
+        return pygame.Rect(0, self.height - self.taskbar_height, self.width, self.taskbar_height)
 
     def handle_click(self, pos):
         x, y = pos
@@ -219,9 +287,14 @@ class Desktop:
                 return False
             elif event.type == pygame.MOUSEWHEEL:
                 if self.active_window:
+                    self.active_window.dirty = True
                     return self.active_window.handle_mousewheel(event.y)
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                return self.handle_click(event.pos)
+                handled = self.handle_click(event.pos)
+                # La fenêtre cliquée a pu changer de sélection ou de contenu
+                if self.active_window:
+                    self.active_window.dirty = True
+                return handled
             elif event.type == pygame.MOUSEBUTTONUP:
                 # Arrêter le déplacement des fenêtres
                 for window in self.windows:
@@ -238,6 +311,8 @@ class Desktop:
                         window.x = max(0, min(window.x, self.width - window.width))
                         window.y = max(0, min(window.y, self.height - window.height))
             elif event.type == pygame.KEYDOWN:
+                if self.active_window:
+                    self.active_window.dirty = True
                 return self.handle_keypress(event)
                 
             return True
@@ -272,7 +347,9 @@ class Desktop:
                     raise KeyError(f"Créateur d'icône non trouvé pour {name}")
             except Exception as e:
                 self.logger.error(f"Erreur chargement icône {name}: {str(e)}")
-                icon.image = self.create_default_icon(name) 
+                icon.image = self.create_default_icon(name)
+        
+        self.build_background()
 
     def handle_keypress(self, event):
         """Gère les événements clavier"""
@@ -300,43 +377,59 @@ class Desktop:
             
             # Boucle de jeu de la mission
             running = True
-            clock = pygame.time.Clock()
+            scheduler = FrameScheduler()
             
             while running:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        running = False
-                    elif event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
+                self.profiler.begin_frame()
+                with self.profiler.phase("events"):
+                    events = pygame.event.get()
+                    scheduler.notify_events(events)
+                    for event in events:
+                        if event.type == pygame.QUIT:
                             running = False
+                        elif event.type == pygame.KEYDOWN:
+                            if event.key == pygame.K_ESCAPE:
+                                running = False
                 
                 # Mettre à jour et afficher la mission
                 mission_game.afficher()
-                pygame.display.flip()
-                clock.tick(60)
+                self.profiler.draw(self.screen)
+                with self.profiler.phase("flip"):
+                    pygame.display.flip()
+                self.profiler.end_frame()
+                # Timers de mission proches (rançon, fin de mission) ou scan en cours : pas de cadence réduite
+                scheduler.tick(busy=mission_game.is_busy(1 / scheduler.idle_fps))
             
-            # Retour au bureau après la mission
+            # Retour au bureau après la mission : l'écran a été entièrement recouvert
+            self.compositor.mark_all()
             self.show_notification("Mission terminée", "success")
             
         except Exception as e:
             self.logger.error(f"Erreur lors du lancement de la mission: {e}")
+            self.compositor.mark_all()
             self.show_notification("Erreur lors du lancement de la mission", "error") 
 
     def run(self):
         """Lance la boucle principale du bureau"""
         running = True
-        clock = pygame.time.Clock()
+        scheduler = FrameScheduler()
         
         try:
             while running:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        running = False
-                    else:
-                        running = self.handle_event(event)
+                self.profiler.begin_frame()
+                with self.profiler.phase("events"):
+                    events = pygame.event.get()
+                    scheduler.notify_events(events)
+                    for event in events:
+                        if event.type == pygame.QUIT:
+                            running = False
+                        else:
+                            running = self.handle_event(event)
                 
-                self.draw()
-                clock.tick(60)
+                with self.profiler.phase("desktop_draw"):
+                    self.draw()
+                self.profiler.end_frame()
+                scheduler.tick(busy=self.is_animating())
                 
             return True
             
@@ -344,6 +437,10 @@ class Desktop:
             self.logger.error(f"Erreur dans la boucle du bureau: {e}")
             return False 
 
+    def is_animating(self):
+        """Indique si une animation (notification, déplacement de fenêtre) est en cours"""
+        return bool(self.notifications) or any(window.dragging for window in self.windows)
+
     def handle_events(self):
         """Gère les événements du bureau"""
         for event in pygame.event.get():
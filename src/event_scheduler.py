@@ -0,0 +1,82 @@
+import heapq
+import itertools
+
+class ScheduledJob:
+    """Tâche programmée (ponctuelle ou récurrente)"""
+
+    def __init__(self, when, callback, interval=None, name=None):
+        self.when = when
+        self.callback = callback
+        self.interval = interval  # None pour une tâche ponctuelle
+        self.name = name or getattr(callback, "__name__", "job")
+        self.cancelled = False
+
+    def cancel(self):
+        """Annule la tâche (elle sera ignorée lorsqu'elle sortira du tas)"""
+        self.cancelled = True
+
+    def __repr__(self):
+        return f"ScheduledJob({self.name}, when={self.when}, interval={self.interval})"
+
+class EventScheduler:
+    """Ordonnanceur à tas min : seules les échéances atteintes sont traitées à chaque pas"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self._heap = []  # [(échéance, ordre d'insertion, tâche)]
+        self._counter = itertools.count()
+
+    def schedule_at(self, when, callback, name=None):
+        """Programme une tâche ponctuelle à une date donnée"""
+        return self._push(ScheduledJob(when, callback, name=name))
+
+    def schedule_in(self, delay, callback, name=None):
+        """Programme une tâche ponctuelle après un délai"""
+        return self.schedule_at(self.clock.now() + delay, callback, name)
+
+    def schedule_every(self, interval, callback, first_delay=None, name=None):
+        """Programme une tâche récurrente (première exécution après first_delay, par défaut interval)"""
+        if interval <= 0:
+            raise ValueError("L'intervalle doit être positif")
+        delay = interval if first_delay is None else first_delay
+        job = ScheduledJob(self.clock.now() + delay, callback, interval, name)
+        return self._push(job)
+
+    def cancel(self, job):
+        """Annule une tâche programmée"""
+        job.cancel()
+
+    def run_due(self, now=None):
+        """Exécute toutes les tâches échues et retourne leur nombre"""
+        now = self.clock.now() if now is None else now
+        executed = 0
+        while self._heap and self._heap[0][0] <= now:
+            _, _, job = heapq.heappop(self._heap)
+            if job.cancelled:
+                continue
+            if job.interval is not None:
+                # Reprogrammer avant l'exécution pour qu'une erreur n'arrête pas la tâche
+                job.when += job.interval
+                if job.when <= now:
+                    job.when = now + job.interval
+                self._push(job)
+            job.callback()
+            executed += 1
+        return executed
+
+    def next_due(self):
+        """Date de la prochaine échéance active, ou None"""
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def jobs(self):
+        """Tâches actives, par ordre d'échéance"""
+        return [job for _, _, job in sorted(self._heap) if not job.cancelled]
+
+    def _push(self, job):
+        heapq.heappush(self._heap, (job.when, next(self._counter), job))
+        return job
+
+    def __len__(self):
+        return sum(1 for _, _, job in self._heap if not job.cancelled)
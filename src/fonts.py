@@ -0,0 +1,42 @@
+import logging
+import time
+import pygame
+from paths import FONTS_DIR
+
+# Polices partagées, chargées une seule fois : {(face, taille, gras, italique): Font}
+# Les objets retournés sont partagés entre toutes les fenêtres et ne doivent pas être modifiés.
+_fonts = {}
+
+def _load_font(face, size):
+    """Charge une police embarquée depuis FONTS_DIR, ou la police par défaut de pygame"""
+    if face is None:
+        return pygame.font.Font(None, size)
+
+    font_path = FONTS_DIR / f"{face}.ttf"
+    if font_path.exists():
+        return pygame.font.Font(str(font_path), size)
+
+    logging.getLogger('cyberhack').warning(f"Police {face} introuvable dans {FONTS_DIR}, police par défaut utilisée")
+    return pygame.font.Font(None, size)
+
+def get_font(size, face=None, bold=False, italic=False):
+    """Retourne la police partagée correspondant à (face, taille, style)"""
+    key = (face, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = _load_font(face, size)
+        font.set_bold(bold)
+        font.set_italic(italic)
+        _fonts[key] = font
+    return font
+
+def preload_fonts(specs):
+    """Charge les polices au démarrage et retourne le temps passé (en secondes)"""
+    start = time.perf_counter()
+    for spec in specs:
+        get_font(*spec)
+    return time.perf_counter() - start
+
+def clear_fonts():
+    """Oublie les polices chargées (à appeler avant pygame.font.quit)"""
+    _fonts.clear()
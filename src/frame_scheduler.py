@@ -0,0 +1,42 @@
+import time
+import pygame
+from config import FPS, IDLE_FPS, IDLE_DELAY
+
+class FrameScheduler:
+    """Cadence adaptative : pleine vitesse sur activité, cadence réduite au repos"""
+
+    def __init__(self, active_fps=FPS, idle_fps=IDLE_FPS, idle_delay=IDLE_DELAY):
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.idle_delay = idle_delay
+        self.clock = pygame.time.Clock()
+        self.last_activity = time.time()
+
+    def notify_activity(self):
+        """Signale une entrée utilisateur : repasse immédiatement à pleine cadence"""
+        self.last_activity = time.time()
+
+    def notify_events(self, events):
+        """Signale les événements traités pendant la frame"""
+        if events:
+            self.notify_activity()
+
+    def is_idle(self):
+        """Indique si aucune entrée n'a eu lieu depuis idle_delay secondes"""
+        return time.time() - self.last_activity >= self.idle_delay
+
+    def tick(self, busy=False):
+        """Attend la prochaine frame ; busy signale des timers ou animations en cours"""
+        if busy:
+            self.notify_activity()
+        if not self.is_idle():
+            return self.clock.tick(self.active_fps)
+
+        # Au repos : attendre par tranches et se réveiller dès qu'un événement arrive
+        deadline = time.time() + 1 / self.idle_fps
+        while time.time() < deadline:
+            if pygame.event.peek():
+                self.notify_activity()
+                break
+            pygame.time.wait(10)
+        return self.clock.tick()
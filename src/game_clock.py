@@ -0,0 +1,24 @@
+import time
+
+class GameClock:
+    """Horloge de jeu injectable, source unique du temps pour la simulation"""
+
+    def __init__(self, time_source=time.time):
+        self.time_source = time_source
+
+    def now(self):
+        """Retourne le temps courant en secondes"""
+        return self.time_source()
+
+class ManualClock(GameClock):
+    """Horloge avancée manuellement, pour des tests déterministes sans attente"""
+
+    def __init__(self, start=0.0):
+        self.current = start
+
+    def now(self):
+        return self.current
+
+    def advance(self, seconds):
+        """Fait avancer le temps"""
+        self.current += seconds
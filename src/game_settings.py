@@ -10,6 +10,7 @@ class GameSettings:
     SOUND_VOLUME: float = 0.7
     MUSIC_VOLUME: float = 0.5
     SHOW_FPS: bool = False
+    PROFILER_CSV: bool = False  # Exporte l'histogramme des frames dans logs/ à la fermeture
     VSYNC: bool = True
     WINDOW_SIZE: tuple = (1024, 768)
     
@@ -1,35 +1,41 @@
 import pygame
+import copy
+import logging
 import random
 import time
+import itertools
 from dataclasses import dataclass
-from config import COLORS
+from config import COLORS, SIMULATION_HZ, MAX_SIMULATION_STEPS, SCAN_HOSTS_PER_STEP
 from shop import HardwareType
 from missions import MissionType, Faction
 from messages import SystemeMessage, MessageType
 from exceptions import MissionError, SecurityError, HardwareError
 from targets import TargetGenerator, Target
 from logger import setup_logger
+from debug_trace import get_channel, get_tracer
 from windows import BaseWindow
+from render_cache import LineRenderCache
+from scrollback import ScrollbackBuffer
+from fonts import get_font
+from profiler import get_profiler
+from game_clock import GameClock
+from event_scheduler import EventScheduler
+from modifiers import ModifierStack
+import objectives
+from objectives import compile_objectives
+from loot import LootLedger
+from ui_constants import (TERMINAL_RENDER_CACHE_BYTES, TERMINAL_MAX_LINES, TERMINAL_RESTORE_LINES,
+                          TERMINAL_FONT_FACE, DEFAULT_FONT_SIZE)
 from enums import SecurityLevel, TargetType
-from enum import Enum
 
-class SecurityLevel(Enum):
-    LOW = 1
-    MEDIUM = 2
-    HIGH = 3
-    EXTREME = 4
-
-class TargetType(Enum):
-    CORPORATE = "Entreprise"
-    BANK = "Banque"
-    RESEARCH = "Recherche"
-    INFRASTRUCTURE = "Infrastructure"
-    GOVERNMENT = "Gouvernement"
+# Canaux de trace (sans coût lorsqu'ils sont désactivés)
+trace_terminal = get_channel("terminal")
+trace_mission = get_channel("mission")
 
 class Terminal(BaseWindow):
-    def __init__(self, x, y, width, height, jeu_mission=None):
+    def __init__(self, x, y, width, height, jeu_mission=None, max_lines=TERMINAL_MAX_LINES):
         super().__init__(x, y, width, height, title="Terminal")
-        print("Initialisation du Terminal...")  # Debug
+        trace_terminal.emit("Initialisation du Terminal")
         self.contenu = ""
         
         # Initialiser l'historique avec les informations de mission
@@ -42,7 +48,7 @@ class Terminal(BaseWindow):
         
         # Ajouter les détails de la mission si disponible
         if jeu_mission and jeu_mission.mission:
-            print(f"Mission trouvée: {jeu_mission.mission.titre}")  # Debug
+            trace_terminal.emit("Mission trouvée: %s", jeu_mission.mission.titre)
             try:
                 mission_info.extend([
                     f"Mission: {jeu_mission.mission.titre}",
@@ -50,17 +56,24 @@ class Terminal(BaseWindow):
                     *[f"- {obj}" for obj in jeu_mission.mission.objectifs]
                 ])
             except Exception as e:
-                print(f"Erreur lors de l'ajout des objectifs: {e}")  # Debug
+                logging.getLogger('cyberhack').error(f"Erreur lors de l'ajout des objectifs: {e}")
             
         mission_info.append("----------------------------------------")
         
-        self.historique = mission_info
+        self.historique = ScrollbackBuffer(max_lines, mission_info)
         self.prompt = "root@cyber:~$ "
         self.jeu_mission = jeu_mission
         self.scroll_offset = 0
         self.line_height = 20
-        self.font = pygame.font.Font(None, 24)
-        print("Terminal initialisé avec succès")  # Debug
+        self.font = get_font(DEFAULT_FONT_SIZE, TERMINAL_FONT_FACE)
+        # Les lignes de l'historique ne changent jamais : on garde leur rendu en cache
+        self.render_cache = LineRenderCache(TERMINAL_RENDER_CACHE_BYTES)
+        # Canevas hors écran du corps du terminal, décalé par blit lors des défilements
+        self.body_canvas = None
+        self._canvas_top = None
+        self._canvas_total = 0
+        self._drawn_state = None
+        trace_terminal.emit("Terminal initialisé")
 
     def handle_keypress(self, event):
         """Gère les entrées clavier"""
@@ -78,7 +91,7 @@ class Terminal(BaseWindow):
                             if resultat:
                                 self.historique.extend(resultat)
                     except Exception as e:
-                        print(f"Erreur dans Terminal: {e}")
+                        logging.getLogger('cyberhack').error(f"Erreur dans Terminal: {e}")
                         self.historique.append(f"Erreur: {str(e)}")
                 self.contenu = ""
         elif event.key == pygame.K_BACKSPACE:
@@ -94,70 +107,149 @@ class Terminal(BaseWindow):
         self.scroll_offset = max(0, min(max_scroll, self.scroll_offset - y * 20))
         return True
 
+    def _render_state(self):
+        """État visible du terminal (saisie, curseur, historique, défilement)"""
+        return (
+            self.contenu,
+            time.time() % 1 > 0.5,
+            self.historique.total_appended,
+            len(self.historique),
+            self.scroll_offset
+        )
+
+    def is_dirty(self):
+        """Le terminal doit être redessiné dès que son état visible change (curseur compris)"""
+        return self.dirty or self._render_state() != self._drawn_state
+
     def draw(self, surface):
         super().draw(surface)
+        self._drawn_state = self._render_state()
         
-        # Calculer les lignes visibles en tenant compte du défilement
-        visible_lines = (self.height - 60) // self.line_height
-        total_height = len(self.historique) * self.line_height
-        
-        # Calculer l'index de départ basé sur le défilement
-        start_line = self.scroll_offset // self.line_height
-        
-        # Dessiner l'historique
-        for i, ligne in enumerate(self.historique[start_line:start_line + visible_lines]):
-            y_pos = self.y + 40 + (i * self.line_height) - (self.scroll_offset % self.line_height)
-            texte = self.font.render(ligne, True, COLORS["GREEN"])
-            surface.blit(texte, (self.x + 10, y_pos))
+        # Mettre à jour le canevas de l'historique puis le copier en un seul blit
+        self._update_canvas()
+        surface.blit(self.body_canvas, (self.x + 10, self.y + 40))
         
         # Toujours afficher la ligne de commande en bas
         ligne_commande = self.prompt + self.contenu
-        if time.time() % 1 > 0.5:
+        if self._drawn_state[1]:
             ligne_commande += "█"
         texte = self.font.render(ligne_commande, True, COLORS["GREEN"])
         surface.blit(texte, (self.x + 10, self.y + self.height - 30))
 
+    def _update_canvas(self):
+        """Met à jour le canevas hors écran de l'historique.
+        
+        Chaque ligne occupe une position absolue fixe (son numéro d'ajout dans
+        l'historique), donc un défilement ou un ajout se traduit par un
+        Surface.scroll des pixels existants et le rendu des seules lignes exposées.
+        """
+        visible_lines = (self.height - 60) // self.line_height
+        canvas_height = visible_lines * self.line_height
+        total = self.historique.total_appended
+        first_line = total - len(self.historique)
+        top = first_line * self.line_height + self.scroll_offset
+        
+        if self.body_canvas is None or self.body_canvas.get_height() != canvas_height:
+            self.body_canvas = pygame.Surface((max(1, self.width - 20), max(1, canvas_height)))
+            self._canvas_top = None
+            
+        delta = self._canvas_top - top if self._canvas_top is not None else None
+        if delta is None or abs(delta) >= canvas_height:
+            # Rendu complet
+            self._render_rows(top, top, top + canvas_height)
+        else:
+            if delta:
+                # Décaler les pixels existants et ne rendre que la bande exposée
+                self.body_canvas.scroll(0, delta)
+                if delta < 0:
+                    self._render_rows(top, top + canvas_height + delta, top + canvas_height)
+                else:
+                    self._render_rows(top, top, top + delta)
+            # Rendre les lignes ajoutées depuis le dernier affichage
+            if total > self._canvas_total:
+                start = max(self._canvas_total, first_line) * self.line_height
+                self._render_rows(top, max(top, start), min(top + canvas_height, total * self.line_height))
+                
+        self._canvas_top = top
+        self._canvas_total = total
+
+    def _render_rows(self, top, start_y, end_y):
+        """Efface et redessine la bande de pixels absolus [start_y, end_y) du canevas"""
+        if end_y <= start_y:
+            return
+        band = pygame.Rect(0, start_y - top, self.body_canvas.get_width(), end_y - start_y)
+        self.body_canvas.set_clip(band)
+        self.body_canvas.fill(COLORS["DARK_GRAY"])
+        
+        first_line = self.historique.total_appended - len(self.historique)
+        start_line = max(start_y // self.line_height, first_line)
+        end_line = (end_y - 1) // self.line_height + 1
+        for ligne_abs, ligne in enumerate(
+                self.historique.window(start_line - first_line, end_line - start_line), start_line):
+            texte = self.render_cache.render(ligne, self.font, COLORS["GREEN"])
+            self.body_canvas.blit(texte, (0, ligne_abs * self.line_height - top))
+        self.body_canvas.set_clip(None)
+
 class JeuMission:
-    def __init__(self, mission, ecran, save_manager):
-        print("Initialisation de JeuMission...")  # Debug
+    def __init__(self, mission, ecran, save_manager, clock=None, state=None):
+        trace_mission.emit("Initialisation de JeuMission")
         if not mission or not save_manager:
             raise ValueError("Mission et save_manager sont requis")
             
         self.logger = setup_logger()
+        self.clock = clock or GameClock()
         self.mission = mission
-        print(f"Mission chargée: {mission.titre}")  # Debug
+        trace_mission.emit("Mission chargée: %s", mission.titre)
         self.ecran = ecran
         self.save_manager = save_manager
         self.systeme_compromis = False
-        self.donnees_volees = []
+        self.loot = LootLedger()  # Données volées, rançons payées et systèmes compromis
         self.alert_level = 0
         self.detected = False
         self.is_running = True
         
         # Initialiser les cibles en fonction de la mission
         self.target_generator = TargetGenerator()
-        # Charger les cibles principales
-        self.primary_targets = self.target_generator.get_targets_for_mission(mission.id)
-        # Charger les cibles secondaires
-        self.secondary_targets = self.target_generator.get_secondary_targets_for_mission(mission.id)
+        if state:
+            # Reprise d'une session : cibles restaurées telles quelles, sans génération
+            self.primary_targets = self.target_generator.restore_targets(state["targets"]["primary"])
+            self.secondary_targets = self.target_generator.restore_targets(state["targets"]["secondary"])
+            self.target_generator.restore_targets(state["targets"]["network"])
+        else:
+            # Charger les cibles principales
+            self.primary_targets = self.target_generator.get_targets_for_mission(mission.id)
+            # Charger les cibles secondaires
+            self.secondary_targets = self.target_generator.get_secondary_targets_for_mission(mission.id)
         # Combiner toutes les cibles disponibles
         self.available_targets = self.primary_targets + self.secondary_targets
         
-        print(f"Cibles principales: {[t.name for t in self.primary_targets]}")  # Debug
-        print(f"Cibles secondaires: {[t.name for t in self.secondary_targets]}")  # Debug
+        # Mode grand réseau : hôtes générés à la demande, par sous-réseau
+        self.network = None
+        if state and state["network"]:
+            self.network = self.target_generator.restore_network(mission.id, state["network"])
+        elif mission.reseau:
+            self.network = self.target_generator.create_network(mission.id, **mission.reseau)
+        self.scan_job = None  # Scan de sous-réseau en cours
+        self.scan_found = 0
+        
+        if trace_mission:
+            trace_mission.emit("Cibles principales: %s", [t.name for t in self.primary_targets])
+            trace_mission.emit("Cibles secondaires: %s", [t.name for t in self.secondary_targets])
         
         self.current_target = None
         self.botnet_size = 0
         self.botnet_targets = []  # Liste des machines dans le botnet
+        self.botnet_ids = set()  # IDs des machines du botnet (test d'appartenance)
         self.encrypted_systems = {}
-        self.total_ransom = 0
+        self.mining_cycles = 0  # Cycles de minage (botnet mine, payload miner)
+        
+        # Ordonnanceur des tâches récurrentes et des échéances de la mission
+        self.scheduler = EventScheduler(self.clock)
         
-        # Initialiser les timers
-        self.last_event_check = time.time()
-        self.last_save_time = time.time()
-        self.last_difficulty_check = time.time()
-        self.last_unlock_check = time.time()
-        self.last_botnet_check = time.time()  # Timer pour les revenus du botnet
+        # Simulation à pas fixe, découplée de la fréquence d'affichage
+        self.simulation_step = 1 / SIMULATION_HZ
+        self.simulation_accumulator = 0.0
+        self.last_simulation_time = self.clock.now()
         
         # Initialiser les commandes disponibles
         self.commandes_disponibles = {
@@ -181,7 +273,8 @@ class JeuMission:
             'exfiltrate': self.cmd_exfiltrate,
             'download': self.cmd_download,
             'modify': self.cmd_modify,
-            'exploit': self.cmd_exploit
+            'exploit': self.cmd_exploit,
+            'trace': self.cmd_trace
         }
         
         # Créer le terminal
@@ -189,8 +282,10 @@ class JeuMission:
         
         # Ajouter ces attributs manquants
         self.mission_duration = 1800  # 30 minutes par défaut
-        self.mission_start_time = time.time()
+        self.mission_start_time = self.clock.now()
         self.objectifs_completes = [False] * len(mission.objectifs)
+        # Objectifs compilés, réévalués sur notification de changement d'état
+        self.objectives = compile_objectives(mission)
         self.hardware_bonus = {"stealth": 1.0, "exploit": 0}
         self.player_data = save_manager.player_data
         
@@ -207,7 +302,6 @@ class JeuMission:
             "miner": {"credits_rate": 200, "detection_rate": 8},
             "trojan": {"data_rate": 150, "detection_rate": 10}
         }
-        self.last_payload_check = time.time()
         
         # Ajouter la gestion du hardware
         self.hardware_stats = {
@@ -217,13 +311,109 @@ class JeuMission:
             "cooling": {"level": 1, "bonus": 0.1}
         }
         
-        # Ajouter la gestion des bonus temporaires
-        self.active_bonuses = {
-            "stealth": [],  # [(bonus_value, end_time), ...]
-            "hack": [],
-            "detection": []
+        # Pile des modificateurs : outils, faction, hardware et bonus temporaires
+        # Catégories : "tool:<type>", "faction:<action>", "hardware:<type>", "bonus:<type>"
+        self.modifiers = ModifierStack(self.clock)
+        self.refresh_modifiers()
+        
+        if state:
+            self.restore_session(state)
+        self.schedule_periodic_events()
+
+    @classmethod
+    def restore(cls, state, mission, ecran, save_manager, clock=None):
+        """Reprend une session sauvegardée par snapshot() (aucune cible n'est régénérée)"""
+        if state["mission_id"] != mission.id:
+            raise MissionError(f"La sauvegarde concerne la mission {state['mission_id']}")
+        return cls(mission, ecran, save_manager, clock=clock, state=state)
+
+    def snapshot(self):
+        """État complet de la session, sérialisable (JSON), pour la reprendre avec restore()"""
+        # Hôtes du grand réseau référencés par la session (les autres se régénèrent depuis la graine)
+        network_ids = set()
+        if self.network:
+            referenced = (self.botnet_ids | set(self.encrypted_systems) | set(self.active_payloads)
+                          | self.loot.compromised)
+            if self.current_target:
+                referenced.add(self.current_target.id)
+            network_ids = {target_id for target_id in referenced
+                           if target_id in self.target_generator.targets_by_id
+                           and self.network.is_host(self.target_generator.targets_by_id[target_id])}
+        
+        return {
+            "mission_id": self.mission.id,
+            "saved_at": self.clock.now(),  # Référence pour décaler les dates à la reprise
+            "mission_start_time": self.mission_start_time,
+            "mission_duration": self.mission_duration,
+            "alert_level": self.alert_level,
+            "detected": self.detected,
+            "systeme_compromis": self.systeme_compromis,
+            "loot": self.loot.to_dict(),
+            "botnet_size": self.botnet_size,
+            "botnet_ids": [target.id for target in self.botnet_targets],
+            "encrypted_systems": copy.deepcopy(self.encrypted_systems),
+            "mining_cycles": self.mining_cycles,
+            "objectifs_completes": list(self.objectifs_completes),
+            "current_target": self.current_target.id if self.current_target else None,
+            "tool_durability": dict(self.tool_durability),
+            "active_payloads": copy.deepcopy(self.active_payloads),
+            "bonuses": [list(bonus) for bonus in self.modifiers.temporary()],
+            "targets": {
+                "primary": [target.to_dict() for target in self.primary_targets],
+                "secondary": [target.to_dict() for target in self.secondary_targets],
+                "network": [self.target_generator.targets_by_id[target_id].to_dict()
+                            for target_id in sorted(network_ids)]
+            },
+            "network": self.network.to_dict() if self.network else None,
+            "terminal_history": list(self.terminal.historique)[-TERMINAL_RESTORE_LINES:]
         }
 
+    def restore_session(self, state):
+        """Applique un état de snapshot() ; les dates sont décalées sur l'horloge courante"""
+        shift = self.clock.now() - state["saved_at"]
+        self.mission_start_time = state["mission_start_time"] + shift
+        self.mission_duration = state["mission_duration"]
+        self.alert_level = state["alert_level"]
+        self.detected = state["detected"]
+        self.systeme_compromis = state["systeme_compromis"]
+        self.loot = LootLedger.from_dict(state["loot"])
+        self.botnet_size = state["botnet_size"]
+        self.botnet_targets = [target for target in map(self.target_generator.get_target_by_id, state["botnet_ids"])
+                               if target is not None]
+        self.botnet_ids = {target.id for target in self.botnet_targets}
+        self.mining_cycles = state["mining_cycles"]
+        self.objectifs_completes = list(state["objectifs_completes"])
+        self.tool_durability = dict(state["tool_durability"])
+        
+        self.current_target = None
+        if state["current_target"]:
+            self.current_target = self.target_generator.get_target_by_id(state["current_target"])
+            if self.current_target and self.network:
+                self.network.pin(self.current_target)
+        
+        self.encrypted_systems = copy.deepcopy(state["encrypted_systems"])
+        for target_id, ransom_info in self.encrypted_systems.items():
+            ransom_info["encrypt_time"] += shift
+            if ransom_info["payment_deadline"] is not None:
+                ransom_info["payment_deadline"] += shift
+                if not ransom_info["paid"] and not ransom_info.get("refused"):
+                    self.scheduler.schedule_at(ransom_info["payment_deadline"],
+                                               lambda target_id=target_id: self.resolve_ransom_payment(target_id, notify=True),
+                                               name=f"ransom_{target_id}")
+        
+        self.active_payloads = {
+            target_id: {payload_type: timestamp + shift for payload_type, timestamp in payloads.items()}
+            for target_id, payloads in state["active_payloads"].items()
+        }
+        now = self.clock.now()
+        for category, factor, end_time in state["bonuses"]:
+            if end_time + shift > now:
+                self.modifiers.add_temporary(category, factor, end_time + shift - now)
+        
+        self.terminal.historique.clear()
+        self.terminal.historique.extend(state["terminal_history"])
+        self.terminal.historique.append("--- Session restaurée ---")
+
     def execute_command(self, command, args):
         """Exécute une commande avec gestion d'erreurs"""
         try:
@@ -254,6 +444,9 @@ class JeuMission:
         if self.current_target:
             return ["Erreur: Déjà connecté à une cible"]
             
+        if args:
+            return self.start_network_scan(args[0], args[1] if len(args) > 1 else None)
+            
         results = ["Scan en cours..."]
         for target in self.available_targets:
             results.extend([
@@ -263,26 +456,75 @@ class JeuMission:
                 f"Niveau de sécurité: {target.security_level.value}"
             ])
             
+        if self.network:
+            results.extend([
+                "",
+                f"Réseau étendu: {self.network.subnet_count} sous-réseaux, {self.network.host_count} hôtes",
+                f"Premier sous-réseau: {self.network.subnet_cidr(0)}",
+                "Usage: scan <cidr> [niveau de sécurité 1-4] (ex: scan 10.0.0.0/24 2)"
+            ])
+            
         self.update_alert_level(5)  # Scan léger augmente peu l'alerte
         return results
 
+    def start_network_scan(self, cidr, level=None):
+        """Lance le scan d'un bloc CIDR ; les résultats arrivent au fil des pas de simulation"""
+        if not self.network:
+            return ["Erreur: Aucun réseau étendu pour cette mission"]
+            
+        security_level = None
+        if level is not None:
+            try:
+                security_level = SecurityLevel(int(level))
+            except ValueError:
+                return [f"Erreur: Niveau de sécurité invalide: {level}"]
+            
+        try:
+            hosts = self.network.iter_hosts(cidr, security_level)
+        except ValueError:
+            return [f"Erreur: Sous-réseau invalide: {cidr}"]
+            
+        if self.scan_job:
+            self.scan_job.cancel()
+        self.scan_found = 0
+        self.scan_job = self.scheduler.schedule_every(
+            self.simulation_step,
+            lambda: self.continue_network_scan(hosts, cidr),
+            first_delay=0,
+            name="network_scan"
+        )
+        self.update_alert_level(5)
+        return [f"Scan de {cidr} en cours..."]
+
+    def continue_network_scan(self, hosts, cidr):
+        """Affiche le lot suivant d'hôtes d'un scan de sous-réseau"""
+        batch = list(itertools.islice(hosts, SCAN_HOSTS_PER_STEP))
+        for target in batch:
+            self.terminal.historique.append(
+                f"{target.ip:<15} {target.name:<22} ports {','.join(map(str, target.ports))} "
+                f"- sécurité {target.security_level.value}"
+            )
+        self.scan_found += len(batch)
+        
+        if len(batch) < SCAN_HOSTS_PER_STEP:
+            self.scan_job.cancel()
+            self.scan_job = None
+            self.terminal.historique.append(f"Scan de {cidr} terminé : {self.scan_found} hôte(s)")
+
     def cmd_connect(self, args):
         """Se connecte à une cible"""
         if not args:
             return ["Usage: connect <ip> [port]"]
             
         target_ip = args[0]
-        target = None
         port = int(args[1]) if len(args) > 1 else None
         
         # Trouver la cible
-        for t in self.available_targets:
-            if t.ip == target_ip:
-                target = t
-                break
-        
+        target = self.target_generator.get_target_by_ip(target_ip)
         if not target:
             return [f"Erreur: Cible {target_ip} non trouvée"]
+        if self.network:
+            self.network.pin(target)
             
         # Vérifier le port si spécifié
         if port and port not in target.ports:
@@ -299,6 +541,7 @@ class JeuMission:
         
         # Mettre à jour l'état
         self.current_target = target
+        self.notify_state_change(objectives.TARGET)
         self.update_alert_level(detection_risk)
         
         return [
@@ -361,7 +604,7 @@ class JeuMission:
             risk *= 0.7
             
         # Appliquer les bonus de faction pour la détection
-        faction_bonus = self.apply_faction_bonus("detection")
+        faction_bonus = self.get_modifier("faction:detection")
         risk *= faction_bonus
         
         return min(int(risk), 100)  # Plafonner à 100%
@@ -383,6 +626,8 @@ class JeuMission:
         
         if random.random() < final_chance:
             self.systeme_compromis = True
+            self.loot.add_compromised(self.current_target.id)
+            self.notify_state_change(objectives.COMPROMISED)
             self.update_alert_level(20)
             return [
                 "Cracking réussi !",
@@ -484,7 +729,11 @@ class JeuMission:
         return results
 
     def get_tool_bonus(self, tool_type):
-        """Calcule le bonus donné par les outils"""
+        """Bonus donné par les outils, faction comprise (agrégat en cache)"""
+        return self.get_modifier(f"tool:{tool_type}")
+
+    def _tool_factor(self, tool_type):
+        """Calcule le facteur apporté par les outils possédés"""
         tools = self.player_data.get("tools", [])
         bonus = 1.0
         
@@ -498,27 +747,53 @@ class JeuMission:
             if "rootkit" in tools:
                 bonus += 0.4  # +40% de chance de succès
                 
-        # Appliquer les bonus de faction
-        faction_bonus = self.apply_faction_bonus(tool_type)
-        bonus *= faction_bonus
-                
         return bonus
 
+    def get_modifier(self, category):
+        """Multiplicateur agrégé d'une catégorie, enregistrée à la première demande"""
+        if not self.modifiers.has(category):
+            self._register_modifiers(category)
+        return self.modifiers.multiplier(category)
+
+    def _register_modifiers(self, category):
+        """(Re)calcule les facteurs permanents d'une catégorie de modificateurs"""
+        kind, _, name = category.partition(":")
+        if kind == "tool":
+            self.modifiers.set(category, "tools", self._tool_factor(name))
+            self.modifiers.set(category, "faction", self.apply_faction_bonus(name))
+        elif kind == "faction":
+            self.modifiers.set(category, "faction", self.apply_faction_bonus(name))
+        elif kind == "hardware":
+            self.modifiers.set(category, "hardware", self._hardware_factor(name))
+            self.modifiers.set(category, "faction", self._hardware_faction_factor(name))
+        else:
+            # Catégorie sans source permanente (bonus temporaires uniquement)
+            self.modifiers.set(category, "base", 1.0)
+
+    def refresh_modifiers(self):
+        """Recalcule les modificateurs permanents (outils, niveau ou hardware modifiés)"""
+        categories = set(self.modifiers.categories())
+        categories.update(f"hardware:{hw}" for hw in self.hardware_stats)
+        for category in categories:
+            self._register_modifiers(category)
+
     def update_alert_level(self, amount):
         """Met à jour le niveau d'alerte avec les bonus de furtivité"""
         stealth_bonus = self.get_tool_bonus("stealth")
         actual_amount = amount * (1 / stealth_bonus)  # Réduction de l'alerte selon les outils
         self.alert_level = max(0, min(100, self.alert_level + actual_amount))
+        self.notify_state_change(objectives.ALERT)
         
         if self.alert_level >= 80 and not self.detected:
             self.detected = True
+            self.notify_state_change(objectives.DETECTED)
             self.terminal.historique.append("! ALERTE ! Intrusion détectée !")
             self.handle_detection()
 
     def cmd_help(self, args):
         """Affiche l'aide des commandes disponibles"""
         commands = {
-            'scan': 'Recherche des cibles',
+            'scan': 'Recherche des cibles (scan <cidr> pour un sous-réseau)',
             'connect': 'Se connecte à une cible',
             'crack': 'Tente de craquer la sécurité',
             'inject': 'Injecte un payload',
@@ -529,7 +804,8 @@ class JeuMission:
             'stealth': 'Actions furtives',
             'market': 'Accède au marché noir',
             'status': 'État de la mission',
-            'mission': 'Détails des objectifs'
+            'mission': 'Détails des objectifs',
+            'trace': 'Trace de débogage (trace on|off <catégorie>, trace dump [n])'
         }
         
         if not args:
@@ -538,14 +814,41 @@ class JeuMission:
             return [f"Usage: {args[0]} - {commands[args[0]]}"]
         return ["Commande inconnue"]
 
+    def cmd_trace(self, args):
+        """Active les catégories de trace ou affiche les dernières lignes"""
+        tracer = get_tracer()
+        if not args:
+            channels = sorted(tracer.channels.values(), key=lambda channel: channel.category)
+            return [
+                "Usage: trace on|off <catégorie|*>, trace dump [n] [catégorie]",
+                *[f"- {channel.category}: {'actif' if channel else 'inactif'}" for channel in channels]
+            ]
+            
+        action = args[0]
+        if action in ("on", "off"):
+            if len(args) < 2:
+                return [f"Usage: trace {action} <catégorie|*>"]
+            tracer.set_enabled(args[1], action == "on")
+            return [f"Trace {args[1]}: {'activée' if action == 'on' else 'désactivée'}"]
+            
+        if action == "dump":
+            try:
+                count = int(args[1]) if len(args) > 1 else 20
+            except ValueError:
+                return ["Erreur: Nombre de lignes invalide"]
+            category = args[2] if len(args) > 2 else None
+            return tracer.dump(count, category) or ["Trace vide"]
+            
+        return ["Action invalide"]
+
     def cmd_status(self, args):
         """Affiche l'état actuel de la mission"""
         return [
             f"Niveau d'alerte: {self.alert_level}%",
             f"Détecté: {'Oui' if self.detected else 'Non'}",
             f"Système compromis: {'Oui' if self.systeme_compromis else 'Non'}",
-            f"Données volées: {len(self.donnees_volees)}",
-            f"Temps restant: {int((self.mission_duration - (time.time() - self.mission_start_time))/60)}min"
+            f"Données volées: {self.loot.count}",
+            f"Temps restant: {int((self.mission_duration - (self.clock.now() - self.mission_start_time))/60)}min"
         ]
 
     def cmd_exfiltrate(self, args):
@@ -567,20 +870,22 @@ class JeuMission:
             total_value = 0
             # Exfiltrer les fichiers
             for name, data in self.current_target.files.items():
-                if not data["encrypted"]:
-                    self.donnees_volees.append(("file", (data["value"], name)))
+                if not data["encrypted"] and not data.get("exfiltrated"):
+                    self.add_stolen_data("file", data["value"], name)
+                    self.current_target.set_data_state(name, exfiltrated=True)
                     total_value += data["value"]
             
             # Exfiltrer les bases de données
             for name, data in self.current_target.databases.items():
-                if not data["encrypted"]:
-                    self.donnees_volees.append(("database", (data["value"], name)))
+                if not data["encrypted"] and not data.get("exfiltrated"):
+                    self.add_stolen_data("database", data["value"], name)
+                    self.current_target.set_data_state(name, exfiltrated=True)
                     total_value += data["value"]
                     
             self.update_alert_level(50)
-        return [
+            return [
                 "Exfiltration massive en cours...",
-                f"Données volées: {len(self.donnees_volees)}",
+                f"Données volées: {self.loot.count}",
                 f"Valeur totale: {total_value}¢"
             ]
             
@@ -595,8 +900,11 @@ class JeuMission:
             file_data = self.current_target.files[name]
             if file_data["encrypted"]:
                 return ["Erreur: Fichier chiffré"]
+            if file_data.get("exfiltrated"):
+                return ["Fichier déjà exfiltré"]
                 
-            self.donnees_volees.append(("file", (file_data["value"], name)))
+            self.add_stolen_data("file", file_data["value"], name)
+            self.current_target.set_data_state(name, exfiltrated=True)
             self.update_alert_level(20)
             return [
                 f"Exfiltration de {name}",
@@ -611,8 +919,11 @@ class JeuMission:
             db_data = self.current_target.databases[name]
             if db_data["encrypted"]:
                 return ["Erreur: Base de données chiffrée"]
+            if db_data.get("exfiltrated"):
+                return ["Base de données déjà exfiltrée"]
                 
-            self.donnees_volees.append(("database", (db_data["value"], name)))
+            self.add_stolen_data("database", db_data["value"], name)
+            self.current_target.set_data_state(name, exfiltrated=True)
             self.update_alert_level(30)
             return [
                 f"Exfiltration de {name}",
@@ -633,6 +944,7 @@ class JeuMission:
         # 50% de chance de terminer la mission si détecté
         if random.random() < 0.5:
             self.is_running = False
+            self.save_manager.clear_mission_state()
             self.terminal.historique.append("Connexion terminée par la cible")
 
     def cmd_market(self, args):
@@ -670,16 +982,14 @@ class JeuMission:
             return self.cmd_download([args[1]])
             
         elif action == "sell":
-            if not self.donnees_volees:
+            if not self.loot.count:
                 return ["Aucune donnée à vendre"]
                 
-            total_value = 0
-            for data_type, (value, name) in self.donnees_volees:
-                total_value += value
-            
+            total_value = self.loot.total_value
             self.player_data["credits"] += total_value
-            sold_data = len(self.donnees_volees)
-            self.donnees_volees = []
+            sold_data = self.loot.count
+            self.loot.clear_data()
+            self.notify_state_change(objectives.STOLEN_DATA)
             
             return [
                 f"Données vendues: {sold_data}",
@@ -716,11 +1026,13 @@ class JeuMission:
             if not self.systeme_compromis:
                 return ["Erreur: Système non compromis"]
                 
-            if self.current_target.id in [t.id for t in self.available_targets if t in self.botnet_targets]:
+            if self.current_target.id in self.botnet_ids:
                 return ["Cette machine fait déjà partie du botnet"]
                 
             self.botnet_size += 1
             self.botnet_targets.append(self.current_target)
+            self.botnet_ids.add(self.current_target.id)
+            self.notify_state_change(objectives.BOTNET)
             self.update_alert_level(20)
             return [f"Machine ajoutée au botnet", f"Taille actuelle: {self.botnet_size}"]
             
@@ -744,6 +1056,9 @@ class JeuMission:
                 return ["Erreur: Botnet vide"]
             credits = self.botnet_size * 50
             self.player_data["credits"] += credits
+            self.use_tool("miner", "intensive")
+            self.mining_cycles += 1
+            self.notify_state_change(objectives.MINING)
             self.update_alert_level(15)
             return [f"Minage en cours...", f"Gains: {credits}¢"]
             
@@ -780,10 +1095,11 @@ class JeuMission:
             self.encrypted_systems[target_id] = {
                 "amount": 0,
                 "paid": False,
-                "encrypt_time": time.time(),
+                "encrypt_time": self.clock.now(),
                 "payment_deadline": None,
                 "decrypted": False
             }
+            self.notify_state_change(objectives.ENCRYPTED)
             self.update_alert_level(40)
             return ["Système chiffré avec succès"]
             
@@ -803,11 +1119,14 @@ class JeuMission:
                 if self.encrypted_systems[target_id]["amount"] > 0:
                     return ["Une demande de rançon existe déjà"]
                     
-                payment_deadline = time.time() + 300  # 5 minutes
+                payment_deadline = self.clock.now() + 300  # 5 minutes
                 self.encrypted_systems[target_id].update({
                     "amount": amount,
                     "payment_deadline": payment_deadline
                 })
+                self.scheduler.schedule_at(payment_deadline,
+                                           lambda: self.resolve_ransom_payment(target_id, notify=True),
+                                           name=f"ransom_{target_id}")
                 
                 return [
                     f"Demande de rançon envoyée: {amount}¢",
@@ -838,22 +1157,16 @@ class JeuMission:
                 
             # Vérifier si le délai est dépassé
             if ransom_info["payment_deadline"]:
-                time_left = ransom_info["payment_deadline"] - time.time()
+                time_left = ransom_info["payment_deadline"] - self.clock.now()
                 if time_left <= 0:
-                    # Simuler une chance de paiement basée sur le montant
-                    payment_chance = min(0.7, ransom_info["amount"] / 10000)  # Max 70% de chance
-                    if random.random() < payment_chance:
-                        ransom_info["paid"] = True
-                        self.total_ransom += ransom_info["amount"]
-                        self.player_data["stats"]["ransoms_collected"] = \
-                            self.player_data["stats"].get("ransoms_collected", 0) + ransom_info["amount"]
+                    # L'échéance a pu être atteinte avant le passage de l'ordonnanceur
+                    if self.resolve_ransom_payment(target_id):
                         return [
                             "! Paiement reçu !",
                             f"Montant: {ransom_info['amount']}¢",
                             "Utilisez 'ransom decrypt' pour déchiffrer"
                         ]
-                    else:
-                        return ["Délai expiré - Paiement refusé"]
+                    return ["Délai expiré - Paiement refusé"]
                 else:
                     return [
                         "État: EN ATTENTE",
@@ -893,9 +1206,33 @@ class JeuMission:
             
         return ["Action invalide"]
 
+    def resolve_ransom_payment(self, target_id, notify=False):
+        """Résout une demande de rançon à son échéance ; retourne True si elle est payée"""
+        ransom_info = self.encrypted_systems.get(target_id)
+        if not ransom_info or ransom_info["paid"] or ransom_info.get("refused"):
+            return bool(ransom_info and ransom_info["paid"])
+            
+        # Simuler une chance de paiement basée sur le montant
+        payment_chance = min(0.7, ransom_info["amount"] / 10000)  # Max 70% de chance
+        if random.random() < payment_chance:
+            ransom_info["paid"] = True
+            self.loot.add_ransom(ransom_info["amount"])
+            self.notify_state_change(objectives.ENCRYPTED)
+            self.player_data["stats"]["ransoms_collected"] = \
+                self.player_data["stats"].get("ransoms_collected", 0) + ransom_info["amount"]
+            if notify:
+                self.terminal.historique.append(f"! Paiement de rançon reçu : {ransom_info['amount']}¢ !")
+            return True
+            
+        ransom_info["refused"] = True
+        if notify:
+            self.terminal.historique.append("! Délai de rançon expiré - Paiement refusé !")
+        return False
+
     def cmd_clear(self, args):
         """Efface l'écran du terminal"""
-        self.terminal.historique = []
+        self.terminal.historique.clear()
+        self.terminal.scroll_offset = 0
         return []
 
     def cmd_ls(self, args):
@@ -984,15 +1321,15 @@ class JeuMission:
         results.extend(faction_desc["bonus"])
         
         # Ajouter les bonus temporaires actifs
-        current_time = time.time()
+        current_time = self.clock.now()
         active_temp_bonuses = []
-        for bonus_type, bonuses in self.active_bonuses.items():
-            for value, end_time in bonuses:
-                if end_time > current_time:
-                    remaining = int((end_time - current_time) / 60)  # Minutes restantes
-                    active_temp_bonuses.append(
-                        f"- {bonus_type.capitalize()}: +{int(value * 100)}% ({remaining}min restantes)"
-                    )
+        for category, factor, end_time in self.modifiers.temporary():
+            kind, _, bonus_type = category.partition(":")
+            if kind == "bonus" and end_time > current_time:
+                remaining = int((end_time - current_time) / 60)  # Minutes restantes
+                active_temp_bonuses.append(
+                    f"- {bonus_type.capitalize()}: +{int(round((factor - 1) * 100))}% ({remaining}min restantes)"
+                )
         
         if active_temp_bonuses:
             results.extend(["", "=== Bonus Temporaires ===", *active_temp_bonuses])
@@ -1010,45 +1347,24 @@ class JeuMission:
         return results
 
     def cmd_exit(self, args):
-        """Quitte la mission en cours"""
+        """Quitte la mission en cours (la session est sauvegardée pour être reprise)"""
+        self.save_mission_state()
         self.is_running = False
         return ["Déconnexion..."]
 
     def check_mission_objectives(self):
-        """Vérifie l'état des objectifs de la mission"""
-        mission_type = self.mission.type
-        
-        # Objectifs principaux
-        if mission_type == MissionType.INFILTRATION:
-            self.objectifs_completes[0] = self.systeme_compromis
-            self.objectifs_completes[1] = len(self.donnees_volees) > 0
-            self.objectifs_completes[2] = self.alert_level < 50
-            
-        elif mission_type == MissionType.DATA_THEFT:
-            # Calculer la valeur totale des données volées
-            total_value = sum(value for _, (value, _) in self.donnees_volees)
-            self.objectifs_completes[0] = self.systeme_compromis
-            self.objectifs_completes[1] = total_value >= 2000  # Seuil minimum
-            self.objectifs_completes[2] = not self.detected  # Non détecté
-            
-        elif mission_type == MissionType.RANSOMWARE:
-            total_ransom = sum(sys["amount"] for sys in self.encrypted_systems.values() if sys["paid"])
-            self.objectifs_completes[0] = any(sys["paid"] for sys in self.encrypted_systems.values())
-            self.objectifs_completes[1] = total_ransom >= 3000  # Seuil minimum
-            self.objectifs_completes[2] = len(self.encrypted_systems) >= 2  # Au moins 2 systèmes
-            
-        elif mission_type == MissionType.BOTNET:
-            self.objectifs_completes[0] = self.botnet_size >= 5
-            self.objectifs_completes[1] = self.alert_level < 80
-            self.objectifs_completes[2] = any(self.use_tool("miner", "intensive") for _ in range(3))
-            
-        elif mission_type == MissionType.SABOTAGE:
-            # Vérifier si les systèmes critiques ont été compromis
-            critical_systems = ["IND_001"]  # IDs des systèmes critiques
-            compromised = [t.id for t in self.available_targets if t.id in critical_systems and self.systeme_compromis]
-            self.objectifs_completes[0] = len(compromised) > 0
-            self.objectifs_completes[1] = self.alert_level < 70
-            self.objectifs_completes[2] = any(sys["modified"] for sys in self.current_target.security_systems.values() if isinstance(sys, dict))
+        """Réévalue les objectifs dont l'état a changé depuis le dernier pas"""
+        if self.objectives.evaluate(self):
+            self.objectifs_completes = self.objectives.primary_status()
+
+    def notify_state_change(self, *dependencies):
+        """Signale un changement d'état aux objectifs qui en dépendent"""
+        self.objectives.notify(*dependencies)
+
+    def add_stolen_data(self, data_type, value, name):
+        """Enregistre des données volées"""
+        self.loot.add(data_type, value, name)
+        self.notify_state_change(objectives.STOLEN_DATA)
 
     def check_random_events(self):
         """Gère les événements aléatoires pendant la mission"""
@@ -1124,9 +1440,9 @@ class JeuMission:
             alert_modifier = 1.0
             if self.systeme_compromis:
                 alert_modifier *= 1.2  # +20% d'alerte si système compromis
-            if len(self.donnees_volees) > 0:
+            if self.loot.count > 0:
                 alert_modifier *= 1.1  # +10% d'alerte si données volées
-            if any(sys["paid"] for sys in self.encrypted_systems.values()):
+            if self.loot.ransom_count > 0:
                 alert_modifier *= 1.3  # +30% d'alerte si rançon payée
             
             # Appliquer les bonus de faction pour les événements
@@ -1141,43 +1457,18 @@ class JeuMission:
             # Effets spéciaux selon le type d'événement
             if "faille" in event[0].lower() or "vulnérabilité" in event[0].lower():
                 self.terminal.historique.append("Bonus temporaire de hacking activé")
-                self.active_bonuses["hack"].append((0.2, time.time() + 300))  # +20% pendant 5min
+                self.add_temporary_bonus("hack", 0.2, 300)  # +20% pendant 5min
             elif "route" in event[0].lower() or "zone" in event[0].lower():
                 self.terminal.historique.append("Bonus temporaire de furtivité activé")
-                self.active_bonuses["stealth"].append((0.2, time.time() + 300))  # +20% pendant 5min
+                self.add_temporary_bonus("stealth", 0.2, 300)  # +20% pendant 5min
             elif "analyse" in event[0].lower() or "optimisation" in event[0].lower():
                 self.terminal.historique.append("Bonus temporaire d'analyse activé")
-                self.active_bonuses["detection"].append((0.2, time.time() + 300))  # +20% pendant 5min
+                self.add_temporary_bonus("detection", 0.2, 300)  # +20% pendant 5min
 
     def check_secondary_objectives(self):
-        """Vérifie l'état des objectifs secondaires"""
-        if not hasattr(self.mission, "objectifs_secondaires"):
-            return []
-            
-        results = []
-        for i, obj in enumerate(self.mission.objectifs_secondaires):
-            completed = False
-            
-            # Vérifier les différents types d'objectifs
-            if "non détecté" in obj.lower():
-                completed = not self.detected
-            elif "temps" in obj.lower():
-                completed = (time.time() - self.mission_start_time) < (self.mission_duration * 0.75)
-            elif "botnet" in obj.lower():
-                completed = self.botnet_size >= 3
-            elif "données" in obj.lower():
-                total_value = sum(value for _, (value, _) in self.donnees_volees)
-                completed = total_value >= 5000
-            elif "furtif" in obj.lower():
-                completed = self.alert_level < 30
-            elif "ransomware" in obj.lower():
-                completed = len(self.encrypted_systems) >= 2
-            elif "modification" in obj.lower():
-                completed = any(sys.get("modified", False) for sys in self.current_target.security_systems.values() if isinstance(sys, dict))
-            
-            results.append((obj, completed))
-            
-        return results
+        """Retourne l'état des objectifs secondaires : [(objectif, complété)]"""
+        self.check_mission_objectives()
+        return self.objectives.secondary_status()
 
     def cmd_objectives(self, args):
         """Affiche l'état des objectifs principaux et secondaires"""
@@ -1201,35 +1492,62 @@ class JeuMission:
 
     def afficher(self):
         """Affiche et met à jour l'état de la mission"""
+        profiler = get_profiler()
         try:
-            # Vérifier les événements périodiques
-            self.check_periodic_events()
-            
-            # Vérifier les effets des payloads
-            self.check_payload_effects()
-            
-            # Sauvegarde automatique toutes les 5 minutes
-            current_time = time.time()
-            if current_time - self.last_save_time > 300:
-                self.save_mission_state()
-                self.last_save_time = current_time
-            
-            # Vérifier les objectifs et la complétion
-            self.check_mission_objectives()
-            if self.check_mission_completion():
-                self.is_running = False
-            
-            # Vérifier le temps restant
-            if current_time - self.mission_start_time > self.mission_duration:
-                self.is_running = False
-                self.terminal.historique.append("Temps écoulé - Mission terminée")
+            with profiler.phase("simulation"):
+                self.advance_simulation()
             
             # Mettre à jour l'affichage
-            self.terminal.draw(self.ecran)
+            with profiler.phase("terminal_draw"):
+                self.terminal.draw(self.ecran)
             
         except Exception as e:
             self.logger.error(f"Erreur lors de l'affichage : {e}") 
 
+    def advance_simulation(self):
+        """Exécute les pas de simulation à pas fixe dus depuis le dernier appel"""
+        current_time = self.clock.now()
+        self.simulation_accumulator += current_time - self.last_simulation_time
+        self.last_simulation_time = current_time
+        
+        steps = 0
+        while self.simulation_accumulator >= self.simulation_step and self.is_running:
+            if steps >= MAX_SIMULATION_STEPS:
+                # Retard trop important (pause, frame bloquée) : abandonner le rattrapage
+                self.simulation_accumulator = 0
+                break
+            self.update_simulation()
+            self.simulation_accumulator -= self.simulation_step
+            steps += 1
+        return steps
+
+    def is_busy(self, within):
+        """Indique si la mission doit garder la pleine cadence : scan en cours ou tâche due sous within secondes"""
+        if not self.is_running:
+            return False
+        if self.scan_job is not None:
+            return True
+        next_due = self.scheduler.next_due()
+        return next_due is not None and next_due - self.clock.now() <= within
+
+    def update_simulation(self):
+        """Un pas de logique de mission (tâches échues, objectifs, fin de mission)"""
+        # Exécuter uniquement les tâches programmées arrivées à échéance
+        self.modifiers.expire()
+        self.scheduler.run_due()
+        
+        # Vérifier les objectifs et la complétion
+        self.check_mission_objectives()
+        if self.check_mission_completion():
+            self.is_running = False
+
+    def handle_mission_timeout(self):
+        """Termine la mission lorsque le temps imparti est écoulé"""
+        if self.is_running:
+            self.is_running = False
+            self.save_manager.clear_mission_state()
+            self.terminal.historique.append("Temps écoulé - Mission terminée")
+
     def cmd_download(self, args):
         """Télécharge un fichier ou une base de données"""
         if not args:
@@ -1248,8 +1566,11 @@ class JeuMission:
             file_data = self.current_target.files[filename]
             if file_data["encrypted"] and not self.has_decryption_tool():
                 return ["Erreur: Fichier chiffré - Outil de décryptage requis"]
+            if file_data.get("exfiltrated"):
+                return ["Fichier déjà téléchargé"]
                 
-            self.donnees_volees.append(("file", (file_data["value"], filename)))
+            self.add_stolen_data("file", file_data["value"], filename)
+            self.current_target.set_data_state(filename, exfiltrated=True)
             self.update_alert_level(15)
             return [
                 f"Téléchargement de {filename}",
@@ -1262,8 +1583,11 @@ class JeuMission:
             db_data = self.current_target.databases[filename]
             if db_data["encrypted"] and not self.has_decryption_tool():
                 return ["Erreur: Base de données chiffrée - Outil de décryptage requis"]
+            if db_data.get("exfiltrated"):
+                return ["Base de données déjà extraite"]
                 
-            self.donnees_volees.append(("database", (db_data["value"], filename)))
+            self.add_stolen_data("database", db_data["value"], filename)
+            self.current_target.set_data_state(filename, exfiltrated=True)
             self.update_alert_level(25)
             return [
                 f"Extraction de {filename}",
@@ -1295,6 +1619,7 @@ class JeuMission:
         if self.tool_durability[tool_name] <= 0:
             self.player_data["tools"].remove(tool_name)
             del self.tool_durability[tool_name]
+            self.refresh_modifiers()
             self.terminal.historique.append(f"! Attention ! {tool_name} est hors service")
 
     def cmd_repair(self, args):
@@ -1323,25 +1648,13 @@ class JeuMission:
     def save_mission_state(self):
         """Sauvegarder l'état actuel de la mission"""
         try:
-            mission_state = {
-                "mission_id": self.mission.id,
-                "alert_level": self.alert_level,
-                "detected": self.detected,
-                "systeme_compromis": self.systeme_compromis,
-                "donnees_volees": self.donnees_volees,
-                "botnet_size": self.botnet_size,
-                "encrypted_systems": self.encrypted_systems,
-                "objectifs_completes": self.objectifs_completes,
-                "current_target": self.current_target.id if self.current_target else None,
-                "tool_durability": self.tool_durability,
-                "mission_start_time": self.mission_start_time
-            }
+            mission_state = self.snapshot()
             
             # Mettre à jour les statistiques du joueur
             self.player_data["stats"].update({
                 "alert_level": self.alert_level,
-                "systems_compromised": len([t for t in self.available_targets if self.systeme_compromis]),
-                "data_stolen": len(self.donnees_volees),
+                "systems_compromised": self.loot.compromised_count,
+                "data_stolen": self.loot.count,
                 "botnet_size": self.botnet_size
             })
             
@@ -1361,13 +1674,9 @@ class JeuMission:
             self.logger.error(f"Erreur lors de la sauvegarde : {e}")
             return False
 
-    def check_payload_effects(self):
-        """Vérifie et applique les effets des payloads actifs"""
-        current_time = time.time()
-        if current_time - self.last_payload_check < 60:  # Vérifier toutes les minutes
-            return
-            
-        self.last_payload_check = current_time
+    def process_payload_effects(self):
+        """Applique les effets des payloads actifs (programmé toutes les minutes)"""
+        current_time = self.clock.now()
         
         for target_id, payloads in list(self.active_payloads.items()):
             for payload_type, timestamp in list(payloads.items()):
@@ -1383,13 +1692,13 @@ class JeuMission:
                 # Appliquer les effets
                 if payload_type == "miner":
                     self.player_data["credits"] += effect["credits_rate"]
+                    self.mining_cycles += 1
+                    self.notify_state_change(objectives.MINING)
                 elif payload_type in ["keylogger", "trojan"]:
                     # Chance de voler des données
                     if random.random() < 0.3:  # 30% de chance
                         data_value = effect["data_rate"]
-                        self.donnees_volees.append(
-                            ("automated", (data_value, f"Données {payload_type}"))
-                        )
+                        self.add_stolen_data("automated", data_value, f"Données {payload_type}")
                 
                 # Augmenter le niveau d'alerte
                 self.update_alert_level(effect["detection_rate"] * 0.1)
@@ -1429,6 +1738,7 @@ class JeuMission:
         try:
             self.current_target.security_systems[system]["parameters"][parameter] = value
             self.current_target.security_systems[system]["modified"] = True
+            self.notify_state_change(objectives.TARGET)
             
             # Augmenter l'alerte en fonction du système modifié
             alert_levels = {
@@ -1446,27 +1756,19 @@ class JeuMission:
         except Exception as e:
             return [f"Erreur lors de la modification: {str(e)}"]
 
-    def check_periodic_events(self):
-        """Vérifie et applique les événements périodiques"""
-        current_time = time.time()
-        
-        # Vérifier les revenus du botnet (toutes les minutes)
-        if current_time - self.last_botnet_check > 60:
-            self.process_botnet_income()
-            self.last_botnet_check = current_time
-        
-        # Vérifier la durabilité des outils (toutes les 5 minutes)
-        if current_time - self.last_difficulty_check > 300:
-            self.check_tools_durability()
-            self.last_difficulty_check = current_time
-        
-        # Vérifier les bonus temporaires (toutes les secondes)
-        self.check_active_bonuses()
-        
-        # Vérifier le niveau d'alerte (toutes les 30 secondes)
-        if current_time - self.last_event_check > 30:
-            self.process_alert_effects()
-            self.last_event_check = current_time
+    def schedule_periodic_events(self):
+        """Programme les tâches récurrentes et la fin de la mission"""
+        self.scheduler.schedule_every(60, self.process_botnet_income)  # Revenus du botnet
+        self.scheduler.schedule_every(300, self.check_tools_durability)  # Usure des outils
+        self.scheduler.schedule_every(30, self.process_alert_effects)  # Décroissance de l'alerte
+        self.scheduler.schedule_every(60, self.process_payload_effects)  # Effets des payloads
+        self.scheduler.schedule_every(300, self.save_mission_state)  # Sauvegarde automatique
+        self.scheduler.schedule_at(self.mission_start_time + self.mission_duration,
+                                   self.handle_mission_timeout)
+        # L'objectif de temps bascule une seule fois, aux trois quarts de la durée
+        self.scheduler.schedule_at(self.mission_start_time + self.mission_duration * 0.75,
+                                   lambda: self.notify_state_change(objectives.TIME),
+                                   name="time_objective")
 
     def process_botnet_income(self):
         """Traite les revenus générés par le botnet"""
@@ -1509,16 +1811,12 @@ class JeuMission:
                 if self.tool_durability[tool] <= 0:
                     self.player_data["tools"].remove(tool)
                     del self.tool_durability[tool]
+                    self.refresh_modifiers()
                     self.terminal.historique.append(f"! Attention ! {tool} est hors service")
 
-    def check_active_bonuses(self):
-        """Vérifie et met à jour les bonus temporaires"""
-        current_time = time.time()
-        
-        for bonus_type in self.active_bonuses:
-            # Filtrer les bonus expirés
-            active = [(value, end_time) for value, end_time in self.active_bonuses[bonus_type] if end_time > current_time]
-            self.active_bonuses[bonus_type] = active
+    def add_temporary_bonus(self, bonus_type, value, duration):
+        """Ajoute un bonus temporaire (+value) ; son expiration est gérée par la pile de modificateurs"""
+        return self.modifiers.add_temporary(f"bonus:{bonus_type}", 1 + value, duration)
 
     def process_alert_effects(self):
         """Traite les effets du niveau d'alerte"""
@@ -1534,6 +1832,7 @@ class JeuMission:
                 
             # Appliquer la réduction
             self.alert_level = max(0, self.alert_level - reduction)
+            self.notify_state_change(objectives.ALERT)
             
         # Effets selon le niveau d'alerte
         if self.alert_level >= 90:
@@ -1587,7 +1886,7 @@ class JeuMission:
             # Activer le payload
             if target_id not in self.active_payloads:
                 self.active_payloads[target_id] = {}
-            self.active_payloads[target_id][payload] = time.time()
+            self.active_payloads[target_id][payload] = self.clock.now()
             
             self.update_alert_level(15)
             return [
@@ -1612,7 +1911,7 @@ class JeuMission:
             
             # Calculer les bonus supplémentaires
             stealth_bonus = 1.5 if not self.detected else 1.0  # +50% si non détecté
-            time_bonus = 1.2 if (time.time() - self.mission_start_time) < (self.mission_duration * 0.75) else 1.0  # +20% si rapide
+            time_bonus = 1.2 if (self.clock.now() - self.mission_start_time) < (self.mission_duration * 0.75) else 1.0  # +20% si rapide
             
             # Appliquer le bonus de faction pour ce type de mission
             faction_bonus = FactionBonus.get_mission_bonus(self.player_data["faction"], self.mission.type)
@@ -1625,6 +1924,7 @@ class JeuMission:
             self.player_data["credits"] += final_reward
             self.player_data["completed_missions"].append(self.mission.id)
             self.player_data["level"] += 1
+            self.refresh_modifiers()
             
             # Mettre à jour les statistiques
             self.player_data["stats"].update({
@@ -1632,16 +1932,17 @@ class JeuMission:
                 "total_earnings": self.player_data["stats"].get("total_earnings", 0) + final_reward,
                 "successful_hacks": self.player_data["stats"].get("successful_hacks", 0) + 1 if self.systeme_compromis else 0,
                 "stealth_missions": self.player_data["stats"].get("stealth_missions", 0) + 1 if not self.detected else 0,
-                "data_stolen_value": self.player_data["stats"].get("data_stolen_value", 0) + sum(value for _, (value, _) in self.donnees_volees),
+                "data_stolen_value": self.player_data["stats"].get("data_stolen_value", 0) + self.loot.total_value,
                 "largest_botnet": max(self.player_data["stats"].get("largest_botnet", 0), self.botnet_size),
-                "total_ransom": self.player_data["stats"].get("total_ransom", 0) + self.total_ransom
+                "total_ransom": self.player_data["stats"].get("total_ransom", 0) + self.loot.ransom_total
             })
             
             # Débloquer des récompenses selon le niveau
             if self.player_data["level"] % 5 == 0:  # Tous les 5 niveaux
                 self.unlock_level_rewards()
             
-            # Sauvegarder l'état
+            # Sauvegarder l'état (la session terminée ne peut plus être reprise)
+            self.save_manager.clear_mission_state()
             self.save_manager.save_player_data(
                 self.player_data["faction"],
                 self.player_data["level"],
@@ -1663,10 +1964,10 @@ class JeuMission:
                 f"Récompense finale : {final_reward}¢",
                 "",
                 "=== Statistiques de Mission ===",
-                f"Données volées : {len(self.donnees_volees)}",
+                f"Données volées : {self.loot.count}",
                 f"Niveau d'alerte final : {self.alert_level}%",
                 f"Taille du botnet : {self.botnet_size}",
-                f"Systèmes compromis : {len([t for t in self.available_targets if self.systeme_compromis])}",
+                f"Systèmes compromis : {self.loot.compromised_count}",
                 "",
                 "=== Progression ===",
                 f"Niveau atteint : {self.player_data['level']}",
@@ -1693,6 +1994,7 @@ class JeuMission:
             new_tool = self.get_level_tool(level)
             if new_tool:
                 self.player_data["tools"].append(new_tool)
+                self.refresh_modifiers()
                 rewards.append(f"Nouvel outil débloqué : {new_tool}")
             
             # Améliorer le hardware
@@ -1760,7 +2062,7 @@ class JeuMission:
             ]
             
         vuln = " ".join(args)
-        if vuln not in self.current_target.vulnerabilities:
+        if not self.current_target.has_vulnerability(vuln):
             return ["Vulnérabilité non trouvée"]
             
         # Chance de succès basée sur les outils et le niveau de sécurité
@@ -1772,11 +2074,13 @@ class JeuMission:
         
         if random.random() < final_chance:
             self.systeme_compromis = True
+            self.loot.add_compromised(self.current_target.id)
+            self.notify_state_change(objectives.COMPROMISED)
             self.update_alert_level(15)  # Exploit ciblé génère moins d'alerte
             
             # Ajouter des effets spéciaux selon la vulnérabilité
             if vuln == "SQL Injection":
-                self.donnees_volees.append(("database", (1000, "Base de données compromise")))
+                self.add_stolen_data("database", 1000, "Base de données compromise")
             elif vuln == "Weak Password":
                 self.update_alert_level(-5)
             elif vuln == "Default Password":
@@ -1787,6 +2091,7 @@ class JeuMission:
                 self.player_data["credits"] += 500
             elif vuln == "SCADA Exploit":
                 self.current_target.security_systems["production"] = {"modified": True}
+                self.notify_state_change(objectives.TARGET)
             elif vuln == "RDP Exploit":
                 self.update_alert_level(20)
             elif vuln == "Service Misconfiguration":
@@ -1794,19 +2099,20 @@ class JeuMission:
             elif vuln == "Container Escape":
                 self.update_alert_level(25)
             elif vuln == "API Misconfiguration":
-                self.donnees_volees.append(("api", (800, "Données API")))
+                self.add_stolen_data("api", 800, "Données API")
             elif vuln == "Backup System Flaw":
-                self.donnees_volees.append(("backup", (1200, "Données de backup")))
+                self.add_stolen_data("backup", 1200, "Données de backup")
             elif vuln == "Admin Access Exploit":
                 self.update_alert_level(35)
             elif vuln == "SMB Exploit":
-                self.donnees_volees.append(("files", (600, "Fichiers partagés")))
+                self.add_stolen_data("files", 600, "Fichiers partagés")
             elif vuln == "Weak Backup Protocol":
-                self.donnees_volees.append(("backup", (900, "Données de sauvegarde")))
+                self.add_stolen_data("backup", 900, "Données de sauvegarde")
             elif vuln == "SNMP Exploit":
                 self.update_alert_level(15)
             elif vuln == "Control System Bypass":
                 self.current_target.security_systems["control"] = {"modified": True}
+                self.notify_state_change(objectives.TARGET)
             
             return [
                 f"Exploitation de {vuln} réussie !",
@@ -1848,16 +2154,16 @@ class JeuMission:
         results.extend([
             "",
             "=== Progression ===",
-            f"Temps écoulé: {int((time.time() - self.mission_start_time) / 60)}min",
-            f"Temps restant: {int((self.mission_duration - (time.time() - self.mission_start_time)) / 60)}min",
+            f"Temps écoulé: {int((self.clock.now() - self.mission_start_time) / 60)}min",
+            f"Temps restant: {int((self.mission_duration - (self.clock.now() - self.mission_start_time)) / 60)}min",
             f"Niveau d'alerte: {self.alert_level}%",
             f"Détection: {'Oui' if self.detected else 'Non'}",
             "",
             "=== Statistiques ===",
-            f"Données volées: {len(self.donnees_volees)}",
-            f"Systèmes compromis: {len([t for t in self.available_targets if self.systeme_compromis])}",
+            f"Données volées: {self.loot.count}",
+            f"Systèmes compromis: {self.loot.compromised_count}",
             f"Taille du botnet: {self.botnet_size}",
-            f"Rançons collectées: {self.total_ransom}¢"
+            f"Rançons collectées: {self.loot.ransom_total}¢"
         ])
         
         return results
@@ -1916,11 +2222,11 @@ class JeuMission:
             # Analyser les différentes sources de traces
             if self.systeme_compromis:
                 results.append("- Système compromis (Risque élevé)")
-            if self.donnees_volees:
+            if self.loot.count:
                 results.append("- Données exfiltrées (Risque moyen)")
             if self.botnet_size > 0:
                 results.append("- Activité botnet (Risque continu)")
-            if any(sys["paid"] for sys in self.encrypted_systems.values()):
+            if self.loot.ransom_count > 0:
                 results.append("- Ransomware actif (Risque critique)")
                 
             # Ajouter les bonus de furtivité actifs
@@ -1952,33 +2258,27 @@ class JeuMission:
         return ["Action inconnue"]
 
     def calculate_hardware_bonus(self, hardware_type):
-        """Calcule le bonus donné par le hardware"""
+        """Bonus donné par le hardware, faction et bonus temporaires compris"""
         if hardware_type not in self.hardware_stats:
             return 1.0
-            
-        stats = self.hardware_stats[hardware_type]
-        base_bonus = stats["bonus"]
-        level_multiplier = stats["level"]
-        
-        # Calculer le bonus total
-        total_bonus = 1.0 + (base_bonus * level_multiplier)
-        
-        # Appliquer les modificateurs de faction
+        return self.get_modifier(f"hardware:{hardware_type}") * self.modifiers.multiplier(f"bonus:{hardware_type}")
+
+    def _hardware_factor(self, hardware_type):
+        """Facteur de base d'un composant hardware selon son niveau"""
+        stats = self.hardware_stats.get(hardware_type)
+        if not stats:
+            return 1.0
+        return 1.0 + (stats["bonus"] * stats["level"])
+
+    def _hardware_faction_factor(self, hardware_type):
+        """Modificateur de faction appliqué à un composant hardware"""
         if hardware_type == "cpu" and self.player_data["faction"] == Faction.FORGEURS:
-            total_bonus *= 1.2  # +20% pour les Forgeurs
+            return 1.2  # +20% pour les Forgeurs
         elif hardware_type == "network" and self.player_data["faction"] == Faction.SPECTRES:
-            total_bonus *= 1.2  # +20% pour les Spectres
+            return 1.2  # +20% pour les Spectres
         elif hardware_type == "cooling" and self.player_data["faction"] == Faction.VEILLEURS:
-            total_bonus *= 1.2  # +20% pour les Veilleurs
-            
-        # Appliquer les bonus temporaires actifs
-        current_time = time.time()
-        if hardware_type in self.active_bonuses:
-            for bonus_value, end_time in self.active_bonuses[hardware_type]:
-                if end_time > current_time:
-                    total_bonus *= (1 + bonus_value)
-                    
-        return total_bonus
+            return 1.2  # +20% pour les Veilleurs
+        return 1.0
 
     def apply_faction_bonus(self, action_type):
         """Applique les bonus de faction selon le type d'action"""
@@ -2008,100 +2308,6 @@ class JeuMission:
         
         return bonus * level_bonus
 
-class Target:
-    def __init__(self, id, name, type, security_level, ip, vulnerabilities, ports, data_value, description, security_systems):
-        self.id = id
-        self.name = name
-        self.type = type
-        self.security_level = security_level
-        self.ip = ip
-        self.vulnerabilities = vulnerabilities
-        self.ports = ports
-        self.data_value = data_value
-        self.description = description
-        self.security_systems = security_systems
-        
-        # Initialiser les données spécifiques au type
-        self._init_type_specific_data()
-
-    def _init_type_specific_data(self):
-        """Initialise les données spécifiques au type de cible"""
-        if self.type == TargetType.CORPORATE:
-            self.databases = {
-                "users.db": {"size": "2.3GB", "value": 1500, "encrypted": True},
-                "financial.db": {"size": "1.8GB", "value": 2500, "encrypted": True},
-                "emails.db": {"size": "3.1GB", "value": 1000, "encrypted": False}
-            }
-            self.files = {
-                "passwords.txt": {"size": "156KB", "value": 800, "encrypted": False},
-                "contracts.pdf": {"size": "2.1GB", "value": 1200, "encrypted": True},
-                "employee_data.xlsx": {"size": "250MB", "value": 1500, "encrypted": False}
-            }
-        elif self.type == TargetType.BANK:
-            self.databases = {
-                "transactions.db": {"size": "5.0GB", "value": 5000, "encrypted": True},
-                "accounts.db": {"size": "3.2GB", "value": 4000, "encrypted": True},
-                "audit_logs.db": {"size": "1.5GB", "value": 2000, "encrypted": True}
-            }
-            self.files = {
-                "swift_codes.txt": {"size": "50KB", "value": 3000, "encrypted": True},
-                "trading_algo.py": {"size": "1.2MB", "value": 5000, "encrypted": True}
-            }
-        elif self.type == TargetType.RESEARCH:
-            self.databases = {
-                "research_data.db": {"size": "8.5GB", "value": 5000, "encrypted": True},
-                "experiments.db": {"size": "3.2GB", "value": 2500, "encrypted": True},
-                "prototypes.db": {"size": "2.1GB", "value": 4000, "encrypted": True}
-            }
-            self.files = {
-                "research_notes.pdf": {"size": "450MB", "value": 3000, "encrypted": True},
-                "prototype_specs.dwg": {"size": "250MB", "value": 4000, "encrypted": True},
-                "test_results.xlsx": {"size": "180MB", "value": 2000, "encrypted": False}
-            }
-        elif self.type == TargetType.INFRASTRUCTURE:
-            self.databases = {
-                "network_config.db": {"size": "1.2GB", "value": 2000, "encrypted": True},
-                "monitoring.db": {"size": "4.5GB", "value": 1500, "encrypted": False},
-                "security_logs.db": {"size": "3.0GB", "value": 1800, "encrypted": True}
-            }
-            self.files = {
-                "access_codes.txt": {"size": "42KB", "value": 2500, "encrypted": True},
-                "network_map.pdf": {"size": "15MB", "value": 1000, "encrypted": False},
-                "security_policy.doc": {"size": "2.5MB", "value": 800, "encrypted": False}
-            }
-        else:  # Type par défaut
-            self.databases = {
-                "system.db": {"size": "1.0GB", "value": 500, "encrypted": False},
-                "backup.db": {"size": "2.0GB", "value": 800, "encrypted": True}
-            }
-            self.files = {
-                "config.txt": {"size": "128KB", "value": 200, "encrypted": False},
-                "logs.txt": {"size": "500MB", "value": 300, "encrypted": False}
-            }
-
-    def get_available_files(self):
-        """Retourne la liste des fichiers disponibles"""
-        return [
-            f"{name} ({data['size']}) - {data['encrypted'] and '🔒' or '📄'}"
-            for name, data in self.files.items()
-        ]
-
-    def get_available_databases(self):
-        """Retourne la liste des bases de données disponibles"""
-        return [
-            f"{name} ({data['size']}) - {data['encrypted'] and '🔒' or '🗃️'}"
-            for name, data in self.databases.items()
-        ] 
-
-    def get_total_data_value(self):
-        """Calcule la valeur totale des données disponibles"""
-        total = 0
-        for data in self.databases.values():
-            total += data["value"]
-        for data in self.files.values():
-            total += data["value"]
-        return total 
-
 class FactionBonus:
     """Gestion des bonus de faction"""
     @staticmethod
@@ -1,26 +1,65 @@
+import atexit
 import logging
-from pathlib import Path
+import logging.handlers
+import queue
+from config import LOG_BACKUP_COUNT, LOG_MAX_BYTES
+from paths import LOGS_DIR
+
+LOG_FILE = LOGS_DIR / "game.log"
+
+_listener = None  # Thread d'écriture des logs, démarré au premier appel
+_queue_handler = None
 
 def setup_logger():
+    """Retourne le logger du jeu, configuré une seule fois quel que soit le nombre d'appels.
+
+    Les enregistrements passent par une file : l'écriture dans le fichier (avec
+    rotation par taille) et sur la console se fait sur un thread dédié et ne
+    bloque jamais la boucle de rendu.
+    """
+    global _listener, _queue_handler
     logger = logging.getLogger('cyberhack')
+    if _listener is not None:
+        return logger
     logger.setLevel(logging.DEBUG)
-    
-    # Handler fichier
-    fh = logging.FileHandler('logs/game.log')
+
+    # Handler fichier, avec rotation
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fh = logging.handlers.RotatingFileHandler(
+        LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+    )
     fh.setLevel(logging.DEBUG)
-    
+
     # Handler console
     ch = logging.StreamHandler()
     ch.setLevel(logging.INFO)
-    
+
     # Formatter
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     fh.setFormatter(formatter)
     ch.setFormatter(formatter)
-    
-    logger.addHandler(fh)
-    logger.addHandler(ch)
-    
-    return logger 
\ No newline at end of file
+
+    # Le thread appelant ne fait que déposer l'enregistrement dans la file
+    log_queue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(_queue_handler)
+    _listener = logging.handlers.QueueListener(log_queue, fh, ch, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logger)
+
+    return logger
+
+def shutdown_logger():
+    """Écrit les enregistrements en attente puis arrête le thread des logs"""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    logger = logging.getLogger('cyberhack')
+    logger.removeHandler(_queue_handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+    _queue_handler = None
@@ -0,0 +1,74 @@
+from collections import deque
+from config import LOOT_HISTORY_SIZE
+
+class LootLedger:
+    """Registre du butin de la mission : totaux courants et derniers éléments volés.
+
+    Les agrégats (nombre, valeur totale, valeur par catégorie, rançons payées,
+    systèmes compromis) sont mis à jour à chaque ajout et consultables en O(1) ;
+    seul un historique borné des éléments est conservé.
+    """
+
+    def __init__(self, history_size=LOOT_HISTORY_SIZE):
+        self.count = 0
+        self.total_value = 0
+        self.by_category = {}  # {type de donnée: valeur}
+        self.recent = deque(maxlen=history_size)  # [(type, valeur, nom)]
+        self.ransom_total = 0
+        self.ransom_count = 0
+        self.compromised = set()  # IDs des systèmes compromis
+
+    def add(self, data_type, value, name):
+        """Enregistre une donnée volée"""
+        self.count += 1
+        self.total_value += value
+        self.by_category[data_type] = self.by_category.get(data_type, 0) + value
+        self.recent.append((data_type, value, name))
+
+    def clear_data(self):
+        """Vide les données volées (après revente) ; rançons et systèmes sont conservés"""
+        self.count = 0
+        self.total_value = 0
+        self.by_category.clear()
+        self.recent.clear()
+
+    def add_ransom(self, amount):
+        """Enregistre une rançon payée"""
+        self.ransom_total += amount
+        self.ransom_count += 1
+
+    def add_compromised(self, target_id):
+        """Enregistre un système compromis"""
+        self.compromised.add(target_id)
+
+    @property
+    def compromised_count(self):
+        return len(self.compromised)
+
+    def __len__(self):
+        return self.count
+
+    def to_dict(self):
+        """Forme compacte sérialisable (JSON)"""
+        return {
+            "count": self.count,
+            "total_value": self.total_value,
+            "by_category": dict(self.by_category),
+            "recent": [list(item) for item in self.recent],
+            "ransom_total": self.ransom_total,
+            "ransom_count": self.ransom_count,
+            "compromised": sorted(self.compromised)
+        }
+
+    @classmethod
+    def from_dict(cls, data, history_size=LOOT_HISTORY_SIZE):
+        """Reconstruit un registre à partir de to_dict()"""
+        ledger = cls(history_size)
+        ledger.count = data.get("count", 0)
+        ledger.total_value = data.get("total_value", 0)
+        ledger.by_category = dict(data.get("by_category", {}))
+        ledger.recent.extend(tuple(item) for item in data.get("recent", []))
+        ledger.ransom_total = data.get("ransom_total", 0)
+        ledger.ransom_count = data.get("ransom_count", 0)
+        ledger.compromised = set(data.get("compromised", []))
+        return ledger
@@ -6,13 +6,19 @@ from missions import Mission, MissionType, Faction
 from mission_manager import MissionManager
 from gameplay import JeuMission
 from save_manager import SaveManager
+from save_writer import get_save_writer
 from shop import Shop
 from desktop import Desktop
-from logger import setup_logger
+from logger import setup_logger, shutdown_logger
 from constants import GameState, TICK_RATE
-from paths import ASSETS_DIR, SAVES_DIR
+from paths import ASSETS_DIR, SAVES_DIR, LOGS_DIR
 from exceptions import GameError
 from messages import SystemeMessage
+from fonts import get_font, preload_fonts, clear_fonts
+from ui_constants import DEFAULT_FONT_SIZE, TERMINAL_FONT_FACE
+from game_settings import GameSettings
+from profiler import get_profiler
+from frame_scheduler import FrameScheduler
 
 # Initialisation
 pygame.init()
@@ -30,14 +36,21 @@ VERT_FONCE = (0, 180, 0)
 NOIR = (0, 0, 0)
 BLANC = (255, 255, 255)
 
-# Polices
-police_titre = pygame.font.Font(None, 72)
-police_menu = pygame.font.Font(None, 36)
-police_ascii = pygame.font.Font(None, 24)
-
 # Initialiser le logger
 logger = setup_logger()
 
+# Polices (chargées une seule fois et partagées par toutes les fenêtres)
+temps_polices = preload_fonts([
+    (72,),
+    (36,),
+    (DEFAULT_FONT_SIZE,),
+    (DEFAULT_FONT_SIZE, TERMINAL_FONT_FACE)
+])
+logger.info(f"Polices chargées en {temps_polices * 1000:.1f}ms")
+police_titre = get_font(72)
+police_menu = get_font(36)
+police_ascii = get_font(DEFAULT_FONT_SIZE)
+
 class EffetGlitch:
     def __init__(self):
         self.derniere_mise_a_jour = time.time()
@@ -144,6 +157,7 @@ class MenuPrincipal:
             self.shop_message = None
             self.shop_message_timer = 0
             self.desktop = None  # Pour stocker l'instance du bureau
+            self.frame_scheduler = FrameScheduler()
         except GameError as e:
             logger.error(f"Erreur d'initialisation: {e}")
             sys.exit(1)
@@ -157,7 +171,8 @@ class MenuPrincipal:
     def afficher(self, surface):
         if self.ecran_actuel == "gameplay" and self.jeu_mission:
             self.jeu_mission.afficher()
-        else:
+            return
+        with get_profiler().phase("menu_draw"):
             if self.ecran_actuel == "menu":
                 self.afficher_menu_principal(surface)
             elif self.ecran_actuel == "factions":
@@ -367,9 +382,15 @@ class MenuPrincipal:
             self.logger.error(f"Erreur initialisation bureau: {e}")
             return False
     
+    def est_anime(self):
+        """Indique si un message temporaire est affiché (la cadence doit rester pleine)"""
+        return bool(self.shop_message) and time.time() - self.shop_message_timer < 2
+
     def gerer_evenements(self):
         try:
-            for event in pygame.event.get():
+            evenements = pygame.event.get()
+            self.frame_scheduler.notify_events(evenements)
+            for event in evenements:
                 if event.type == pygame.QUIT:
                     return False
                 
@@ -427,7 +448,12 @@ class MenuPrincipal:
                     elif self.ecran_actuel == "missions":
                         if event.key == pygame.K_RETURN and self.missions_disponibles:
                             mission = self.missions_disponibles[self.selection]
-                            self.jeu_mission = JeuMission(mission, self.ecran, self.save_manager)
+                            # Reprendre la session sauvegardée de cette mission s'il y en a une
+                            state = self.save_manager.load_mission_state(mission.id)
+                            if state:
+                                self.jeu_mission = JeuMission.restore(state, mission, self.ecran, self.save_manager)
+                            else:
+                                self.jeu_mission = JeuMission(mission, self.ecran, self.save_manager)
                             self.ecran_actuel = "gameplay"
                         elif event.key == pygame.K_UP:
                             self.selection = (self.selection - 1) % len(self.missions_disponibles)
@@ -529,17 +555,24 @@ class MenuPrincipal:
 
 def main():
     logger = setup_logger()
+    settings = GameSettings.load()
+    profiler = get_profiler()
+    profiler.enabled = settings.SHOW_FPS
     try:
-        clock = pygame.time.Clock()
         menu = MenuPrincipal()
         
         en_cours = True
         while en_cours:
             try:
-                en_cours = menu.gerer_evenements()
+                profiler.begin_frame()
+                with profiler.phase("events"):
+                    en_cours = menu.gerer_evenements()
                 menu.afficher(ecran)
-                pygame.display.flip()
-                clock.tick(60)
+                profiler.draw(ecran)
+                with profiler.phase("flip"):
+                    pygame.display.flip()
+                profiler.end_frame()
+                menu.frame_scheduler.tick(busy=menu.est_anime())
             except Exception as e:
                 logger.error(f"Erreur dans la boucle principale: {e}")
                 en_cours = False
@@ -547,6 +580,11 @@ def main():
     except Exception as e:
         logger.critical(f"Erreur fatale: {e}")
     finally:
+        if profiler.enabled and settings.PROFILER_CSV:
+            profiler.dump_csv(LOGS_DIR / "frame_profile.csv")
+        get_save_writer().close()  # Terminer les sauvegardes en attente
+        shutdown_logger()  # Écrire les logs en attente
+        clear_fonts()
         pygame.quit()
         sys.exit()
 
@@ -13,7 +13,7 @@ class Faction(Enum):
     VEILLEURS = "Veilleurs"
 
 class Mission:
-    def __init__(self, id, titre, type, difficulte, recompense, objectifs, objectifs_secondaires=None):
+    def __init__(self, id, titre, type, difficulte, recompense, objectifs, objectifs_secondaires=None, reseau=None):
         self.id = id
         self.titre = titre
         self.type = type
@@ -21,6 +21,7 @@ class Mission:
         self.recompense = recompense
         self.objectifs = objectifs
         self.objectifs_secondaires = objectifs_secondaires or []
+        self.reseau = reseau  # Mode grand réseau : {"subnets": n, "hosts_per_subnet": m}
         self.completed = False
 
     @staticmethod
@@ -95,6 +96,25 @@ class Mission:
                     "Générer 1000¢ avec le minage"
                 ]
             },
+            "botnet_2": {
+                "id": "BOT_002",
+                "titre": "Réseau Tentaculaire",
+                "type": MissionType.BOTNET,
+                "difficulte": 4,
+                "recompense": 4500,
+                "objectifs": [
+                    "Construire un botnet de 5 machines",
+                    "Maintenir l'alerte sous 80%",
+                    "Miner de la crypto pendant 3 cycles"
+                ],
+                "objectifs_secondaires": [
+                    "Atteindre 8 machines",
+                    "Rester non détecté pendant 5 minutes",
+                    "Générer 1000¢ avec le minage"
+                ],
+                # 8192 hôtes répartis en 256 sous-réseaux, générés à la demande
+                "reseau": {"subnets": 256, "hosts_per_subnet": 32}
+            },
             "sabotage_1": {
                 "id": "SAB_001",
                 "titre": "Sabotage Industriel",
@@ -129,7 +149,8 @@ class Mission:
             difficulte=template["difficulte"],
             recompense=template["recompense"],
             objectifs=template["objectifs"],
-            objectifs_secondaires=template.get("objectifs_secondaires")
+            objectifs_secondaires=template.get("objectifs_secondaires"),
+            reseau=template.get("reseau")
         )
 
     def get_difficulty_description(self):
@@ -0,0 +1,76 @@
+import heapq
+import itertools
+
+class ModifierStack:
+    """Pile de modificateurs multiplicatifs par catégorie.
+
+    Les modificateurs permanents sont indexés par source (outils, faction, hardware),
+    les temporaires expirent via un tas min. Le multiplicateur agrégé de chaque
+    catégorie est mis en cache et invalidé uniquement à l'ajout ou à l'expiration.
+    """
+
+    def __init__(self, clock):
+        self.clock = clock
+        self._permanent = {}  # {catégorie: {source: facteur}}
+        self._temporary = {}  # {catégorie: {id: (facteur, fin)}}
+        self._expiry_heap = []  # [(fin, id, catégorie)]
+        self._cache = {}  # {catégorie: multiplicateur agrégé}
+        self._ids = itertools.count()
+
+    def set(self, category, source, factor):
+        """Définit (ou remplace) le facteur permanent d'une source"""
+        self._permanent.setdefault(category, {})[source] = factor
+        self._cache.pop(category, None)
+
+    def has(self, category):
+        """Indique si la catégorie possède des modificateurs permanents"""
+        return category in self._permanent
+
+    def categories(self):
+        """Catégories possédant des modificateurs permanents"""
+        return list(self._permanent)
+
+    def add_temporary(self, category, factor, duration):
+        """Ajoute un facteur temporaire et retourne son identifiant"""
+        modifier_id = next(self._ids)
+        end_time = self.clock.now() + duration
+        self._temporary.setdefault(category, {})[modifier_id] = (factor, end_time)
+        heapq.heappush(self._expiry_heap, (end_time, modifier_id, category))
+        self._cache.pop(category, None)
+        return modifier_id
+
+    def expire(self, now=None):
+        """Retire les modificateurs temporaires échus et retourne leur nombre"""
+        now = self.clock.now() if now is None else now
+        expired = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, modifier_id, category = heapq.heappop(self._expiry_heap)
+            modifiers = self._temporary.get(category, {})
+            if modifiers.pop(modifier_id, None) is not None:
+                expired += 1
+                self._cache.pop(category, None)
+                if not modifiers:
+                    del self._temporary[category]
+        return expired
+
+    def multiplier(self, category):
+        """Multiplicateur agrégé d'une catégorie (1.0 si aucun modificateur)"""
+        cached = self._cache.get(category)
+        if cached is not None:
+            return cached
+        total = 1.0
+        for factor in self._permanent.get(category, {}).values():
+            total *= factor
+        for factor, _ in self._temporary.get(category, {}).values():
+            total *= factor
+        self._cache[category] = total
+        return total
+
+    def temporary(self):
+        """Modificateurs temporaires actifs : [(catégorie, facteur, fin)], par ordre d'expiration"""
+        active = [
+            (category, factor, end_time)
+            for category, modifiers in self._temporary.items()
+            for factor, end_time in modifiers.values()
+        ]
+        return sorted(active, key=lambda item: item[2])
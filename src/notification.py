@@ -1,5 +1,7 @@
 import pygame
 from config import COLORS
+from fonts import get_font
+from ui_constants import DEFAULT_FONT_SIZE
 
 class Notification:
     def __init__(self, message, type="info"):
@@ -7,8 +9,17 @@ class Notification:
         self.type = type
         self.duration = 3000  # 3 secondes
         self.start_time = pygame.time.get_ticks()
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(DEFAULT_FONT_SIZE)
         
+    def is_expired(self):
+        """Indique si la notification a fini de s'afficher"""
+        return pygame.time.get_ticks() - self.start_time >= self.duration
+
+    def get_rect(self, screen_width):
+        """Retourne la zone occupée par la notification à l'écran"""
+        width, height = self.font.size(self.message)
+        return pygame.Rect((screen_width - width) // 2, 10, width, height)
+
     def draw(self, screen):
         current_time = pygame.time.get_ticks()
         if current_time - self.start_time < self.duration:
@@ -0,0 +1,135 @@
+from missions import MissionType
+
+# Dépendances d'état notifiées par JeuMission.notify_state_change
+ALERT = "alert_level"
+DETECTED = "detected"
+COMPROMISED = "compromised"
+STOLEN_DATA = "stolen_data"
+BOTNET = "botnet"
+ENCRYPTED = "encrypted_systems"
+TARGET = "target"  # Cible courante ou ses systèmes de sécurité
+MINING = "mining"
+TIME = "time"
+
+class Objective:
+    """Objectif compilé : prédicat sur l'état de la mission et dépendances déclarées"""
+
+    def __init__(self, label, predicate, depends_on):
+        self.label = label
+        self.predicate = predicate  # predicate(jeu) -> bool
+        self.depends_on = frozenset(depends_on)
+        self.completed = False
+
+    def evaluate(self, jeu):
+        """Réévalue le prédicat et indique si l'état a changé"""
+        completed = bool(self.predicate(jeu))
+        changed = completed != self.completed
+        self.completed = completed
+        return changed
+
+class ObjectiveTracker:
+    """Réévalue uniquement les objectifs dont une dépendance a changé"""
+
+    def __init__(self, primary, secondary):
+        self.primary = primary
+        self.secondary = secondary
+        self._dependents = {}  # {dépendance: [objectifs]}
+        for objective in primary + secondary:
+            for dependency in objective.depends_on:
+                self._dependents.setdefault(dependency, []).append(objective)
+        self._dirty = set(primary + secondary)  # Évaluation initiale
+
+    def notify(self, *dependencies):
+        """Signale un changement d'état ; les objectifs concernés seront réévalués"""
+        for dependency in dependencies:
+            self._dirty.update(self._dependents.get(dependency, ()))
+
+    def evaluate(self, jeu):
+        """Réévalue les objectifs marqués et indique si l'un d'eux a changé"""
+        if not self._dirty:
+            return False
+        dirty, self._dirty = self._dirty, set()
+        changed = False
+        for objective in dirty:
+            changed |= objective.evaluate(jeu)
+        return changed
+
+    def primary_status(self):
+        """État des objectifs principaux, dans l'ordre de la mission"""
+        return [objective.completed for objective in self.primary]
+
+    def secondary_status(self):
+        """[(libellé, complété)] des objectifs secondaires"""
+        return [(objective.label, objective.completed) for objective in self.secondary]
+
+def _target_modified(jeu):
+    if not jeu.current_target:
+        return False
+    return any(sys.get("modified", False) for sys in jeu.current_target.security_systems.values()
+               if isinstance(sys, dict))
+
+def _critical_compromised(jeu):
+    critical_systems = ["IND_001"]  # IDs des systèmes critiques
+    return jeu.systeme_compromis and any(t.id in critical_systems for t in jeu.available_targets)
+
+# Prédicats des objectifs principaux par type de mission : [(prédicat, dépendances)].
+# Indexés par nom de membre : l'énumération peut être importée sous deux chemins
+# (missions / src.missions), qui donnent deux classes distinctes.
+_PRIMARY = {
+    MissionType.INFILTRATION.name: [
+        (lambda jeu: jeu.systeme_compromis, [COMPROMISED]),
+        (lambda jeu: jeu.loot.count > 0, [STOLEN_DATA]),
+        (lambda jeu: jeu.alert_level < 50, [ALERT]),
+    ],
+    MissionType.DATA_THEFT.name: [
+        (lambda jeu: jeu.systeme_compromis, [COMPROMISED]),
+        (lambda jeu: jeu.loot.total_value >= 2000, [STOLEN_DATA]),  # Seuil minimum
+        (lambda jeu: not jeu.detected, [DETECTED]),
+    ],
+    MissionType.RANSOMWARE.name: [
+        (lambda jeu: jeu.loot.ransom_count > 0, [ENCRYPTED]),
+        (lambda jeu: jeu.loot.ransom_total >= 3000, [ENCRYPTED]),  # Seuil minimum
+        (lambda jeu: len(jeu.encrypted_systems) >= 2, [ENCRYPTED]),  # Au moins 2 systèmes
+    ],
+    MissionType.BOTNET.name: [
+        (lambda jeu: jeu.botnet_size >= 5, [BOTNET]),
+        (lambda jeu: jeu.alert_level < 80, [ALERT]),
+        (lambda jeu: jeu.mining_cycles >= 3, [MINING]),
+    ],
+    MissionType.SABOTAGE.name: [
+        (_critical_compromised, [COMPROMISED]),
+        (lambda jeu: jeu.alert_level < 70, [ALERT]),
+        (_target_modified, [TARGET]),
+    ],
+}
+
+# Objectifs secondaires reconnus par mot-clé (le premier qui correspond l'emporte)
+_SECONDARY = [
+    ("non détecté", lambda jeu: not jeu.detected, [DETECTED]),
+    ("temps", lambda jeu: (jeu.clock.now() - jeu.mission_start_time) < (jeu.mission_duration * 0.75), [TIME]),
+    ("botnet", lambda jeu: jeu.botnet_size >= 3, [BOTNET]),
+    ("données", lambda jeu: jeu.loot.total_value >= 5000, [STOLEN_DATA]),
+    ("furtif", lambda jeu: jeu.alert_level < 30, [ALERT]),
+    ("ransomware", lambda jeu: len(jeu.encrypted_systems) >= 2, [ENCRYPTED]),
+    ("modification", _target_modified, [TARGET]),
+]
+
+def _compile_secondary(label):
+    lowered = label.lower()
+    for keyword, predicate, dependencies in _SECONDARY:
+        if keyword in lowered:
+            return Objective(label, predicate, dependencies)
+    return Objective(label, lambda jeu: False, [])  # Objectif non suivi
+
+def compile_objectives(mission):
+    """Compile une fois pour toutes les objectifs d'une mission"""
+    try:
+        predicates = _PRIMARY[mission.type.name]
+    except KeyError:
+        raise ValueError(f"Type de mission sans objectifs principaux: {mission.type}")
+    primary = []
+    for i, label in enumerate(mission.objectifs):
+        predicate, dependencies = predicates[i] if i < len(predicates) else (lambda jeu: False, [])
+        primary.append(Objective(label, predicate, dependencies))
+    secondary = [_compile_secondary(label) for label in getattr(mission, "objectifs_secondaires", [])]
+    return ObjectiveTracker(primary, secondary)
@@ -0,0 +1,192 @@
+class FrozenDict(dict):
+    """Dictionnaire en lecture seule des instantanés (reste sérialisable en JSON)"""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Instantané immuable")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    update = setdefault = pop = popitem = clear = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+def _freeze(value):
+    if isinstance(value, (TrackedDict, TrackedList)):
+        return value.freeze()
+    if isinstance(value, dict):
+        return FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _track(value, parent):
+    """Enveloppe dictionnaires et listes pour que leurs modifications remontent au parent"""
+    if isinstance(value, (TrackedDict, TrackedList)) and value._parent is parent:
+        return value
+    if isinstance(value, dict):
+        return TrackedDict(value, parent)
+    if isinstance(value, list):
+        return TrackedList(value, parent)
+    return value
+
+class TrackedDict(dict):
+    """Dictionnaire qui invalide son instantané (et ceux de ses parents) à chaque modification"""
+
+    __slots__ = ("_parent", "_frozen")
+
+    def __init__(self, data=(), parent=None):
+        super().__init__()
+        self._parent = parent
+        self._frozen = None  # Dernier instantané, partagé tant que rien ne change
+        for key, value in dict(data).items():
+            dict.__setitem__(self, key, _track(value, self))
+
+    def _changed(self):
+        # Si l'instantané est déjà invalidé, ceux des parents le sont aussi
+        if self._frozen is not None:
+            self._frozen = None
+            if self._parent is not None:
+                self._parent._changed()
+
+    def freeze(self):
+        """Vue immuable ; les sous-structures inchangées sont partagées avec l'instantané précédent"""
+        if self._frozen is None:
+            self._frozen = FrozenDict((key, _freeze(value)) for key, value in self.items())
+        return self._frozen
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, _track(value, self))
+        self._changed()
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._changed()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            dict.__setitem__(self, key, _track(value, self))
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def pop(self, key, *default):
+        value = dict.pop(self, key, *default)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = dict.popitem(self)
+        self._changed()
+        return item
+
+    def clear(self):
+        dict.clear(self)
+        self._changed()
+
+    def __reduce__(self):
+        return (TrackedDict, (dict(self),))
+
+class TrackedList(list):
+    """Liste qui invalide son instantané (et ceux de ses parents) à chaque modification"""
+
+    __slots__ = ("_parent", "_frozen")
+
+    def __init__(self, data=(), parent=None):
+        super().__init__(_track(value, self) for value in data)
+        self._parent = parent
+        self._frozen = None
+
+    _changed = TrackedDict._changed
+
+    def freeze(self):
+        if self._frozen is None:
+            self._frozen = tuple(_freeze(value) for value in self)
+        return self._frozen
+
+    def __delitem__(self, index):
+        list.__delitem__(self, index)
+        self._changed()
+
+    def pop(self, *index):
+        value = list.pop(self, *index)
+        self._changed()
+        return value
+
+    def remove(self, value):
+        list.remove(self, value)
+        self._changed()
+
+    def clear(self):
+        list.clear(self)
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        list.reverse(self)
+        self._changed()
+
+    def __imul__(self, count):
+        list.__imul__(self, count)
+        self._changed()
+        return self
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = [_track(item, self) for item in value]
+        else:
+            value = _track(value, self)
+        list.__setitem__(self, index, value)
+        self._changed()
+
+    def append(self, value):
+        list.append(self, _track(value, self))
+        self._changed()
+
+    def insert(self, index, value):
+        list.insert(self, index, _track(value, self))
+        self._changed()
+
+    def extend(self, values):
+        list.extend(self, (_track(value, self) for value in values))
+        self._changed()
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def __reduce__(self):
+        return (TrackedList, (list(self),))
+
+class PlayerState(TrackedDict):
+    """Données du joueur partagées par référence (Desktop, JeuMission, Shop, fenêtres).
+
+    Se manipule comme un dictionnaire ; snapshot() en donne une vue immuable et
+    cohérente, sans copie profonde : seules les sous-structures modifiées depuis
+    l'instantané précédent sont reconstruites, les autres (stats, hardware,
+    outils...) sont partagées. Les instantanés peuvent être lus depuis un autre
+    thread (sauvegarde, statistiques) sans verrouiller la boucle principale.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, data=()):
+        super().__init__(data)
+
+    def snapshot(self):
+        """Vue immuable et cohérente des données du joueur (mise en cache jusqu'à la prochaine modification)"""
+        return self.freeze()
+
+    def __reduce__(self):
+        return (PlayerState, (dict(self),))
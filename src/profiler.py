@@ -0,0 +1,136 @@
+import csv
+import time
+from collections import deque
+from contextlib import contextmanager
+import pygame
+from config import COLORS
+from fonts import get_font
+
+class FrameProfiler:
+    """Mesure le temps de chaque phase de la boucle de jeu et l'affiche en surimpression"""
+
+    HISTOGRAM_BUCKET_MS = 2  # Largeur des classes de l'histogramme exporté
+    OVERLAY_SIZE = (240, 100)  # Surimpression affichée en haut à droite
+
+    def __init__(self, enabled=False, window=600):
+        self.enabled = enabled
+        self.frame_times = deque(maxlen=window)  # Durée de travail de chaque frame (ms)
+        self.frame_intervals = deque(maxlen=window)  # Intervalle entre deux frames (ms)
+        self.phase_times = {}  # {phase: deque des durées (ms)}
+        self.window = window
+        self._frame_start = None
+        self._last_frame_start = None
+        self._current_phases = {}
+
+    def begin_frame(self):
+        """Début d'une frame"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._last_frame_start is not None:
+            self.frame_intervals.append((now - self._last_frame_start) * 1000)
+        self._last_frame_start = now
+        self._frame_start = now
+        self._current_phases = {}
+
+    def end_frame(self):
+        """Fin d'une frame (avant l'attente de clock.tick)"""
+        if not self.enabled or self._frame_start is None:
+            return
+        self.frame_times.append((time.perf_counter() - self._frame_start) * 1000)
+        for name, duration in self._current_phases.items():
+            self.phase_times.setdefault(name, deque(maxlen=self.window)).append(duration)
+        self._frame_start = None
+
+    @contextmanager
+    def _measure(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = (time.perf_counter() - start) * 1000
+            self._current_phases[name] = self._current_phases.get(name, 0) + duration
+
+    def phase(self, name):
+        """Contexte mesurant une phase de la frame (sans effet si le profileur est désactivé)"""
+        if not self.enabled:
+            return _NULL_PHASE
+        return self._measure(name)
+
+    def fps(self):
+        """Images par seconde moyennes sur la fenêtre glissante"""
+        if not self.frame_intervals:
+            return 0.0
+        return 1000 / (sum(self.frame_intervals) / len(self.frame_intervals))
+
+    def percentile(self, percent):
+        """Percentile de la durée de frame (ms)"""
+        if not self.frame_times:
+            return 0.0
+        ordered = sorted(self.frame_times)
+        index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def top_phases(self, count=3):
+        """Phases les plus coûteuses, en ms moyennes par frame"""
+        averages = [(name, sum(times) / len(times)) for name, times in self.phase_times.items() if times]
+        averages.sort(key=lambda item: item[1], reverse=True)
+        return averages[:count]
+
+    def overlay_rect(self, screen_width):
+        """Zone occupée par la surimpression"""
+        width, height = self.OVERLAY_SIZE
+        return pygame.Rect(screen_width - width - 10, 10, width, height)
+
+    def draw(self, surface):
+        """Affiche FPS, percentiles et phases principales"""
+        if not self.enabled:
+            return
+        rect = self.overlay_rect(surface.get_width())
+        pygame.draw.rect(surface, COLORS["BLACK"], rect)
+        pygame.draw.rect(surface, COLORS["DARK_GREEN"], rect, 1)
+
+        font = get_font(18)
+        lines = [
+            f"FPS: {self.fps():.0f}",
+            f"p50 {self.percentile(50):.1f}  p95 {self.percentile(95):.1f}  p99 {self.percentile(99):.1f} ms",
+            *[f"{name}: {duration:.2f}ms" for name, duration in self.top_phases()]
+        ]
+        y = rect.y + 5
+        for line in lines:
+            surface.blit(font.render(line, True, COLORS["GREEN"]), (rect.x + 5, y))
+            y += 18
+
+    def dump_csv(self, path):
+        """Exporte l'histogramme glissant des durées de frame et la moyenne des phases"""
+        histogram = {}
+        for duration in self.frame_times:
+            bucket = int(duration // self.HISTOGRAM_BUCKET_MS) * self.HISTOGRAM_BUCKET_MS
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["bucket_ms", "frames"])
+            for bucket in sorted(histogram):
+                writer.writerow([bucket, histogram[bucket]])
+            writer.writerow([])
+            writer.writerow(["phase", "avg_ms"])
+            for name, duration in self.top_phases(len(self.phase_times)):
+                writer.writerow([name, f"{duration:.3f}"])
+
+class _NullPhase:
+    """Contexte vide utilisé quand le profileur est désactivé"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_PHASE = _NullPhase()
+
+_profiler = FrameProfiler()
+
+def get_profiler():
+    """Retourne le profileur partagé par les boucles du menu, du bureau et des missions"""
+    return _profiler
@@ -0,0 +1,52 @@
+from collections import OrderedDict
+
+class LineRenderCache:
+    """Cache LRU des surfaces de texte rendues, borné en mémoire"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.surfaces = OrderedDict()  # {(texte, police, couleur): surface}
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, font, color):
+        """Retourne la surface du texte, rendue une seule fois par (texte, police, couleur)"""
+        key = (text, font, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        size = self._surface_bytes(surface)
+        # Une surface plus grande que le cache entier n'est pas conservée
+        if size > self.max_bytes:
+            return surface
+
+        self.surfaces[key] = surface
+        self.current_bytes += size
+        self._evict()
+        return surface
+
+    def clear(self):
+        """Vide le cache"""
+        self.surfaces.clear()
+        self.current_bytes = 0
+
+    def _evict(self):
+        """Supprime les surfaces les moins récemment utilisées jusqu'à repasser sous la limite"""
+        while self.current_bytes > self.max_bytes and self.surfaces:
+            _, surface = self.surfaces.popitem(last=False)
+            self.current_bytes -= self._surface_bytes(surface)
+
+    @staticmethod
+    def _surface_bytes(surface):
+        """Estime la mémoire occupée par une surface"""
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
+
+    def __len__(self):
+        return len(self.surfaces)
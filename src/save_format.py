@@ -0,0 +1,161 @@
+import json
+import struct
+import zlib
+
+# Format binaire : en-tête puis sections préfixées par leur longueur.
+#   en-tête : magique (4 octets), version (u16), nombre de sections (u16)
+#   section : longueur du nom (u8), nom, drapeaux (u8), longueur (u32), contenu
+# Le contenu est du JSON compact, compressé avec zlib pour les sections lourdes.
+MAGIC = b"CHSV"
+SAVE_FORMAT_VERSION = 1
+_HEADER = struct.Struct(">4sHH")
+_SECTION = struct.Struct(">BI")
+_COMPRESSED = 0x01
+
+PROFILE = "profile"
+PLAYER_SECTIONS = ("stats", "hardware", "tools")  # Décodées au chargement avec le profil
+LAZY_SECTIONS = ("mission_state", "terminal_history")  # Décodées au premier accès
+COMPRESSED_SECTIONS = frozenset(LAZY_SECTIONS)
+
+class SaveFormatError(ValueError):
+    """Fichier de sauvegarde binaire invalide ou d'une version inconnue"""
+
+class RawSection:
+    """Section déjà encodée, recopiée telle quelle (sans décodage) à la réécriture"""
+
+    __slots__ = ("flags", "payload")
+
+    def __init__(self, flags, payload):
+        self.flags = flags
+        self.payload = payload
+
+def _encode_section(name, value):
+    if isinstance(value, RawSection):
+        flags, payload = value.flags, value.payload
+    else:
+        payload = json.dumps(value, separators=(",", ":")).encode('utf-8')
+        flags = 0
+        if name in COMPRESSED_SECTIONS:
+            payload, flags = zlib.compress(payload), _COMPRESSED
+    name_bytes = name.encode('utf-8')
+    return bytes([len(name_bytes)]) + name_bytes + _SECTION.pack(flags, len(payload)) + payload
+
+def _decode_payload(flags, payload):
+    if flags & _COMPRESSED:
+        payload = zlib.decompress(payload)
+    return json.loads(payload.decode('utf-8'))
+
+def split_sections(player_data, extra_sections=None):
+    """Répartit les données du joueur en sections (le profil en premier)"""
+    sections = {PROFILE: {k: v for k, v in player_data.items() if k not in PLAYER_SECTIONS}}
+    for name in PLAYER_SECTIONS:
+        if name in player_data:
+            sections[name] = player_data[name]
+    for name, value in (extra_sections or {}).items():
+        if value is not None:
+            sections[name] = value
+    return sections
+
+def merge_sections(sections):
+    """Inverse de split_sections : (données du joueur, sections lourdes)"""
+    sections = dict(sections)
+    data = dict(sections.pop(PROFILE, {}))
+    for name in PLAYER_SECTIONS:
+        if name in sections:
+            data[name] = sections.pop(name)
+    return data, sections
+
+def encode_save(sections):
+    """Encode {nom: valeur ou RawSection} ; le profil doit être la première section"""
+    parts = [_HEADER.pack(MAGIC, SAVE_FORMAT_VERSION, len(sections))]
+    for name, value in sections.items():
+        parts.append(_encode_section(name, value))
+    return b"".join(parts)
+
+def _iter_sections(content):
+    """(nom, drapeaux, contenu) de chaque section, sans décodage"""
+    if len(content) < _HEADER.size:
+        raise SaveFormatError("Fichier de sauvegarde tronqué")
+    magic, version, count = _HEADER.unpack_from(content, 0)
+    if magic != MAGIC:
+        raise SaveFormatError("Ce fichier n'est pas une sauvegarde binaire")
+    if version > SAVE_FORMAT_VERSION:
+        raise SaveFormatError(f"Version de sauvegarde non supportée: {version}")
+    offset = _HEADER.size
+    for _ in range(count):
+        try:
+            name_length = content[offset]
+            name = content[offset + 1:offset + 1 + name_length].decode('utf-8')
+            offset += 1 + name_length
+            flags, length = _SECTION.unpack_from(content, offset)
+        except (IndexError, struct.error, UnicodeDecodeError):
+            raise SaveFormatError("Table des sections corrompue")
+        offset += _SECTION.size
+        payload = content[offset:offset + length]
+        if len(payload) != length:
+            raise SaveFormatError(f"Section {name} tronquée")
+        offset += length
+        yield name, flags, payload
+
+class SaveFile:
+    """Sauvegarde binaire dont les sections sont décodées à la demande"""
+
+    def __init__(self, content):
+        self._raw = {name: RawSection(flags, payload) for name, flags, payload in _iter_sections(content)}
+        self._decoded = {}
+
+    @classmethod
+    def open(cls, path):
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def names(self):
+        return list(self._raw)
+
+    def __contains__(self, name):
+        return name in self._raw
+
+    def raw(self, name):
+        """Section encodée, pour la recopier sans la décoder"""
+        return self._raw.get(name)
+
+    def section(self, name, default=None):
+        """Section décodée (mise en cache au premier accès)"""
+        if name not in self._decoded:
+            raw = self._raw.get(name)
+            if raw is None:
+                return default
+            self._decoded[name] = _decode_payload(raw.flags, raw.payload)
+        return self._decoded[name]
+
+    def player_data(self):
+        """Profil et sections du joueur fusionnés (sections lourdes non décodées)"""
+        data, _ = merge_sections({name: self.section(name) for name in (PROFILE,) + PLAYER_SECTIONS
+                                  if name in self._raw})
+        return data
+
+    def to_dict(self):
+        """Toutes les sections décodées (export JSON)"""
+        return {name: self.section(name) for name in self._raw}
+
+def _read_exact(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise SaveFormatError("Fichier de sauvegarde tronqué")
+    return data
+
+def read_profile(path):
+    """Lit uniquement l'en-tête et le profil d'une sauvegarde binaire"""
+    with open(path, 'rb') as f:
+        header = _read_exact(f, _HEADER.size)
+        name_length = _read_exact(f, 1)
+        name = _read_exact(f, name_length[0])
+        section = _read_exact(f, _SECTION.size)
+        payload = _read_exact(f, _SECTION.unpack(section)[1])
+    magic, version, count = _HEADER.unpack(header)
+    # Réencapsuler la seule première section pour la valider comme le reste du fichier
+    content = _HEADER.pack(magic, version, 1) + name_length + name + section + payload
+    for name, flags, payload in _iter_sections(content):
+        if name == PROFILE:
+            return _decode_payload(flags, payload)
+    raise SaveFormatError("Profil absent de la sauvegarde")
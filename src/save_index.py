@@ -0,0 +1,120 @@
+import json
+import os
+import threading
+from save_format import read_profile
+from save_writer import checksum_file, write_json_atomic
+
+INDEX_FILENAME = "index.json"
+SAVE_SUFFIXES = ("_save.json", "_save.bin")
+
+class SaveIndex:
+    """Manifeste des emplacements de sauvegarde et des sauvegardes de secours.
+
+    Tenu à jour à chaque écriture, il évite de lister le répertoire et de
+    comparer les dates de modification pour trouver la dernière sauvegarde.
+    Il est reconstruit par un parcours du répertoire s'il est absent ou illisible.
+    """
+
+    def __init__(self, save_directory):
+        self.save_directory = save_directory
+        self.path = os.path.join(save_directory, INDEX_FILENAME)
+        self._lock = threading.Lock()  # Mis à jour depuis le thread de sauvegarde
+        self.latest = None  # Emplacement chargé au démarrage
+        self.entries = {}  # {emplacement: {faction, level, last_save, size, checksum}}
+        self.backups = []  # Fichiers de secours, du plus ancien au plus récent
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self.latest = data["latest"]
+            self.entries = data["slots"]
+            self.backups = data["backups"]
+        except (OSError, ValueError, KeyError):
+            self.rebuild()
+
+    def rebuild(self):
+        """Reconstruit le manifeste à partir du contenu du répertoire"""
+        self.latest, self.entries, self.backups = None, {}, []
+        latest_mtime = None
+        save_mtimes = {}  # {emplacement: date du fichier retenu}
+        for filename in os.listdir(self.save_directory):
+            suffix = next((s for s in SAVE_SUFFIXES if filename.endswith(s)), None)
+            if suffix is None:
+                continue
+            slot = filename[:-len(suffix)]
+            save_path = os.path.join(self.save_directory, filename)
+            try:
+                if suffix == "_save.bin":
+                    data = read_profile(save_path)  # Seul le profil est lu
+                else:
+                    with open(save_path, 'r') as f:
+                        data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            mtimes = [os.path.getmtime(save_path)]
+            if save_mtimes.get(slot, mtimes[0]) > mtimes[0]:
+                continue  # Ancien format du même emplacement
+            save_mtimes[slot] = mtimes[0]
+            size, checksum = checksum_file(save_path)
+            self.entries[slot] = self._entry(data, size, checksum)
+            journal_path = os.path.join(self.save_directory, f"{slot}_save.journal")
+            if os.path.exists(journal_path):
+                mtimes.append(os.path.getmtime(journal_path))
+            if latest_mtime is None or max(mtimes) > latest_mtime:
+                self.latest, latest_mtime = slot, max(mtimes)
+
+        backup_dir = os.path.join(self.save_directory, "backups")
+        if os.path.isdir(backup_dir):
+            self.backups = sorted([f for f in os.listdir(backup_dir) if f.endswith(('.json', '.bin'))],
+                                  key=lambda x: os.path.getmtime(os.path.join(backup_dir, x)))
+        self.save()
+
+    @staticmethod
+    def _entry(data, size, checksum):
+        return {
+            "faction": data.get("faction"),
+            "level": data.get("level", 1),
+            "last_save": data.get("last_save"),
+            "size": size,
+            "checksum": checksum
+        }
+
+    def save(self):
+        with self._lock:
+            self._write()
+
+    def _write(self):
+        data = {"latest": self.latest, "slots": self.entries, "backups": self.backups}
+        write_json_atomic(self.path, data)
+
+    def update_slot(self, slot, data, size, checksum):
+        """Enregistre l'instantané écrit pour un emplacement et en fait le plus récent"""
+        with self._lock:
+            self.entries[slot] = self._entry(data, size, checksum)
+            self.latest = slot
+            self._write()
+
+    def touch(self, slot):
+        """Marque un emplacement comme le plus récent (sans nouvel instantané)"""
+        with self._lock:
+            if self.latest != slot:
+                self.latest = slot
+                self._write()
+
+    def add_backup(self, filename, keep):
+        """Ajoute une sauvegarde de secours et retourne celles à supprimer"""
+        with self._lock:
+            if filename not in self.backups:  # Même horodatage : le fichier a été remplacé
+                self.backups.append(filename)
+            removed = self.backups[:-keep]
+            del self.backups[:-keep]
+            self._write()
+        return removed
+
+    def slots(self):
+        """Emplacements connus, du plus récent au plus ancien"""
+        with self._lock:
+            entries = [dict(entry, slot=slot) for slot, entry in self.entries.items()]
+        return sorted(entries, key=lambda entry: entry["last_save"] or "", reverse=True)
@@ -0,0 +1,103 @@
+import glob
+import json
+import os
+
+def apply_record(data, record):
+    """Applique un enregistrement du journal aux données du joueur"""
+    *parents, key = record["path"]
+    target = data
+    for name in parents:
+        target = target.setdefault(name, {})
+    op = record["op"]
+    if op == "set":
+        target[key] = record["value"]
+    elif op == "add":
+        target[key] = target.get(key, 0) + record["value"]
+    elif op == "append":
+        target.setdefault(key, []).append(record["value"])
+    else:
+        raise ValueError(f"Opération de journal inconnue: {op}")
+
+class SaveJournal:
+    """Journal en ajout seul des modifications apportées à une sauvegarde.
+
+    Chaque enregistrement porte un numéro de séquence. À la compaction, le
+    journal courant devient un segment (<chemin>.<séquence>) qui n'est supprimé
+    qu'une fois l'instantané correspondant écrit sur disque ; au chargement,
+    seuls les enregistrements postérieurs à l'instantané sont rejoués.
+    """
+
+    def __init__(self, path, start_seq=0):
+        self.path = path
+        self.seq = start_seq  # Dernier numéro de séquence attribué (au moins celui de l'instantané)
+        self.records = 0  # Enregistrements depuis la dernière compaction
+        self._file = None
+        self._scan()
+
+    def _segments(self):
+        """Segments en attente de suppression, du plus ancien au plus récent"""
+        segments = []
+        for path in glob.glob(glob.escape(self.path) + ".*"):
+            suffix = path.rsplit(".", 1)[1]
+            if suffix.isdigit():
+                segments.append((int(suffix), path))
+        return [path for _, path in sorted(segments)]
+
+    def _scan(self):
+        """Retrouve le dernier numéro de séquence et coupe un éventuel enregistrement tronqué"""
+        if os.path.exists(self.path):
+            with open(self.path, 'rb+') as f:
+                content = f.read()
+                end = content.rfind(b"\n") + 1
+                if end < len(content):
+                    f.truncate(end)  # Écriture interrompue par un crash
+        for record in self.read():
+            self.seq = max(self.seq, record["seq"])
+            self.records += 1
+
+    def read(self, after_seq=0):
+        """Enregistrements postérieurs à after_seq, segments compris"""
+        for path in self._segments() + [self.path]:
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # Dernière ligne incomplète
+                    if record["seq"] > after_seq:
+                        yield record
+
+    def append(self, op, path, value):
+        """Ajoute un enregistrement et le pousse vers le système de fichiers"""
+        self.seq += 1
+        record = {"seq": self.seq, "op": op, "path": list(path), "value": value}
+        if self._file is None:
+            self._file = open(self.path, 'a')
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.records += 1
+        return record
+
+    def rotate(self):
+        """Transforme le journal courant en segment et retourne la séquence couverte"""
+        self.close()
+        if os.path.exists(self.path):
+            os.replace(self.path, f"{self.path}.{self.seq}")
+        self.records = 0
+        return self.seq
+
+    def discard(self, up_to_seq):
+        """Supprime les segments couverts par un instantané écrit sur disque"""
+        for path in self._segments():
+            if int(path.rsplit(".", 1)[1]) <= up_to_seq:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
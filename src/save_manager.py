@@ -1,12 +1,26 @@
+import copy
 import json
 import os
 from datetime import datetime
+from config import SAVE_FORMAT, SAVE_JOURNAL_COMPACT_RECORDS
 from missions import Faction
+from player_state import PlayerState
+from save_format import LAZY_SECTIONS, RawSection, SaveFile, encode_save, merge_sections, split_sections
+from save_index import SaveIndex
+from save_journal import SaveJournal, apply_record
+from save_writer import get_save_writer, write_bytes_atomic, write_json_atomic
+
+SAVE_EXTENSIONS = {"binary": ".bin", "json": ".json"}
 
 class SaveManager:
-    def __init__(self, save_directory="saves"):
+    def __init__(self, save_directory="saves", writer=None, save_format=SAVE_FORMAT):
         self.save_directory = save_directory
-        self.player_data = {
+        self.writer = writer or get_save_writer()  # Écritures en arrière-plan
+        self.save_format = save_format  # "binary" ou "json" (débogage)
+        self.journal = None  # Journal des modifications de la faction courante
+        self.save_file = None  # Sauvegarde binaire chargée (sections lourdes décodées à la demande)
+        self.sections = {}  # Sections lourdes décodées ou modifiées depuis le chargement
+        self.player_data = PlayerState({
             "faction": None,
             "level": 1,
             "credits": 1000,
@@ -27,8 +41,9 @@ class SaveManager:
                 "largest_botnet": 0,
                 "total_ransom": 0
             }
-        }
+        })
         self.ensure_save_directory()
+        self.index = SaveIndex(save_directory)  # Manifeste des emplacements
         self.load_player_data()
 
     def ensure_save_directory(self):
@@ -36,14 +51,113 @@ class SaveManager:
         if not os.path.exists(self.save_directory):
             os.makedirs(self.save_directory)
 
-    def get_save_path(self, faction_name):
+    def get_slot(self, faction_name):
+        """Nom de l'emplacement de sauvegarde d'une faction"""
+        return faction_name.lower()
+
+    def get_save_path(self, faction_name, save_format=None):
         """Retourne le chemin du fichier de sauvegarde pour une faction"""
-        return os.path.join(self.save_directory, f"{faction_name.lower()}_save.json")
+        extension = SAVE_EXTENSIONS[save_format or self.save_format]
+        return os.path.join(self.save_directory, f"{self.get_slot(faction_name)}_save{extension}")
+
+    def find_save_path(self, slot):
+        """Fichier existant d'un emplacement (format courant d'abord, puis l'autre format)"""
+        formats = [self.save_format] + [f for f in SAVE_EXTENSIONS if f != self.save_format]
+        for save_format in formats:
+            path = self.get_save_path(slot, save_format)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def get_journal_path(self, faction_name):
+        """Retourne le chemin du journal des modifications pour une faction"""
+        return os.path.join(self.save_directory, f"{self.get_slot(faction_name)}_save.journal")
+
+    def get_journal(self):
+        """Journal de la faction courante (rouvert si la faction a changé)"""
+        faction_name = self.snapshot_faction() or "default"
+        path = self.get_journal_path(faction_name)
+        if self.journal is None or self.journal.path != path:
+            if self.journal is not None:
+                self.journal.close()
+            self.journal = SaveJournal(path)
+            self.index.touch(self.get_slot(faction_name))
+        return self.journal
+
+    def get_section(self, name):
+        """Section lourde (état de mission, historique du terminal), décodée au premier accès"""
+        if name not in self.sections and self.save_file is not None and name in self.save_file:
+            self.sections[name] = self.save_file.section(name)
+        return self.sections.get(name)
+
+    def set_section(self, name, value):
+        """Remplace une section lourde (écrite à la prochaine compaction)"""
+        self.sections[name] = value
+
+    def save_mission_state(self, mission_state):
+        """Enregistre la session de mission en cours (l'historique du terminal dans sa propre section)"""
+        state = dict(mission_state)
+        self.set_section("terminal_history", state.pop("terminal_history", []))
+        self.set_section("mission_state", state)
+
+    def load_mission_state(self, mission_id=None):
+        """Session sauvegardée (de la mission mission_id si précisée), ou None"""
+        state = self.get_section("mission_state")
+        if not state or (mission_id is not None and state.get("mission_id") != mission_id):
+            return None
+        return dict(state, terminal_history=self.get_section("terminal_history") or [])
+
+    def clear_mission_state(self):
+        """Oublie la session en cours (mission terminée ou échouée), sur disque compris"""
+        if self.get_section("mission_state") is None and self.get_section("terminal_history") is None:
+            return
+        self.set_section("mission_state", None)
+        self.set_section("terminal_history", None)
+        # Les sections lourdes ne sont pas journalisées : réécrire l'instantané sans elles
+        self.compact()
+
+    def _heavy_sections(self):
+        """Sections lourdes à écrire : copies des sections modifiées, recopie brute des autres"""
+        sections = {}
+        for name in LAZY_SECTIONS:
+            if name in self.sections:
+                sections[name] = copy.deepcopy(self.sections[name])
+            elif self.save_file is not None and name in self.save_file:
+                sections[name] = self.save_file.raw(name)
+        return sections
+
+    def list_slots(self):
+        """Emplacements de sauvegarde (faction, niveau, date...), du plus récent au plus ancien"""
+        return self.index.slots()
+
+    def record(self, op, path, value):
+        """Journalise une modification déjà appliquée à player_data (compacte si nécessaire)"""
+        journal = self.get_journal()
+        journal.append(op, path, value)
+        if journal.records >= SAVE_JOURNAL_COMPACT_RECORDS:
+            self.compact()
+
+    def compact(self):
+        """Écrit un instantané complet et fait tourner le journal"""
+        journal = self.get_journal()
+        seq = journal.rotate()
+        snapshot = self.snapshot()
+        snapshot["journal_seq"] = seq
+        heavy_sections = self._heavy_sections()
+        faction_name = snapshot["faction"] or "default"
+        slot = self.get_slot(faction_name)
+
+        def write(path, data):
+            size, checksum = self.write_save(path, data, heavy_sections)
+            journal.discard(seq)  # Les segments sont couverts par l'instantané
+            self.index.update_slot(slot, data, size, checksum)
+
+        self.writer.submit(self.get_save_path(faction_name), snapshot, write)
 
     def save_player_data(self, faction, level, completed_missions, stats, hardware, tools):
-        """Sauvegarde les données du joueur"""
+        """Sauvegarde les données du joueur (écriture différée sur le thread de sauvegarde)"""
         self.player_data.update({
-            "faction": faction.value if faction else None,
+            "faction": faction,
             "level": level,
             "completed_missions": completed_missions,
             "stats": stats,
@@ -52,26 +166,82 @@ class SaveManager:
             "last_save": datetime.now().isoformat()
         })
         
-        save_path = self.get_save_path(faction.value if faction else "default")
-        with open(save_path, 'w') as f:
-            json.dump(self.player_data, f, indent=4)
+        self.compact()
+
+    def snapshot_faction(self):
+        """Nom de la faction tel qu'il est stocké dans les sauvegardes"""
+        faction = self.player_data.get("faction")
+        return faction.value if isinstance(faction, Faction) else faction
+
+    def snapshot(self):
+        """Instantané sérialisable des données du joueur (la faction est stockée par son nom).
+
+        Les sous-structures sont celles, immuables, de PlayerState.snapshot() :
+        elles peuvent être lues par le thread de sauvegarde sans copie profonde.
+        """
+        snapshot = dict(self.player_data.snapshot())
+        snapshot["faction"] = self.snapshot_faction()
+        return snapshot
+
+    def write_save(self, path, data, heavy_sections):
+        """Écrit un instantané dans le format de la sauvegarde (sur le thread de sauvegarde)"""
+        if self.save_format == "binary":
+            return write_bytes_atomic(path, encode_save(split_sections(data, heavy_sections)))
+        data = dict(data)
+        for name, value in heavy_sections.items():
+            data[name] = self.save_file.section(name) if isinstance(value, RawSection) else value
+        return write_json_atomic(path, data)
+
+    def export_json(self, json_path):
+        """Exporte la sauvegarde courante, sections comprises, en JSON lisible (débogage)"""
+        heavy_sections = {name: self.get_section(name) for name in LAZY_SECTIONS}
+        write_json_atomic(json_path, split_sections(self.snapshot(), heavy_sections))
+
+    def import_json(self, json_path):
+        """Remplace la sauvegarde courante par un export JSON"""
+        with open(json_path, 'r') as f:
+            data, sections = merge_sections(json.load(f))
+        data.pop("journal_seq", None)
+        if data.get("faction"):
+            data["faction"] = Faction(data["faction"])
+        self.player_data.update(data)
+        self.save_file, self.sections = None, sections
+        self.compact()
+
+    def flush(self, timeout=None):
+        """Attend la fin des écritures en attente (à appeler avant de quitter)"""
+        return self.writer.flush(timeout)
 
     def load_player_data(self):
         """Charge les données du joueur"""
-        # Chercher une sauvegarde existante
-        save_files = [f for f in os.listdir(self.save_directory) 
-                     if f.endswith('_save.json')]
-        
-        if not save_files:
+        # Emplacement le plus récent d'après le manifeste
+        slot = self.index.latest
+        if slot is not None and self.find_save_path(slot) is None:
+            self.index.rebuild()  # Manifeste désynchronisé du répertoire
+            slot = self.index.latest
+        if slot is None:
             return False
-            
-        # Charger la sauvegarde la plus récente
-        latest_save = max(save_files, key=lambda f: os.path.getmtime(
-            os.path.join(self.save_directory, f)))
         
         try:
-            with open(os.path.join(self.save_directory, latest_save), 'r') as f:
-                data = json.load(f)
+            save_path = self.find_save_path(slot)
+            if save_path.endswith(SAVE_EXTENSIONS["binary"]):
+                save_file = SaveFile.open(save_path)
+                data, sections = save_file.player_data(), {}
+            else:
+                with open(save_path, 'r') as f:
+                    data = json.load(f)
+                save_file = None
+                sections = {name: data.pop(name) for name in LAZY_SECTIONS if name in data}
+
+            # Rejouer les modifications postérieures à l'instantané
+            journal_seq = data.pop("journal_seq", 0)
+            journal = SaveJournal(self.get_journal_path(slot), journal_seq)
+            for record in journal.read(journal_seq):
+                apply_record(data, record)
+            if self.journal is not None:
+                self.journal.close()
+            self.journal = journal
+            self.save_file, self.sections = save_file, sections
                 
             # Convertir la faction de string à enum
             if data.get("faction"):
@@ -93,14 +263,7 @@ class SaveManager:
         """Sauvegarde une mission complétée"""
         if mission_id not in self.player_data["completed_missions"]:
             self.player_data["completed_missions"].append(mission_id)
-            self.save_player_data(
-                self.player_data["faction"],
-                self.player_data["level"],
-                self.player_data["completed_missions"],
-                self.player_data["stats"],
-                self.player_data["hardware"],
-                self.player_data["tools"]
-            )
+            self.record("append", ("completed_missions",), mission_id)
 
     def create_new_save(self, faction):
         """Crée une nouvelle sauvegarde"""
@@ -138,21 +301,22 @@ class SaveManager:
         if not os.path.exists(backup_dir):
             os.makedirs(backup_dir)
             
+        snapshot = self.snapshot()
+        snapshot["journal_seq"] = self.get_journal().seq  # Tout le journal est inclus
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = os.path.join(
             backup_dir, 
-            f"{self.player_data['faction'].value.lower()}_{timestamp}.json"
+            f"{snapshot['faction'].lower()}_{timestamp}{SAVE_EXTENSIONS[self.save_format]}"
         )
         
-        with open(backup_path, 'w') as f:
-            json.dump(self.player_data, f, indent=4)
+        self.write_save(backup_path, snapshot, self._heavy_sections())
         
         # Nettoyer les anciennes sauvegardes (garder les 5 plus récentes)
-        backups = sorted([f for f in os.listdir(backup_dir) if f.endswith('.json')],
-                        key=lambda x: os.path.getmtime(os.path.join(backup_dir, x)))
-        
-        while len(backups) > 5:
-            os.remove(os.path.join(backup_dir, backups.pop(0)))
+        for filename in self.index.add_backup(os.path.basename(backup_path), keep=5):
+            try:
+                os.remove(os.path.join(backup_dir, filename))
+            except FileNotFoundError:
+                pass
             
         return True
 
@@ -162,31 +326,21 @@ class SaveManager:
             if key in self.player_data["stats"]:
                 if isinstance(value, (int, float)):
                     self.player_data["stats"][key] += value
+                    self.record("add", ("stats", key), value)
                 else:
                     self.player_data["stats"][key] = value
-                    
-        # Sauvegarder automatiquement après la mise à jour des stats
-        self.save_player_data(
-            self.player_data["faction"],
-            self.player_data["level"],
-            self.player_data["completed_missions"],
-            self.player_data["stats"],
-            self.player_data["hardware"],
-            self.player_data["tools"]
-        )
+                    self.record("set", ("stats", key), value)
+
+    def add_credits(self, amount):
+        """Ajoute (ou retire si négatif) des crédits au joueur"""
+        self.player_data["credits"] += amount
+        self.record("add", ("credits",), amount)
 
     def add_tool(self, tool_name):
         """Ajoute un nouvel outil à l'inventaire"""
         if tool_name not in self.player_data["tools"]:
             self.player_data["tools"].append(tool_name)
-            self.save_player_data(
-                self.player_data["faction"],
-                self.player_data["level"],
-                self.player_data["completed_missions"],
-                self.player_data["stats"],
-                self.player_data["hardware"],
-                self.player_data["tools"]
-            )
+            self.record("append", ("tools",), tool_name)
             return True
         return False
 
@@ -197,14 +351,6 @@ class SaveManager:
             if current_level < 5:  # Maximum niveau 5
                 self.player_data["hardware"][hardware_type]["level"] += 1
                 self.player_data["hardware"][hardware_type]["bonus"] += 0.1
-                
-                self.save_player_data(
-                    self.player_data["faction"],
-                    self.player_data["level"],
-                    self.player_data["completed_missions"],
-                    self.player_data["stats"],
-                    self.player_data["hardware"],
-                    self.player_data["tools"]
-                )
+                self.record("set", ("hardware", hardware_type), dict(self.player_data["hardware"][hardware_type]))
                 return True
         return False 
\ No newline at end of file
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+
+def write_json_atomic(path, data):
+    """Écrit data en JSON de façon atomique ; retourne (taille, somme SHA-256)"""
+    return write_bytes_atomic(path, json.dumps(data, indent=4).encode('utf-8'))
+
+def write_bytes_atomic(path, content):
+    """Écrit content dans un fichier temporaire puis le renomme (jamais de fichier à moitié écrit).
+
+    Retourne (taille, somme SHA-256) du contenu écrit.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(content), hashlib.sha256(content).hexdigest()
+
+def checksum_file(path):
+    """(taille, somme SHA-256) d'un fichier existant"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    return len(content), hashlib.sha256(content).hexdigest()
+
+class SaveWriter:
+    """Écrit les sauvegardes sur un thread d'arrière-plan.
+
+    La file est coalescente : pour un même fichier, seul le dernier instantané
+    soumis est écrit. Les instantanés doivent être des copies que l'appelant
+    ne modifie plus.
+    """
+
+    def __init__(self, write=write_json_atomic):
+        self.write = write
+        self._pending = {}  # {chemin: instantané}, dans l'ordre de soumission
+        self._in_flight = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, path, snapshot, write=None):
+        """Programme l'écriture de snapshot dans path (remplace un instantané en attente).
+
+        write remplace la fonction d'écriture par défaut pour cet instantané.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("SaveWriter fermé")
+            self._pending.pop(path, None)  # Le fichier repasse en fin de file
+            self._pending[path] = (snapshot, write or self.write)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return  # Fermé et plus rien à écrire
+                path = next(iter(self._pending))
+                snapshot, write = self._pending.pop(path)
+                self._in_flight += 1
+            try:
+                write(path, snapshot)
+            except Exception as e:
+                logging.getLogger('cyberhack').error(f"Erreur lors de l'écriture de {path}: {e}")
+            finally:
+                with self._condition:
+                    self._in_flight -= 1
+                    self._condition.notify_all()
+
+    def pending(self):
+        """Nombre d'écritures en attente ou en cours"""
+        with self._condition:
+            return len(self._pending) + self._in_flight
+
+    def flush(self, timeout=None):
+        """Attend que toutes les écritures soumises soient sur disque ; retourne False si timeout"""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._in_flight, timeout)
+
+    def close(self, timeout=None):
+        """Écrit les instantanés restants puis arrête le thread"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+_writer = SaveWriter()
+
+def get_save_writer():
+    """Retourne l'écrivain partagé par les gestionnaires de sauvegarde"""
+    return _writer
@@ -0,0 +1,63 @@
+class ScrollbackBuffer:
+    """Tampon circulaire de lignes à capacité fixe (les plus anciennes sont évincées)"""
+
+    def __init__(self, max_lines, lines=None):
+        if max_lines <= 0:
+            raise ValueError("La capacité du tampon doit être positive")
+        self.max_lines = max_lines
+        self._lines = [None] * max_lines
+        self._start = 0
+        self._count = 0
+        # Nombre total de lignes ajoutées depuis la création (jamais remis à zéro,
+        # ce qui donne à chaque ligne un numéro absolu stable)
+        self.total_appended = 0
+        if lines:
+            self.extend(lines)
+
+    def append(self, line):
+        """Ajoute une ligne, en évinçant la plus ancienne si le tampon est plein"""
+        end = (self._start + self._count) % self.max_lines
+        self._lines[end] = line
+        if self._count < self.max_lines:
+            self._count += 1
+        else:
+            self._start = (self._start + 1) % self.max_lines
+        self.total_appended += 1
+
+    def extend(self, lines):
+        """Ajoute plusieurs lignes"""
+        for line in lines:
+            self.append(line)
+
+    def clear(self):
+        """Vide le tampon"""
+        self._lines = [None] * self.max_lines
+        self._start = 0
+        self._count = 0
+
+    def window(self, start, count):
+        """Retourne les lignes visibles [start, start + count) sans copier le tampon entier"""
+        start = max(0, start)
+        stop = min(self._count, start + max(0, count))
+        return [self._lines[(self._start + i) % self.max_lines] for i in range(start, stop)]
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return iter(self.window(0, self._count))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._count)
+            if step == 1:
+                return self.window(start, stop - start)
+            return [self[i] for i in range(start, stop, step)]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Index hors du tampon")
+        return self._lines[(self._start + index) % self.max_lines]
+
+    def __repr__(self):
+        return f"ScrollbackBuffer({self._count}/{self.max_lines})"
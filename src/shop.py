@@ -110,7 +110,7 @@ class Shop:
             raise ValueError("Crédits insuffisants")
             
         # Effectuer l'achat
-        player_data["credits"] -= tool["price"]
+        self.save_manager.add_credits(-tool["price"])
         self.save_manager.add_tool(tool_id)
         
         return {
@@ -133,7 +133,7 @@ class Shop:
             raise ValueError("Crédits insuffisants")
             
         # Effectuer l'amélioration
-        player_data["credits"] -= cost
+        self.save_manager.add_credits(-cost)
         success = self.save_manager.upgrade_hardware(hardware_type.value)
         
         if success:
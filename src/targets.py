@@ -1,68 +1,179 @@
-from dataclasses import dataclass
-from enum import Enum
-from typing import Dict, List, Optional
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+import ipaddress
 import random
+from config import NETWORK_BASE_ADDRESS, NETWORK_MAX_LOADED_SUBNETS
 from enums import SecurityLevel, TargetType
 
-@dataclass
+def _catalog(databases, files):
+    """Fige un catalogue (bases de données, fichiers) en vues en lecture seule"""
+    freeze = lambda entries: MappingProxyType({name: MappingProxyType(data) for name, data in entries.items()})
+    return freeze(databases), freeze(files)
+
+# Catalogues de données partagés par toutes les cibles d'un même type (lecture seule).
+# L'état propre à une cible (déchiffrement, exfiltration...) vit dans sa surcouche.
+DATA_CATALOGS = {
+    TargetType.CORPORATE: _catalog(
+        {
+            "users.db": {"size": "2.3GB", "value": 1500, "encrypted": True},
+            "financial.db": {"size": "1.8GB", "value": 2500, "encrypted": True},
+            "emails.db": {"size": "3.1GB", "value": 1000, "encrypted": False}
+        },
+        {
+            "passwords.txt": {"size": "156KB", "value": 800, "encrypted": False},
+            "contracts.pdf": {"size": "2.1GB", "value": 1200, "encrypted": True},
+            "employee_data.xlsx": {"size": "250MB", "value": 1500, "encrypted": False}
+        }
+    ),
+    TargetType.BANK: _catalog(
+        {
+            "transactions.db": {"size": "5.0GB", "value": 5000, "encrypted": True},
+            "accounts.db": {"size": "3.2GB", "value": 4000, "encrypted": True},
+            "audit_logs.db": {"size": "1.5GB", "value": 2000, "encrypted": True}
+        },
+        {
+            "swift_codes.txt": {"size": "50KB", "value": 3000, "encrypted": True},
+            "trading_algo.py": {"size": "1.2MB", "value": 5000, "encrypted": True}
+        }
+    ),
+    TargetType.RESEARCH: _catalog(
+        {
+            "research_data.db": {"size": "8.5GB", "value": 5000, "encrypted": True},
+            "experiments.db": {"size": "3.2GB", "value": 2500, "encrypted": True},
+            "personnel.db": {"size": "1.1GB", "value": 1000, "encrypted": False}
+        },
+        {
+            "research_notes.pdf": {"size": "450MB", "value": 3000, "encrypted": True},
+            "prototype_specs.dwg": {"size": "250MB", "value": 4000, "encrypted": True},
+            "lab_schedule.xlsx": {"size": "1.2MB", "value": 300, "encrypted": False}
+        }
+    ),
+    TargetType.INFRASTRUCTURE: _catalog(
+        {
+            "network_config.db": {"size": "1.2GB", "value": 2000, "encrypted": True},
+            "monitoring.db": {"size": "4.5GB", "value": 1500, "encrypted": False},
+            "security_logs.db": {"size": "3.0GB", "value": 1800, "encrypted": True}
+        },
+        {
+            "access_codes.txt": {"size": "42KB", "value": 2500, "encrypted": True},
+            "network_map.pdf": {"size": "15MB", "value": 1000, "encrypted": False},
+            "security_policy.doc": {"size": "2.5MB", "value": 800, "encrypted": False}
+        }
+    )
+}
+
+# Catalogue par défaut (types sans catalogue dédié)
+DEFAULT_CATALOG = _catalog(
+    {
+        "system.db": {"size": "1.0GB", "value": 500, "encrypted": False},
+        "backup.db": {"size": "2.0GB", "value": 800, "encrypted": True}
+    },
+    {
+        "config.txt": {"size": "128KB", "value": 200, "encrypted": False},
+        "logs.txt": {"size": "500MB", "value": 300, "encrypted": False}
+    }
+)
+
+# Codes compacts utilisés par Target et TargetTable
+TARGET_TYPES = list(TargetType)
+_TYPE_CODES = {target_type: code for code, target_type in enumerate(TARGET_TYPES)}
+VULNERABILITIES = []  # Nom de chaque code de vulnérabilité
+_VULNERABILITY_CODES = {}
+
+def vulnerability_code(name):
+    """Code entier d'une vulnérabilité (attribué à sa première apparition)"""
+    code = _VULNERABILITY_CODES.get(name)
+    if code is None:
+        code = len(VULNERABILITIES)
+        VULNERABILITIES.append(name)
+        _VULNERABILITY_CODES[name] = code
+    return code
+
+class DataView(Mapping):
+    """Vue des données d'une cible : catalogue partagé + surcouche propre à la cible"""
+
+    __slots__ = ("_catalog", "_overlay")
+
+    def __init__(self, catalog, overlay):
+        self._catalog = catalog
+        self._overlay = overlay
+
+    def __getitem__(self, name):
+        data = self._catalog[name]
+        changes = self._overlay.get(name) if self._overlay else None
+        return {**data, **changes} if changes else data
+
+    def __iter__(self):
+        return iter(self._catalog)
+
+    def __len__(self):
+        return len(self._catalog)
+
 class Target:
-    id: str
-    name: str
-    type: TargetType
-    security_level: SecurityLevel
-    description: str
-    ip: str
-    ports: List[int]
-    vulnerabilities: List[str]
-    data_value: int
-    security_systems: Dict[str, bool]
-    mission_id: Optional[str] = None
-
-    def __post_init__(self):
-        """Initialise les fichiers et bases de données en fonction du type de cible"""
-        if self.type == TargetType.CORPORATE:
-            self.databases = {
-                "users.db": {"size": "2.3GB", "value": 1500, "encrypted": True},
-                "financial.db": {"size": "1.8GB", "value": 2500, "encrypted": True},
-                "emails.db": {"size": "3.1GB", "value": 1000, "encrypted": False}
-            }
-            self.files = {
-                "passwords.txt": {"size": "156KB", "value": 800, "encrypted": False},
-                "contracts.pdf": {"size": "2.1GB", "value": 1200, "encrypted": True},
-                "employee_data.xlsx": {"size": "250MB", "value": 1500, "encrypted": False}
-            }
-        elif self.type == TargetType.DATACENTER:
-            self.databases = {
-                "client_data.db": {"size": "5.2GB", "value": 3000, "encrypted": True},
-                "logs.db": {"size": "1.2GB", "value": 800, "encrypted": False},
-                "metrics.db": {"size": "2.5GB", "value": 1200, "encrypted": False}
-            }
-            self.files = {
-                "access_codes.txt": {"size": "42KB", "value": 2000, "encrypted": True},
-                "network_map.pdf": {"size": "15MB", "value": 1000, "encrypted": False},
-                "backup_config.xml": {"size": "2MB", "value": 500, "encrypted": False}
-            }
-        elif self.type == TargetType.RESEARCH:
-            self.databases = {
-                "research_data.db": {"size": "8.5GB", "value": 5000, "encrypted": True},
-                "experiments.db": {"size": "3.2GB", "value": 2500, "encrypted": True},
-                "personnel.db": {"size": "1.1GB", "value": 1000, "encrypted": False}
-            }
-            self.files = {
-                "research_notes.pdf": {"size": "450MB", "value": 3000, "encrypted": True},
-                "prototype_specs.dwg": {"size": "250MB", "value": 4000, "encrypted": True},
-                "lab_schedule.xlsx": {"size": "1.2MB", "value": 300, "encrypted": False}
-            }
-        else:
-            # Type par défaut
-            self.databases = {
-                "system.db": {"size": "1.0GB", "value": 500, "encrypted": False},
-                "backup.db": {"size": "2.0GB", "value": 800, "encrypted": True}
-            }
-            self.files = {
-                "config.txt": {"size": "128KB", "value": 200, "encrypted": False},
-                "logs.txt": {"size": "500MB", "value": 300, "encrypted": False}
-            }
+    """Cible compacte : énumérations partagées, ports et vulnérabilités codés en entiers"""
+
+    __slots__ = ("id", "name", "type", "security_level", "description", "ip", "_ports",
+                 "_vulnerabilities", "data_value", "security_systems", "mission_id",
+                 "_catalog", "_overlay")
+
+    def __init__(self, id, name, type, security_level, description, ip, ports,
+                 vulnerabilities, data_value, security_systems, mission_id=None):
+        self.id = id
+        self.name = name
+        self.type = type
+        self.security_level = security_level
+        self.description = description
+        self.ip = ip
+        self.ports = ports
+        self.vulnerabilities = vulnerabilities
+        self.data_value = data_value
+        self.security_systems = security_systems
+        self.mission_id = mission_id
+        # Fichiers et bases de données : catalogue partagé du type, surcouche créée à la première modification
+        self._catalog = DATA_CATALOGS.get(type, DEFAULT_CATALOG)
+        self._overlay = None  # {nom: {clé: valeur}}
+
+    @property
+    def ports(self):
+        return self._ports
+
+    @ports.setter
+    def ports(self, ports):
+        self._ports = array("H", ports)
+
+    @property
+    def vulnerabilities(self):
+        return [VULNERABILITIES[code] for code in self._vulnerabilities]
+
+    @vulnerabilities.setter
+    def vulnerabilities(self, names):
+        self._vulnerabilities = array("H", (vulnerability_code(name) for name in names))
+
+    def has_vulnerability(self, name):
+        """Indique si la cible présente la vulnérabilité name"""
+        code = _VULNERABILITY_CODES.get(name)
+        return code is not None and code in self._vulnerabilities
+
+    def __repr__(self):
+        return f"Target(id={self.id!r}, name={self.name!r}, type={self.type}, ip={self.ip!r})"
+
+    @property
+    def databases(self):
+        return DataView(self._catalog[0], self._overlay)
+
+    @property
+    def files(self):
+        return DataView(self._catalog[1], self._overlay)
+
+    def set_data_state(self, name, **changes):
+        """Modifie l'état d'un fichier ou d'une base (copie à l'écriture, le catalogue reste intact)"""
+        if name not in self._catalog[0] and name not in self._catalog[1]:
+            raise KeyError(name)
+        if self._overlay is None:
+            self._overlay = {}
+        self._overlay.setdefault(name, {}).update(changes)
 
     def get_available_files(self):
         """Retourne la liste des fichiers disponibles"""
@@ -78,8 +189,122 @@ class Target:
             for name, data in self.databases.items()
         ]
 
+    def get_total_data_value(self):
+        """Calcule la valeur totale des données disponibles"""
+        total = 0
+        for data in self.databases.values():
+            total += data["value"]
+        for data in self.files.values():
+            total += data["value"]
+        return total
+
+    def to_dict(self):
+        """État complet sérialisable (JSON), surcouche des données comprise"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type.value,
+            "security_level": self.security_level.value,
+            "description": self.description,
+            "ip": self.ip,
+            "ports": list(self._ports),
+            "vulnerabilities": self.vulnerabilities,
+            "data_value": self.data_value,
+            "security_systems": dict(self.security_systems),
+            "mission_id": self.mission_id,
+            "overlay": self._overlay
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Reconstruit une cible à partir de to_dict(), sans rien générer"""
+        target = cls(
+            id=data["id"],
+            name=data["name"],
+            type=TargetType(data["type"]),
+            security_level=SecurityLevel(data["security_level"]),
+            description=data["description"],
+            ip=data["ip"],
+            ports=data["ports"],
+            vulnerabilities=data["vulnerabilities"],
+            data_value=data["data_value"],
+            security_systems=dict(data["security_systems"]),
+            mission_id=data.get("mission_id")
+        )
+        if data.get("overlay"):
+            target._overlay = {name: dict(changes) for name, changes in data["overlay"].items()}
+        return target
+
+class TargetTable:
+    """Ensemble de cibles stocké en colonnes, pour les opérations de masse (scan, filtres).
+
+    Les colonnes (IP entière, code de type, niveau de sécurité) sont des tableaux
+    compacts parcourus sans toucher aux objets Target, matérialisés seulement
+    pour les lignes retenues.
+    """
+
+    def __init__(self, targets=()):
+        self.targets = []
+        self.ips = array("L")  # Adresse IPv4 sous forme d'entier
+        self.type_codes = array("B")  # Index dans TARGET_TYPES
+        self.security_levels = array("B")  # SecurityLevel.value
+        self.extend(targets)
+
+    def append(self, target):
+        self.targets.append(target)
+        self.ips.append(int(ipaddress.IPv4Address(target.ip)))
+        self.type_codes.append(_TYPE_CODES[target.type])
+        self.security_levels.append(target.security_level.value)
+
+    def extend(self, targets):
+        for target in targets:
+            self.append(target)
+
+    def rows(self, ip_range=None, security_level=None, target_type=None):
+        """Index des lignes satisfaisant les filtres (ip_range : bornes entières incluses)"""
+        rows = range(len(self.targets))
+        if ip_range is not None:
+            first, last = ip_range
+            ips = self.ips
+            rows = [i for i in rows if first <= ips[i] <= last]
+        if security_level is not None:
+            level, levels = security_level.value, self.security_levels
+            rows = [i for i in rows if levels[i] == level]
+        if target_type is not None:
+            code, codes = _TYPE_CODES[target_type], self.type_codes
+            rows = [i for i in rows if codes[i] == code]
+        return rows
+
+    def select(self, ip_range=None, security_level=None, target_type=None, port=None):
+        """Cibles satisfaisant les filtres, dans l'ordre de la table"""
+        for i in self.rows(ip_range, security_level, target_type):
+            target = self.targets[i]
+            if port is None or port in target.ports:
+                yield target
+
+    def count_by_security_level(self):
+        """Nombre de cibles par niveau de sécurité"""
+        counts = {}
+        for value in self.security_levels:
+            level = SecurityLevel(value)
+            counts[level] = counts.get(level, 0) + 1
+        return counts
+
+    def __getitem__(self, index):
+        return self.targets[index]
+
+    def __iter__(self):
+        return iter(self.targets)
+
+    def __len__(self):
+        return len(self.targets)
+
 class TargetGenerator:
     def __init__(self):
+        # Index des cibles générées, maintenus à chaque création
+        self.targets_by_ip = {}  # {ip: Target}
+        self.targets_by_id = {}  # {id: Target}
+        self.network = None  # Réseau procédural (mode grand réseau)
         self.target_templates = {
             TargetType.CORPORATE: {
                 "name_prefix": ["Global", "Mega", "Tech", "Cyber", "Data"],
@@ -144,8 +369,80 @@ class TargetGenerator:
         }
 
     def generate_ip(self):
-        """Génère une adresse IP aléatoire"""
-        return ".".join(str(random.randint(1, 255)) for _ in range(4))
+        """Génère une adresse IP aléatoire, non attribuée à une cible existante"""
+        while True:
+            ip = ".".join(str(random.randint(1, 255)) for _ in range(4))
+            if ip not in self.targets_by_ip:
+                return ip
+
+    def register_target(self, target):
+        """Ajoute une cible aux index par IP et par ID"""
+        self.targets_by_ip[target.ip] = target
+        self.targets_by_id[target.id] = target
+        return target
+
+    def unregister_target(self, target):
+        """Retire une cible des index"""
+        self.targets_by_ip.pop(target.ip, None)
+        self.targets_by_id.pop(target.id, None)
+
+    def get_target_by_ip(self, ip):
+        """Retourne la cible d'adresse ip (générée à la demande dans un grand réseau), ou None"""
+        target = self.targets_by_ip.get(ip)
+        if target is None and self.network:
+            target = self.network.get_host(ip)
+        return target
+
+    def get_target_by_id(self, target_id):
+        """Retourne la cible d'identifiant target_id, ou None"""
+        target = self.targets_by_id.get(target_id)
+        if target is None and self.network:
+            target = self.network.get_host_by_id(target_id)
+        return target
+
+    def create_network(self, mission_id, subnets, hosts_per_subnet, seed=None):
+        """Crée le réseau procédural d'une mission en mode grand réseau"""
+        self.network = TargetNetwork(self, mission_id, subnets, hosts_per_subnet, seed)
+        return self.network
+
+    def restore_targets(self, states):
+        """Réenregistre des cibles sauvegardées avec Target.to_dict()"""
+        return [self.register_target(Target.from_dict(state)) for state in states]
+
+    def restore_network(self, mission_id, state):
+        """Recrée un réseau à partir de TargetNetwork.to_dict() (sous-réseaux régénérés à la demande)"""
+        network = self.create_network(mission_id, state["subnets"], state["hosts_per_subnet"], state["seed"])
+        network._pinned.update(state["pinned"])
+        return network
+
+    def generate_host(self, rng, target_id, ip, description):
+        """Génère une cible à partir d'un générateur aléatoire dédié (hôtes des grands réseaux)"""
+        target_type = rng.choice(list(self.target_templates))
+        template = self.target_templates[target_type]
+        
+        name = (
+            rng.choice(template["name_prefix"]) + 
+            rng.choice(template["name_suffix"])
+        )
+        vulnerabilities = rng.sample(template["vulnerabilities"], rng.randint(1, 3))
+        ports = rng.sample(template["ports"], rng.randint(1, len(template["ports"])))
+        
+        return Target(
+            id=target_id,
+            name=name,
+            type=target_type,
+            security_level=template["security_level"],
+            ip=ip,
+            vulnerabilities=vulnerabilities,
+            ports=ports,
+            data_value=rng.randint(500, 3000),
+            description=description,
+            security_systems={
+                "firewall": True,
+                "ids": rng.random() < 0.5,
+                "encryption": rng.random() < 0.5
+            }
+        )
 
     def get_targets_for_mission(self, mission_id):
         """Génère les cibles principales pour une mission"""
@@ -207,7 +504,7 @@ class TargetGenerator:
                     "encryption": random.choice([True, False])
                 }
             )
-            targets.append(target)
+            targets.append(self.register_target(target))
             
         return targets
 
@@ -255,7 +552,7 @@ class TargetGenerator:
                     "encryption": False
                 }
             )
-            targets.append(target)
+            targets.append(self.register_target(target))
             
         return targets
 
@@ -314,4 +611,131 @@ class TargetGenerator:
             8443: "HTTPS-ALT",
             9000: "API"
         }
-        return protocols.get(port, "UNKNOWN") 
\ No newline at end of file
+        return protocols.get(port, "UNKNOWN") 
+
+class TargetNetwork:
+    """Réseau procédural de grande taille, découpé en sous-réseaux /24.
+
+    Les hôtes d'un sous-réseau sont générés à partir de (graine, index) la première
+    fois qu'il est consulté ; seuls NETWORK_MAX_LOADED_SUBNETS sous-réseaux restent
+    en mémoire, hors sous-réseaux épinglés (où le joueur s'est connecté).
+    """
+
+    def __init__(self, generator, mission_id, subnets, hosts_per_subnet, seed=None,
+                 base_address=NETWORK_BASE_ADDRESS, max_loaded=NETWORK_MAX_LOADED_SUBNETS):
+        if not 1 <= hosts_per_subnet <= 254:
+            raise ValueError("Un sous-réseau /24 contient de 1 à 254 hôtes")
+        self.generator = generator
+        self.mission_id = mission_id
+        self.subnet_count = subnets
+        self.hosts_per_subnet = hosts_per_subnet
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.base = int(ipaddress.IPv4Address(base_address))
+        self.max_loaded = max_loaded
+        self._loaded = OrderedDict()  # {index: TargetTable}, du moins au plus récemment utilisé
+        self._pinned = set()
+
+    @property
+    def host_count(self):
+        return self.subnet_count * self.hosts_per_subnet
+
+    def subnet_cidr(self, index):
+        """Notation CIDR du sous-réseau index"""
+        return str(ipaddress.IPv4Network((self.base + (index << 8), 24)))
+
+    def _locate(self, ip):
+        """Retourne (index du sous-réseau, numéro d'hôte) d'une adresse, ou None"""
+        try:
+            offset = int(ipaddress.IPv4Address(ip)) - self.base
+        except ValueError:
+            return None
+        index, host = offset >> 8, offset & 0xFF
+        if 0 <= index < self.subnet_count and 1 <= host <= self.hosts_per_subnet:
+            return index, host
+        return None
+
+    def load_subnet(self, index):
+        """Retourne les hôtes d'un sous-réseau, générés à la demande"""
+        hosts = self._loaded.get(index)
+        if hosts is not None:
+            self._loaded.move_to_end(index)
+            return hosts
+            
+        rng = random.Random(f"{self.seed}:{index}")
+        cidr = self.subnet_cidr(index)
+        first = self.base + (index << 8)
+        hosts = TargetTable()
+        for host in range(1, self.hosts_per_subnet + 1):
+            # Toujours générer, pour que le tirage des hôtes suivants ne change pas
+            target = self.generator.generate_host(
+                rng,
+                f"NET_{index}_{host}",
+                str(ipaddress.IPv4Address(first + host)),
+                f"Hôte du sous-réseau {cidr} (mission {self.mission_id})"
+            )
+            # Un hôte restauré d'une sauvegarde garde son état
+            restored = self.generator.targets_by_id.get(target.id)
+            hosts.append(restored or self.generator.register_target(target))
+        self._loaded[index] = hosts
+        self._evict()
+        return hosts
+
+    def _evict(self):
+        """Décharge les sous-réseaux non épinglés les moins récemment utilisés"""
+        excess = len(self._loaded) - self.max_loaded
+        for index in list(self._loaded):
+            if excess <= 0:
+                break
+            if index in self._pinned:
+                continue
+            for target in self._loaded.pop(index):
+                self.generator.unregister_target(target)
+            excess -= 1
+
+    def get_host(self, ip):
+        """Retourne l'hôte d'adresse ip, ou None"""
+        location = self._locate(ip)
+        if location is None:
+            return None
+        index, host = location
+        return self.load_subnet(index)[host - 1]
+
+    def get_host_by_id(self, target_id):
+        """Retourne l'hôte d'identifiant NET_<sous-réseau>_<hôte>, ou None"""
+        parts = target_id.split("_")
+        if len(parts) != 3 or parts[0] != "NET" or not (parts[1].isdigit() and parts[2].isdigit()):
+            return None
+        index, host = int(parts[1]), int(parts[2])
+        if index >= self.subnet_count or not 1 <= host <= self.hosts_per_subnet:
+            return None
+        return self.load_subnet(index)[host - 1]
+
+    def to_dict(self):
+        """Paramètres de génération et sous-réseaux épinglés (les hôtes se régénèrent depuis la graine)"""
+        return {
+            "subnets": self.subnet_count,
+            "hosts_per_subnet": self.hosts_per_subnet,
+            "seed": self.seed,
+            "pinned": sorted(self._pinned)
+        }
+
+    def is_host(self, target):
+        """Indique si la cible est un hôte de ce réseau"""
+        return self._locate(target.ip) is not None and target.id.startswith("NET_")
+
+    def pin(self, target):
+        """Garde en mémoire le sous-réseau d'une cible (son état ne doit pas être régénéré)"""
+        location = self._locate(target.ip)
+        if location is not None:
+            self._pinned.add(location[0])
+
+    def iter_hosts(self, cidr, security_level=None):
+        """Itère paresseusement sur les hôtes d'un bloc CIDR, éventuellement filtrés par niveau de sécurité"""
+        network = ipaddress.IPv4Network(cidr, strict=False)
+        first = max(int(network.network_address), self.base)
+        last = min(int(network.broadcast_address), self.base + (self.subnet_count << 8) - 1)
+        return self._iter_range(first, last, security_level)
+
+    def _iter_range(self, first, last, security_level):
+        for index in range((first - self.base) >> 8, ((last - self.base) >> 8) + 1):
+            yield from self.load_subnet(index).select(ip_range=(first, last), security_level=security_level)
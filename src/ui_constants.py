@@ -19,4 +19,13 @@ UI_MESSAGES = {
     "NO_MISSIONS": "No available missions",
     "LOADING": "Loading...",
     "ERROR": "Error occurred"
-} 
\ No newline at end of file
+} 
+
+# Polices
+DEFAULT_FONT_SIZE = 24
+TERMINAL_FONT_FACE = None  # Nom d'un fichier .ttf de assets/fonts, None pour la police par défaut de pygame
+
+# Terminal
+TERMINAL_MAX_LINES = 2000  # Taille maximale de l'historique
+TERMINAL_RESTORE_LINES = 200  # Lignes d'historique conservées dans une sauvegarde de mission
+TERMINAL_RENDER_CACHE_BYTES = 8 * 1024 * 1024  # 8 Mo de surfaces de texte
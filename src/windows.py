@@ -1,5 +1,7 @@
 import pygame
 from config import COLORS
+from fonts import get_font
+from ui_constants import DEFAULT_FONT_SIZE
 
 class BaseWindow:
     def __init__(self, x, y, width, height, title="Window"):
@@ -12,7 +14,12 @@ class BaseWindow:
         self.minimized = False
         self.dragging = False
         self.drag_offset = (0, 0)
-        self.font = pygame.font.Font(None, 24)
+        self.dirty = True  # Le contenu doit être redessiné par le bureau
+        self.font = get_font(DEFAULT_FONT_SIZE)
+
+    def is_dirty(self):
+        """Indique si le contenu de la fenêtre a changé depuis le dernier affichage"""
+        return self.dirty
 
     def draw(self, surface):
         if self.minimized:
@@ -204,11 +211,13 @@ class StatsWindow(BaseWindow):
     def draw(self, surface):
         super().draw(surface)
         y = self.y + 40
+        # Lecture sur un instantané cohérent (PlayerState) plutôt que sur les données vivantes
+        player_data = self.player_data.snapshot() if hasattr(self.player_data, "snapshot") else self.player_data
         stats = [
-            f"Niveau: {self.player_data['level']}",
-            f"Faction: {self.player_data['faction']}",
-            f"Missions: {len(self.player_data['completed_missions'])}",
-            f"Credits: {self.player_data['credits']}¢"
+            f"Niveau: {player_data['level']}",
+            f"Faction: {player_data['faction']}",
+            f"Missions: {len(player_data['completed_missions'])}",
+            f"Credits: {player_data['credits']}¢"
         ]
         for stat in stats:
             text = self.font.render(stat, True, COLORS["GREEN"])
@@ -0,0 +1,60 @@
+import importlib
+import importlib.abc
+import importlib.util
+import os
+import sys
+from pathlib import Path
+import pytest
+
+# Les modules du jeu s'importent entre eux sans préfixe (from missions import ...)
+# alors que les tests importent src.missions : src.X est donc un alias du module X,
+# pour que chaque module (et ses énumérations) ne soit chargé qu'une seule fois.
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+class _SrcAliasFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    def find_spec(self, fullname, path, target=None):
+        if fullname.startswith("src.") and fullname.count(".") == 1:
+            return importlib.util.spec_from_loader(fullname, self)
+        return None
+
+    def create_module(self, spec):
+        return importlib.import_module(spec.name[len("src."):])
+
+    def exec_module(self, module):
+        pass  # Déjà exécuté sous son nom court
+
+sys.meta_path.insert(0, _SrcAliasFinder())
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+@pytest.fixture
+def screen():
+    import pygame
+    pygame.init()
+    return pygame.display.set_mode((1024, 768))
+
+@pytest.fixture
+def save_manager(tmp_path):
+    """SaveManager d'une partie neuve, avec son propre thread d'écriture"""
+    from src.missions import Faction
+    from src.save_manager import SaveManager
+    from src.save_writer import SaveWriter
+    writer = SaveWriter()
+    save_manager = SaveManager(str(tmp_path), writer=writer)
+    save_manager.create_new_save(Faction.SPECTRES)
+    yield save_manager
+    writer.close()
+
+@pytest.fixture
+def new_jeu(screen, save_manager):
+    """Crée une JeuMission sur un modèle de mission, pilotée par une ManualClock"""
+    from src.game_clock import ManualClock
+    from src.gameplay import JeuMission
+    from src.missions import Mission
+
+    def create(template, start=1000.0):
+        return JeuMission(Mission.create_from_template(template), screen, save_manager,
+                          clock=ManualClock(start))
+    return create
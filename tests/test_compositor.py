@@ -0,0 +1,27 @@
+from src.compositor import Compositor
+
+def test_idle_frame_has_no_dirty_region():
+    compositor = Compositor((0, 0, 800, 600))
+    compositor.track("window", (10, 10, 100, 100), "state")
+    assert compositor.collect() == [(0, 0, 800, 600)]  # Premier affichage complet
+    compositor.begin_frame()
+    compositor.track("window", (10, 10, 100, 100), "state")
+    compositor.end_tracking()
+    assert compositor.collect() == []
+
+def test_moved_element_dirties_union_of_old_and_new_bounds():
+    compositor = Compositor((0, 0, 800, 600))
+    compositor.track("window", (10, 10, 100, 100))
+    compositor.collect()
+    compositor.begin_frame()
+    compositor.track("window", (50, 10, 100, 100))
+    compositor.end_tracking()
+    assert compositor.collect() == [(10, 10, 140, 100)]
+
+def test_removed_element_is_repainted():
+    compositor = Compositor((0, 0, 800, 600))
+    compositor.track("notification", (300, 10, 50, 20))
+    compositor.collect()
+    compositor.begin_frame()
+    compositor.end_tracking()
+    assert compositor.collect() == [(300, 10, 50, 20)]
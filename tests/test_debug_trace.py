@@ -0,0 +1,26 @@
+from src.debug_trace import Tracer
+
+def test_disabled_channel_records_nothing():
+    tracer = Tracer(max_lines=10)
+    channel = tracer.channel("mission")
+    assert not channel
+    channel.emit("Cibles: %s", ["BioLabs"])
+    assert tracer.dump() == []
+
+def test_enabled_channels_fill_a_ring_buffer():
+    tracer = Tracer(max_lines=3, enabled=("mission",))
+    mission, terminal = tracer.channel("mission"), tracer.channel("terminal")
+    for i in range(5):
+        mission.emit("ligne %d", i)
+    tracer.set_enabled("terminal", True)
+    terminal.emit("prêt")
+    assert [line.split("] ")[1] for line in tracer.dump()] == ["ligne 3", "ligne 4", "prêt"]
+    assert len(tracer.dump(1, "mission")) == 1
+
+def test_wildcard_toggles_every_channel():
+    tracer = Tracer()
+    channels = [tracer.channel("mission"), tracer.channel("terminal")]
+    tracer.set_enabled("*", True)
+    assert all(channels) and tracer.channel("nouveau")
+    tracer.set_enabled("*", False)
+    assert not any(channels)
@@ -0,0 +1,40 @@
+from src.event_scheduler import EventScheduler
+from src.game_clock import ManualClock
+
+def test_one_shot_runs_once_when_due():
+    clock = ManualClock()
+    scheduler = EventScheduler(clock)
+    calls = []
+    scheduler.schedule_in(5, lambda: calls.append(clock.now()))
+    assert scheduler.run_due() == 0
+    clock.advance(5)
+    assert scheduler.run_due() == 1
+    clock.advance(10)
+    assert scheduler.run_due() == 0
+    assert calls == [5]
+
+def test_recurring_job_and_cancel():
+    clock = ManualClock()
+    scheduler = EventScheduler(clock)
+    calls = []
+    job = scheduler.schedule_every(30, lambda: calls.append(clock.now()))
+    for _ in range(7):
+        clock.advance(10)
+        scheduler.run_due()
+    assert calls == [30, 60]
+    scheduler.cancel(job)
+    clock.advance(60)
+    assert scheduler.run_due() == 0
+    assert len(scheduler) == 0
+
+def test_jobs_run_in_deadline_order():
+    clock = ManualClock()
+    scheduler = EventScheduler(clock)
+    order = []
+    scheduler.schedule_at(3, lambda: order.append("b"))
+    scheduler.schedule_at(1, lambda: order.append("a"))
+    scheduler.schedule_at(3, lambda: order.append("c"))
+    assert scheduler.next_due() == 1
+    clock.advance(3)
+    scheduler.run_due()
+    assert order == ["a", "b", "c"]
@@ -0,0 +1,31 @@
+from src.frame_scheduler import FrameScheduler
+
+def test_busy_tick_keeps_full_frame_rate():
+    scheduler = FrameScheduler(active_fps=1000, idle_fps=1000, idle_delay=1.0)
+    scheduler.last_activity -= 5
+    assert scheduler.is_idle()
+    scheduler.tick(busy=True)
+    assert not scheduler.is_idle()
+
+def test_mission_is_busy_only_near_a_due_timer(new_jeu):
+    jeu = new_jeu("infiltration_1")
+    assert not jeu.is_busy(0.1)  # Prochaine tâche (alerte) dans 30 s
+
+    job = jeu.scheduler.schedule_in(0.05, lambda: None)  # Ex. échéance de rançon imminente
+    assert jeu.is_busy(0.1)
+    jeu.scheduler.cancel(job)
+    assert not jeu.is_busy(0.1)
+
+    jeu.is_running = False
+    jeu.scheduler.schedule_in(0.05, lambda: None)
+    assert not jeu.is_busy(0.1)
+
+def test_mission_is_busy_while_a_scan_streams(new_jeu):
+    jeu = new_jeu("botnet_2")
+    jeu.start_network_scan(jeu.network.subnet_cidr(0))
+    assert jeu.is_busy(0.1)
+    for _ in range(20):  # Lots successifs jusqu'à la fin du scan
+        jeu.clock.advance(jeu.simulation_step * 1.5)
+        jeu.advance_simulation()
+    assert jeu.scan_job is None
+    assert not jeu.is_busy(0.1)
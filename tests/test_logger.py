@@ -0,0 +1,15 @@
+import logging
+from src import logger as game_logger
+
+def test_setup_is_idempotent_and_flushes_on_shutdown(tmp_path, monkeypatch):
+    monkeypatch.setattr(game_logger, "LOG_FILE", tmp_path / "game.log")
+    game_logger.shutdown_logger()
+    try:
+        logger = game_logger.setup_logger()
+        assert game_logger.setup_logger() is logger
+        assert len(logger.handlers) == 1
+        logger.debug("ligne unique")
+    finally:
+        game_logger.shutdown_logger()
+    assert not logging.getLogger('cyberhack').handlers
+    assert (tmp_path / "game.log").read_text(encoding='utf-8').count("ligne unique") == 1
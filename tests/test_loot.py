@@ -0,0 +1,26 @@
+from src.loot import LootLedger
+
+def test_running_totals_and_bounded_history():
+    ledger = LootLedger(history_size=2)
+    ledger.add("file", 100, "a.txt")
+    ledger.add("database", 500, "clients")
+    ledger.add("file", 200, "b.txt")
+    assert len(ledger) == 3
+    assert ledger.total_value == 800
+    assert ledger.by_category == {"file": 300, "database": 500}
+    assert list(ledger.recent) == [("database", 500, "clients"), ("file", 200, "b.txt")]
+
+    ledger.add_ransom(3000)
+    ledger.add_compromised("CORP_1")
+    ledger.add_compromised("CORP_1")
+    ledger.clear_data()
+    assert ledger.count == 0 and ledger.total_value == 0
+    assert ledger.ransom_total == 3000 and ledger.compromised_count == 1
+
+def test_round_trip_through_dict():
+    ledger = LootLedger()
+    ledger.add("api", 800, "Données API")
+    ledger.add_ransom(1500)
+    ledger.add_compromised("BANK_1")
+    restored = LootLedger.from_dict(ledger.to_dict())
+    assert restored.to_dict() == ledger.to_dict()
@@ -0,0 +1,117 @@
+import json
+import random
+import time
+import pytest
+from src.game_clock import ManualClock
+from src.gameplay import JeuMission
+from src.missions import Mission
+from src.save_manager import SaveManager
+from src.save_writer import SaveWriter
+from src.ui_constants import TERMINAL_RESTORE_LINES
+
+SHIFT = 3600.0  # Reprise une heure après la sauvegarde
+
+def _play(new_jeu, template, monkeypatch):
+    """Session avec butin, système chiffré sous rançon, payload et bonus temporaire"""
+    random.seed(1)
+    jeu = new_jeu(template)
+    target = jeu.available_targets[0]
+    with monkeypatch.context() as patch:
+        patch.setattr(random, "random", lambda: 0.0)  # Toutes les actions réussissent
+        jeu.execute_command("connect", [target.ip])
+        jeu.systeme_compromis = True
+        for command, args in [("botnet", ["add"]), ("exfiltrate", ["all"]), ("ransom", ["encrypt"]),
+                              ("ransom", ["demand", "5000"]), ("inject", ["keylogger"])]:
+            jeu.terminal.historique.append(f"$ {command} {' '.join(args)}")
+            jeu.terminal.historique.extend(jeu.execute_command(command, args))
+    jeu.add_temporary_bonus("stealth", 0.5, 120)
+    jeu.clock.advance(50)
+    jeu.advance_simulation()
+    return jeu
+
+def _shifted(state, shift):
+    """Snapshot attendu après une reprise décalée de shift secondes"""
+    state = json.loads(json.dumps(state))
+    for key in ("saved_at", "mission_start_time"):
+        state[key] += shift
+    for ransom_info in state["encrypted_systems"].values():
+        ransom_info["encrypt_time"] += shift
+        if ransom_info["payment_deadline"] is not None:
+            ransom_info["payment_deadline"] += shift
+    for payloads in state["active_payloads"].values():
+        for payload_type in payloads:
+            payloads[payload_type] += shift
+    for bonus in state["bonuses"]:
+        bonus[2] += shift
+    history = state["terminal_history"] + ["--- Session restaurée ---"]
+    state["terminal_history"] = history[-TERMINAL_RESTORE_LINES:]
+    return state
+
+@pytest.mark.parametrize("template", list(Mission.get_mission_templates()))
+def test_snapshot_json_restore_roundtrip(template, new_jeu, screen, save_manager, monkeypatch):
+    jeu = _play(new_jeu, template, monkeypatch)
+    state = jeu.snapshot()
+    assert state["encrypted_systems"] and state["active_payloads"] and state["bonuses"]
+
+    encoded = json.dumps(state)
+    clock = ManualClock(jeu.clock.now() + SHIFT)
+    start = time.perf_counter()
+    restored = JeuMission.restore(json.loads(encoded), jeu.mission, screen, save_manager, clock=clock)
+    assert time.perf_counter() - start < 0.05  # Quelques millisecondes, sans régénérer les cibles
+
+    assert json.loads(json.dumps(restored.snapshot())) == _shifted(state, SHIFT)
+    assert [t.ip for t in restored.available_targets] == [t.ip for t in jeu.available_targets]
+    assert restored.current_target.id == jeu.current_target.id
+
+def test_ransom_deadline_is_rescheduled_on_the_new_clock(new_jeu, screen, save_manager, monkeypatch):
+    jeu = _play(new_jeu, "ransomware_1", monkeypatch)
+    target_id = jeu.current_target.id
+    deadline = jeu.encrypted_systems[target_id]["payment_deadline"]
+
+    clock = ManualClock(jeu.clock.now() + SHIFT)
+    restored = JeuMission.restore(json.loads(json.dumps(jeu.snapshot())), jeu.mission,
+                                  screen, save_manager, clock=clock)
+    ransom_jobs = [job for job in restored.scheduler.jobs() if job.name == f"ransom_{target_id}"]
+    assert [job.when for job in ransom_jobs] == [deadline + SHIFT]
+    assert jeu.loot.count and restored.loot.to_dict() == jeu.loot.to_dict()
+    assert restored.modifiers.temporary() == [(category, factor, end + SHIFT)
+                                              for category, factor, end in jeu.modifiers.temporary()]
+
+def test_session_roundtrip_through_save_sections(tmp_path, new_jeu, screen, save_manager, monkeypatch):
+    jeu = _play(new_jeu, "ransomware_1", monkeypatch)
+    assert jeu.save_mission_state()
+    save_manager.flush()
+
+    writer = SaveWriter()
+    reloaded = SaveManager(str(tmp_path), writer=writer)
+    try:
+        state = reloaded.load_mission_state(jeu.mission.id)
+        assert state == json.loads(json.dumps(jeu.snapshot()))
+        assert reloaded.load_mission_state("AUTRE_MISSION") is None
+
+        restored = JeuMission.restore(state, jeu.mission, screen, reloaded, clock=ManualClock(jeu.clock.now()))
+        assert list(restored.terminal.historique)[:-1] == state["terminal_history"]
+
+        reloaded.clear_mission_state()
+        assert reloaded.load_mission_state() is None
+    finally:
+        writer.close()
+
+@pytest.mark.parametrize("end", ["timeout", "detection"])
+def test_ended_session_is_not_resumed_after_reopening(end, tmp_path, new_jeu, save_manager, monkeypatch):
+    jeu = _play(new_jeu, "ransomware_1", monkeypatch)
+    assert jeu.save_mission_state()  # Sauvegarde automatique
+    if end == "timeout":
+        jeu.clock.advance(jeu.mission_duration)
+        jeu.advance_simulation()
+    else:
+        monkeypatch.setattr(random, "random", lambda: 0.0)  # La cible coupe la connexion
+        jeu.handle_detection()
+    assert not jeu.is_running
+    save_manager.flush()
+
+    writer = SaveWriter()
+    try:
+        assert SaveManager(str(tmp_path), writer=writer).load_mission_state() is None
+    finally:
+        writer.close()
@@ -0,0 +1,26 @@
+from src.modifiers import ModifierStack
+from src.game_clock import ManualClock
+
+def test_permanent_sources_are_multiplied_and_replaced():
+    stack = ModifierStack(ManualClock())
+    stack.set("tool:hack", "tools", 1.4)
+    stack.set("tool:hack", "faction", 1.5)
+    assert abs(stack.multiplier("tool:hack") - 2.1) < 1e-9
+    stack.set("tool:hack", "tools", 1.0)
+    assert stack.multiplier("tool:hack") == 1.5
+    assert stack.multiplier("inconnue") == 1.0
+
+def test_temporary_modifiers_expire_in_order():
+    clock = ManualClock()
+    stack = ModifierStack(clock)
+    stack.add_temporary("bonus:hack", 1.2, 300)
+    stack.add_temporary("bonus:stealth", 1.5, 100)
+    assert [category for category, _, _ in stack.temporary()] == ["bonus:stealth", "bonus:hack"]
+    clock.advance(100)
+    assert stack.expire() == 1
+    assert stack.multiplier("bonus:stealth") == 1.0
+    assert stack.multiplier("bonus:hack") == 1.2
+    clock.advance(200)
+    assert stack.expire() == 1
+    assert stack.multiplier("bonus:hack") == 1.0
+    assert stack.temporary() == []
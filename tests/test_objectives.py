@@ -0,0 +1,47 @@
+import pytest
+from types import SimpleNamespace
+from src.missions import Mission
+from src.loot import LootLedger
+from src.objectives import compile_objectives, ALERT, BOTNET, MINING
+
+def _botnet_state():
+    return SimpleNamespace(botnet_size=0, alert_level=0, mining_cycles=0, detected=False,
+                           loot=LootLedger(), encrypted_systems={})
+
+def test_objectives_are_only_reevaluated_on_notification():
+    tracker = compile_objectives(Mission.create_from_template("botnet_1"))
+    jeu = _botnet_state()
+    assert tracker.evaluate(jeu)
+    assert tracker.primary_status() == [False, True, False]
+
+    jeu.botnet_size = 5
+    jeu.alert_level = 90
+    assert not tracker.evaluate(jeu)  # Aucun changement signalé
+    tracker.notify(BOTNET)
+    assert tracker.evaluate(jeu)
+    assert tracker.primary_status() == [True, True, False]
+
+    tracker.notify(ALERT)
+    jeu.mining_cycles = 3
+    tracker.notify(MINING)
+    tracker.evaluate(jeu)
+    assert tracker.primary_status() == [True, False, True]
+
+def test_secondary_objectives_are_compiled_by_keyword():
+    tracker = compile_objectives(Mission.create_from_template("botnet_1"))
+    jeu = _botnet_state()
+    tracker.evaluate(jeu)
+    labels = [label for label, _ in tracker.secondary_status()]
+    assert labels == Mission.create_from_template("botnet_1").objectifs_secondaires
+    assert [done for _, done in tracker.secondary_status()] == [False, True, False]
+
+def test_primary_objectives_do_not_depend_on_the_import_path():
+    from src.missions import Mission as PackagedMission
+    tracker = compile_objectives(PackagedMission.create_from_template("botnet_1"))
+    tracker.evaluate(_botnet_state())
+    assert tracker.primary_status() == [False, True, False]
+
+def test_unknown_mission_type_is_rejected():
+    mission = SimpleNamespace(type=SimpleNamespace(name="INCONNU"), objectifs=["?"])
+    with pytest.raises(ValueError):
+        compile_objectives(mission)
@@ -0,0 +1,41 @@
+import json
+import pytest
+from src.player_state import PlayerState
+
+@pytest.fixture
+def state():
+    return PlayerState({
+        "credits": 1000,
+        "tools": ["vpn"],
+        "hardware": {"cpu": {"level": 1, "bonus": 0.1}, "ram": {"level": 1, "bonus": 0.1}},
+        "stats": {"missions_completed": 0}
+    })
+
+def test_snapshot_is_immutable_and_isolated(state):
+    snapshot = state.snapshot()
+    state["credits"] -= 200
+    state["tools"].append("nmap")
+    state["hardware"]["cpu"]["level"] += 1
+    assert snapshot["credits"] == 1000
+    assert snapshot["tools"] == ("vpn",)
+    assert snapshot["hardware"]["cpu"]["level"] == 1
+    with pytest.raises(TypeError):
+        snapshot["stats"]["missions_completed"] = 5
+    assert json.loads(json.dumps(state.snapshot()))["tools"] == ["vpn", "nmap"]
+
+def test_unchanged_sections_are_shared(state):
+    first = state.snapshot()
+    assert state.snapshot() is first
+    state["hardware"]["cpu"]["level"] += 1
+    second = state.snapshot()
+    assert second["stats"] is first["stats"]
+    assert second["tools"] is first["tools"]
+    assert second["hardware"]["ram"] is first["hardware"]["ram"]
+    assert second["hardware"]["cpu"] is not first["hardware"]["cpu"]
+
+def test_reassigning_a_section_keeps_live_references(state):
+    stats = state["stats"]
+    state.update({"stats": stats})
+    stats["missions_completed"] += 1
+    assert state["stats"] is stats
+    assert state.snapshot()["stats"]["missions_completed"] == 1
@@ -0,0 +1,37 @@
+import csv
+from src.profiler import FrameProfiler
+
+def test_percentiles_use_the_sliding_window():
+    profiler = FrameProfiler(enabled=True, window=100)
+    profiler.frame_times.extend(range(1, 201))  # Seules les 100 dernières durées comptent
+    assert profiler.percentile(0) == 101
+    assert profiler.percentile(50) == 151
+    assert profiler.percentile(95) == 195
+    assert profiler.percentile(100) == 200
+    assert FrameProfiler(enabled=True).percentile(99) == 0.0
+
+def test_dump_csv_writes_histogram_and_phase_averages(tmp_path):
+    profiler = FrameProfiler(enabled=True)
+    profiler.frame_times.extend([0.5, 1.5, 2.5, 7.9])
+    profiler.phase_times = {"events": [1.0, 3.0], "flip": [0.5]}
+    path = tmp_path / "frame_profile.csv"
+    profiler.dump_csv(path)
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows == [["bucket_ms", "frames"], ["0", "2"], ["2", "1"], ["6", "1"], [],
+                    ["phase", "avg_ms"], ["events", "2.000"], ["flip", "0.500"]]
+
+def test_overlay_is_drawn_once_per_desktop_frame(screen, save_manager, monkeypatch):
+    from src.desktop import Desktop
+    desktop = Desktop(1024, 768, save_manager)
+    monkeypatch.setattr(desktop, "profiler", FrameProfiler(enabled=True))
+    draws = []
+    monkeypatch.setattr(desktop.profiler, "draw", draws.append)
+
+    desktop.draw()  # Premier affichage complet
+    draws.clear()
+
+    desktop.show_notification("Test", "info")  # Zone sale distincte de la surimpression
+    desktop.draw()
+    assert draws == [desktop.screen]
@@ -0,0 +1,31 @@
+import pygame
+from src.render_cache import LineRenderCache
+
+class FakeFont:
+    def __init__(self):
+        self.calls = 0
+
+    def render(self, text, antialias, color):
+        self.calls += 1
+        return pygame.Surface((len(text) * 10, 10))
+
+def test_render_is_cached():
+    font = FakeFont()
+    cache = LineRenderCache(1024 * 1024)
+    first = cache.render("scan", font, (0, 255, 0))
+    second = cache.render("scan", font, (0, 255, 0))
+    assert first is second
+    assert font.calls == 1
+
+def test_lru_eviction_respects_memory_limit():
+    font = FakeFont()
+    surface_bytes = 40 * 10 * pygame.Surface((1, 1)).get_bytesize()
+    cache = LineRenderCache(surface_bytes * 2)
+    cache.render("aaaa", font, (0, 255, 0))
+    cache.render("bbbb", font, (0, 255, 0))
+    cache.render("aaaa", font, (0, 255, 0))  # "aaaa" devient le plus récent
+    cache.render("cccc", font, (0, 255, 0))
+    assert len(cache) == 2
+    assert cache.current_bytes <= cache.max_bytes
+    cache.render("aaaa", font, (0, 255, 0))
+    assert font.calls == 3  # "aaaa" est resté en cache, "bbbb" a été évincé
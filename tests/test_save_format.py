@@ -0,0 +1,51 @@
+import pytest
+from src.save_format import (SaveFile, SaveFormatError, encode_save, merge_sections,
+                             read_profile, split_sections)
+
+PLAYER = {"faction": "Spectres", "level": 4, "credits": 1200, "tools": ["vpn"],
+          "stats": {"missions_completed": 2}, "hardware": {"cpu": {"level": 2, "bonus": 0.2}}}
+
+def test_roundtrip_with_lazy_sections(tmp_path):
+    heavy = {"mission_state": {"alert_level": 35}, "terminal_history": ["$ scan"] * 200}
+    path = tmp_path / "spectres_save.bin"
+    path.write_bytes(encode_save(split_sections(PLAYER, heavy)))
+
+    assert read_profile(str(path))["level"] == 4
+    save_file = SaveFile.open(str(path))
+    assert save_file.player_data() == PLAYER
+    assert save_file._decoded.keys() == {"profile", "stats", "hardware", "tools"}
+    assert save_file.section("mission_state") == {"alert_level": 35}
+    assert merge_sections(save_file.to_dict()) == (PLAYER, heavy)
+
+def test_raw_section_is_copied_without_decoding():
+    original = SaveFile(encode_save(split_sections(PLAYER, {"terminal_history": ["$ ls"]})))
+    copy = SaveFile(encode_save(split_sections(PLAYER, {"terminal_history": original.raw("terminal_history")})))
+    assert copy.section("terminal_history") == ["$ ls"]
+
+def test_invalid_files_are_rejected():
+    content = encode_save(split_sections(PLAYER))
+    with pytest.raises(SaveFormatError):
+        SaveFile(b"JSON" + content[4:])
+    with pytest.raises(SaveFormatError):
+        SaveFile(content[:-3])
+
+def test_save_manager_json_export_import_roundtrip(tmp_path, save_manager):
+    from src.save_manager import SaveManager
+    from src.save_writer import SaveWriter
+    save_manager.save_mission_state({"mission_id": "RAN_001", "terminal_history": ["$ scan"]})
+    save_manager.add_credits(250)
+    export_path = str(tmp_path / "export.json")
+    save_manager.export_json(export_path)
+
+    save_manager.add_credits(-1000)
+    save_manager.clear_mission_state()
+    save_manager.import_json(export_path)
+    save_manager.flush()
+
+    writer = SaveWriter()
+    try:
+        reopened = SaveManager(str(tmp_path), writer=writer)
+        assert reopened.player_data["credits"] == 1250
+        assert reopened.load_mission_state("RAN_001")["terminal_history"] == ["$ scan"]
+    finally:
+        writer.close()
@@ -0,0 +1,19 @@
+import json
+from src.save_index import SaveIndex
+
+def test_rebuild_then_track_slots_and_backups(tmp_path):
+    (tmp_path / "spectres_save.json").write_text(json.dumps({"faction": "Spectres", "level": 3}))
+    index = SaveIndex(str(tmp_path))
+    assert index.latest == "spectres"
+    assert index.entries["spectres"]["level"] == 3
+
+    index.update_slot("forgeurs", {"faction": "Forgeurs", "level": 1, "last_save": "2026"}, 10, "abc")
+    removed = []
+    for i in range(7):
+        removed += index.add_backup(f"forgeurs_{i}.json", keep=5)
+    assert removed == ["forgeurs_0.json", "forgeurs_1.json"]
+
+    reloaded = SaveIndex(str(tmp_path))
+    assert reloaded.latest == "forgeurs"
+    assert reloaded.backups == [f"forgeurs_{i}.json" for i in range(2, 7)]
+    assert [slot["slot"] for slot in reloaded.slots()] == ["forgeurs", "spectres"]
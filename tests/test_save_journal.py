@@ -0,0 +1,37 @@
+from src.save_journal import SaveJournal, apply_record
+
+def test_apply_record_operations():
+    data = {"credits": 100, "stats": {"total_earnings": 0}, "tools": []}
+    apply_record(data, {"seq": 1, "op": "add", "path": ["credits"], "value": -40})
+    apply_record(data, {"seq": 2, "op": "add", "path": ["stats", "total_earnings"], "value": 5})
+    apply_record(data, {"seq": 3, "op": "append", "path": ["tools"], "value": "nmap"})
+    apply_record(data, {"seq": 4, "op": "set", "path": ["hardware", "cpu"], "value": {"level": 2}})
+    assert data == {"credits": 60, "stats": {"total_earnings": 5}, "tools": ["nmap"],
+                    "hardware": {"cpu": {"level": 2}}}
+
+def test_replay_after_rotation_and_discard(tmp_path):
+    path = str(tmp_path / "spectres_save.journal")
+    journal = SaveJournal(path)
+    journal.append("add", ["credits"], 1)
+    journal.append("add", ["credits"], 2)
+    seq = journal.rotate()
+    journal.append("add", ["credits"], 4)
+    # Instantané pas encore écrit : le segment est toujours rejoué
+    assert [r["value"] for r in SaveJournal(path).read()] == [1, 2, 4]
+    journal.discard(seq)
+    journal.close()
+    reopened = SaveJournal(path, start_seq=seq)
+    assert [r["value"] for r in reopened.read(seq)] == [4]
+    assert reopened.seq == 3
+
+def test_truncated_record_is_dropped(tmp_path):
+    path = tmp_path / "spectres_save.journal"
+    journal = SaveJournal(str(path))
+    journal.append("add", ["credits"], 1)
+    journal.close()
+    with open(path, "a") as f:
+        f.write('{"seq": 2, "op": "ad')
+    journal = SaveJournal(str(path))
+    journal.append("add", ["credits"], 3)
+    journal.close()
+    assert [(r["seq"], r["value"]) for r in SaveJournal(str(path)).read()] == [(1, 1), (2, 3)]
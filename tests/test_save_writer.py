@@ -0,0 +1,30 @@
+import json
+import threading
+from src.save_writer import SaveWriter, write_json_atomic
+
+def test_pending_snapshots_are_coalesced_per_file():
+    started, release = threading.Event(), threading.Event()
+    written = []
+
+    def slow_write(path, snapshot):
+        started.set()
+        release.wait(1)
+        written.append((path, snapshot))
+
+    writer = SaveWriter(write=slow_write)
+    writer.submit("a.json", 1)
+    assert started.wait(1)  # Premier instantané bloqué dans slow_write
+    for value in range(2, 6):
+        writer.submit("a.json", value)
+    writer.submit("b.json", "b")
+    release.set()
+    assert writer.flush(timeout=2)
+    assert written == [("a.json", 1), ("a.json", 5), ("b.json", "b")]
+    writer.close(timeout=2)
+
+def test_atomic_write_replaces_file(tmp_path):
+    path = tmp_path / "spectres_save.json"
+    write_json_atomic(str(path), {"level": 1})
+    write_json_atomic(str(path), {"level": 2})
+    assert json.loads(path.read_text()) == {"level": 2}
+    assert [p.name for p in tmp_path.iterdir()] == ["spectres_save.json"]
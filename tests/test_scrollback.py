@@ -0,0 +1,25 @@
+import pytest
+from src.scrollback import ScrollbackBuffer
+
+def test_oldest_lines_are_evicted():
+    buffer = ScrollbackBuffer(3, ["a", "b"])
+    buffer.extend(["c", "d", "e"])
+    assert len(buffer) == 3
+    assert list(buffer) == ["c", "d", "e"]
+    assert buffer.total_appended == 5
+
+def test_window_and_slicing():
+    buffer = ScrollbackBuffer(4, ["l1", "l2", "l3", "l4", "l5"])
+    assert buffer.window(1, 2) == ["l3", "l4"]
+    assert buffer.window(2, 10) == ["l4", "l5"]
+    assert buffer[0:2] == ["l2", "l3"]
+    assert buffer[-1] == "l5"
+    with pytest.raises(IndexError):
+        buffer[4]
+
+def test_clear():
+    buffer = ScrollbackBuffer(2, ["a", "b", "c"])
+    buffer.clear()
+    assert len(buffer) == 0
+    buffer.append("x")
+    assert list(buffer) == ["x"]
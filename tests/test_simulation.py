@@ -0,0 +1,43 @@
+import pytest
+from src.config import MAX_SIMULATION_STEPS
+
+@pytest.fixture
+def jeu(new_jeu):
+    return new_jeu("infiltration_1")
+
+def test_fixed_steps_carry_the_remainder_over(jeu):
+    fired = []
+    jeu.scheduler.schedule_in(0.2, lambda: fired.append("early"))
+    jeu.scheduler.schedule_in(0.4, lambda: fired.append("late"))
+
+    jeu.clock.advance(0.05)
+    assert jeu.advance_simulation() == 0  # Moins d'un pas : rien ne s'exécute
+    jeu.clock.advance(0.3)
+    assert jeu.advance_simulation() == 3
+    assert fired == ["early"]
+
+    jeu.clock.advance(0.06)  # Insuffisant seul, suffisant avec le reliquat (0.05)
+    assert jeu.advance_simulation() == 1
+    assert fired == ["early", "late"]
+
+def test_catch_up_is_capped_and_due_events_fire_once(jeu):
+    fired = []
+    jeu.scheduler.schedule_every(1, lambda: fired.append(jeu.clock.now()))
+    jeu.alert_level = 50
+
+    jeu.clock.advance(31)  # Frame bloquée : 310 pas dus
+    assert jeu.advance_simulation() == MAX_SIMULATION_STEPS
+    assert jeu.simulation_accumulator == 0  # Le retard est abandonné, pas reporté
+    assert fired == [1031.0]  # La tâche récurrente est reprogrammée, pas rejouée 31 fois
+    assert jeu.alert_level < 50  # Décroissance de l'alerte (toutes les 30 s)
+
+    jeu.clock.advance(0.15)
+    assert jeu.advance_simulation() == 1  # Reprise normale au pas suivant
+
+def test_mission_timeout_stops_the_simulation(jeu):
+    jeu.clock.advance(jeu.mission_duration)
+    assert jeu.advance_simulation() == 1
+    assert not jeu.is_running
+    assert list(jeu.terminal.historique)[-1] == "Temps écoulé - Mission terminée"
+    jeu.clock.advance(1)
+    assert jeu.advance_simulation() == 0
@@ -13,4 +13,78 @@ def test_target_generator():
     target = generator.get_target_by_id("MEGA_001")
     assert target is not None
     assert target.name == "MegaCorp Industries - Serveur RH"
-    assert target.security_level == SecurityLevel.LOW 
\ No newline at end of file
+    assert target.security_level == SecurityLevel.LOW 
+
+
+def test_generated_targets_are_indexed():
+    generator = TargetGenerator()
+    targets = generator.get_targets_for_mission("BOT_001") + generator.get_secondary_targets_for_mission("BOT_001")
+    assert len({t.ip for t in targets}) == len(targets)
+    for target in targets:
+        assert generator.get_target_by_ip(target.ip) is target
+        assert generator.get_target_by_id(target.id) is target
+    assert generator.get_target_by_ip("0.0.0.0") is None
+
+def test_network_subnets_are_generated_lazily_and_deterministically():
+    generator = TargetGenerator()
+    network = generator.create_network("BOT_002", subnets=64, hosts_per_subnet=16, seed=42)
+    assert network.host_count == 1024
+    assert not generator.targets_by_ip  # Rien n'est généré avant le premier accès
+
+    host = generator.get_target_by_ip("10.0.3.5")
+    assert host.id == "NET_3_5"
+    assert len(generator.targets_by_ip) == 16  # Seul le sous-réseau consulté est généré
+    assert [t.ip for t in network.iter_hosts("10.0.3.0/29")] == [f"10.0.3.{i}" for i in range(1, 8)]
+
+    other = TargetGenerator().create_network("BOT_002", subnets=64, hosts_per_subnet=16, seed=42)
+    assert other.get_host("10.0.3.5").name == host.name
+
+def test_targets_share_read_only_catalogs_with_copy_on_write_overlay():
+    generator = TargetGenerator()
+    network = generator.create_network("BOT_002", subnets=1, hosts_per_subnet=32, seed=7)
+    first, second = [t for t in network.load_subnet(0) if t.type == TargetType.CORPORATE][:2]
+    assert first.files["passwords.txt"] is second.files["passwords.txt"]
+    assert not hasattr(first, "__dict__")
+
+    first.set_data_state("passwords.txt", exfiltrated=True)
+    assert first.files["passwords.txt"]["exfiltrated"] is True
+    assert "exfiltrated" not in second.files["passwords.txt"]
+    with pytest.raises(TypeError):
+        second.files["passwords.txt"]["value"] = 0
+
+def test_target_encodes_ports_and_vulnerabilities():
+    target = Target(id="T_1", name="Test", type=TargetType.BANK, security_level=SecurityLevel.HIGH,
+                    description="", ip="10.0.0.1", ports=[443, 22], vulnerabilities=["Memory Leak"],
+                    data_value=1000, security_systems={"firewall": True})
+    assert list(target.ports) == [443, 22]
+    assert target.vulnerabilities == ["Memory Leak"]
+    assert target.has_vulnerability("Memory Leak")
+    assert not target.has_vulnerability("SQL Injection")
+    assert target.get_total_data_value() == 19000
+
+def test_target_table_filters_columns():
+    generator = TargetGenerator()
+    network = generator.create_network("BOT_002", subnets=2, hosts_per_subnet=32, seed=3)
+    table = network.load_subnet(1)
+    high = list(table.select(security_level=SecurityLevel.HIGH))
+    assert high == [t for t in table if t.security_level == SecurityLevel.HIGH]
+    assert sum(table.count_by_security_level().values()) == len(table) == 32
+    in_range = list(network.iter_hosts("10.0.1.0/28", SecurityLevel.HIGH))
+    assert all(t.security_level == SecurityLevel.HIGH and t in high for t in in_range)
+
+def test_target_and_network_restore_without_regeneration():
+    generator = TargetGenerator()
+    network = generator.create_network("BOT_002", subnets=2, hosts_per_subnet=32, seed=11)
+    host = network.get_host("10.0.1.5")
+    network.pin(host)
+    host.set_data_state(next(iter(host.files)), exfiltrated=True)
+    host.security_systems["firewall"] = False
+
+    restored = TargetGenerator()
+    restored.restore_targets([host.to_dict()])
+    restored_network = restored.restore_network("BOT_002", network.to_dict())
+    copy = restored_network.get_host("10.0.1.5")
+    assert copy is restored.get_target_by_id(host.id)
+    assert copy.files == host.files and copy.security_systems == host.security_systems
+    assert list(copy.ports) == list(host.ports) and copy.vulnerabilities == host.vulnerabilities
+    assert restored_network.get_host("10.0.1.6").name == network.get_host("10.0.1.6").name